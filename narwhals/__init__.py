@@ -1,83 +1,87 @@
 from __future__ import annotations
 
-from narwhals import dependencies
-from narwhals import dtypes
-from narwhals import exceptions
-from narwhals import selectors
-from narwhals import stable
-from narwhals.dataframe import DataFrame
-from narwhals.dataframe import LazyFrame
-from narwhals.dtypes import Array
-from narwhals.dtypes import Boolean
-from narwhals.dtypes import Categorical
-from narwhals.dtypes import Date
-from narwhals.dtypes import Datetime
-from narwhals.dtypes import Decimal
-from narwhals.dtypes import Duration
-from narwhals.dtypes import Enum
-from narwhals.dtypes import Field
-from narwhals.dtypes import Float32
-from narwhals.dtypes import Float64
-from narwhals.dtypes import Int8
-from narwhals.dtypes import Int16
-from narwhals.dtypes import Int32
-from narwhals.dtypes import Int64
-from narwhals.dtypes import Int128
-from narwhals.dtypes import List
-from narwhals.dtypes import Object
-from narwhals.dtypes import String
-from narwhals.dtypes import Struct
-from narwhals.dtypes import UInt8
-from narwhals.dtypes import UInt16
-from narwhals.dtypes import UInt32
-from narwhals.dtypes import UInt64
-from narwhals.dtypes import UInt128
-from narwhals.dtypes import Unknown
-from narwhals.expr import Expr
-from narwhals.functions import all_ as all
-from narwhals.functions import all_horizontal
-from narwhals.functions import any_horizontal
-from narwhals.functions import col
-from narwhals.functions import concat
-from narwhals.functions import concat_str
-from narwhals.functions import from_arrow
-from narwhals.functions import from_dict
-from narwhals.functions import from_numpy
-from narwhals.functions import get_level
-from narwhals.functions import len_ as len
-from narwhals.functions import lit
-from narwhals.functions import max
-from narwhals.functions import max_horizontal
-from narwhals.functions import mean
-from narwhals.functions import mean_horizontal
-from narwhals.functions import median
-from narwhals.functions import min
-from narwhals.functions import min_horizontal
-from narwhals.functions import new_series
-from narwhals.functions import nth
-from narwhals.functions import read_csv
-from narwhals.functions import read_parquet
-from narwhals.functions import scan_csv
-from narwhals.functions import scan_parquet
-from narwhals.functions import show_versions
-from narwhals.functions import sum
-from narwhals.functions import sum_horizontal
-from narwhals.functions import when
-from narwhals.schema import Schema
-from narwhals.series import Series
-from narwhals.translate import from_native
-from narwhals.translate import get_native_namespace
-from narwhals.translate import narwhalify
-from narwhals.translate import to_native
-from narwhals.translate import to_py_scalar
-from narwhals.utils import Implementation
-from narwhals.utils import generate_temporary_column_name
-from narwhals.utils import is_ordered_categorical
-from narwhals.utils import maybe_align_index
-from narwhals.utils import maybe_convert_dtypes
-from narwhals.utils import maybe_get_index
-from narwhals.utils import maybe_reset_index
-from narwhals.utils import maybe_set_index
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from narwhals import dependencies
+    from narwhals import dtypes
+    from narwhals import exceptions
+    from narwhals import selectors
+    from narwhals import stable
+    from narwhals.dataframe import DataFrame
+    from narwhals.dataframe import LazyFrame
+    from narwhals.dtypes import Array
+    from narwhals.dtypes import Boolean
+    from narwhals.dtypes import Categorical
+    from narwhals.dtypes import Date
+    from narwhals.dtypes import Datetime
+    from narwhals.dtypes import Decimal
+    from narwhals.dtypes import Duration
+    from narwhals.dtypes import Enum
+    from narwhals.dtypes import Field
+    from narwhals.dtypes import Float32
+    from narwhals.dtypes import Float64
+    from narwhals.dtypes import Int8
+    from narwhals.dtypes import Int16
+    from narwhals.dtypes import Int32
+    from narwhals.dtypes import Int64
+    from narwhals.dtypes import Int128
+    from narwhals.dtypes import List
+    from narwhals.dtypes import Object
+    from narwhals.dtypes import String
+    from narwhals.dtypes import Struct
+    from narwhals.dtypes import UInt8
+    from narwhals.dtypes import UInt16
+    from narwhals.dtypes import UInt32
+    from narwhals.dtypes import UInt64
+    from narwhals.dtypes import UInt128
+    from narwhals.dtypes import Unknown
+    from narwhals.expr import Expr
+    from narwhals.functions import all_ as all
+    from narwhals.functions import all_horizontal
+    from narwhals.functions import any_horizontal
+    from narwhals.functions import col
+    from narwhals.functions import concat
+    from narwhals.functions import concat_str
+    from narwhals.functions import from_arrow
+    from narwhals.functions import from_dict
+    from narwhals.functions import from_numpy
+    from narwhals.functions import get_level
+    from narwhals.functions import len_ as len
+    from narwhals.functions import lit
+    from narwhals.functions import max
+    from narwhals.functions import max_horizontal
+    from narwhals.functions import mean
+    from narwhals.functions import mean_horizontal
+    from narwhals.functions import median
+    from narwhals.functions import min
+    from narwhals.functions import min_horizontal
+    from narwhals.functions import new_series
+    from narwhals.functions import nth
+    from narwhals.functions import read_csv
+    from narwhals.functions import read_parquet
+    from narwhals.functions import scan_csv
+    from narwhals.functions import scan_parquet
+    from narwhals.functions import show_versions
+    from narwhals.functions import sum
+    from narwhals.functions import sum_horizontal
+    from narwhals.functions import when
+    from narwhals.schema import Schema
+    from narwhals.series import Series
+    from narwhals.translate import from_native
+    from narwhals.translate import get_native_namespace
+    from narwhals.translate import narwhalify
+    from narwhals.translate import to_native
+    from narwhals.translate import to_py_scalar
+    from narwhals.utils import Implementation
+    from narwhals.utils import generate_temporary_column_name
+    from narwhals.utils import is_ordered_categorical
+    from narwhals.utils import maybe_align_index
+    from narwhals.utils import maybe_convert_dtypes
+    from narwhals.utils import maybe_get_index
+    from narwhals.utils import maybe_reset_index
+    from narwhals.utils import maybe_set_index
 
 __version__ = "1.22.0"
 
@@ -161,3 +165,103 @@ __all__ = [
     "to_py_scalar",
     "when",
 ]
+
+# Submodules and attributes which are only imported on first access (see PEP 562),
+# so that `import narwhals` itself is cheap.
+_LAZY_SUBMODULES = {"dependencies", "dtypes", "exceptions", "selectors", "stable"}
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "DataFrame": ("narwhals.dataframe", "DataFrame"),
+    "LazyFrame": ("narwhals.dataframe", "LazyFrame"),
+    "Array": ("narwhals.dtypes", "Array"),
+    "Boolean": ("narwhals.dtypes", "Boolean"),
+    "Categorical": ("narwhals.dtypes", "Categorical"),
+    "Date": ("narwhals.dtypes", "Date"),
+    "Datetime": ("narwhals.dtypes", "Datetime"),
+    "Decimal": ("narwhals.dtypes", "Decimal"),
+    "Duration": ("narwhals.dtypes", "Duration"),
+    "Enum": ("narwhals.dtypes", "Enum"),
+    "Field": ("narwhals.dtypes", "Field"),
+    "Float32": ("narwhals.dtypes", "Float32"),
+    "Float64": ("narwhals.dtypes", "Float64"),
+    "Int8": ("narwhals.dtypes", "Int8"),
+    "Int16": ("narwhals.dtypes", "Int16"),
+    "Int32": ("narwhals.dtypes", "Int32"),
+    "Int64": ("narwhals.dtypes", "Int64"),
+    "Int128": ("narwhals.dtypes", "Int128"),
+    "List": ("narwhals.dtypes", "List"),
+    "Object": ("narwhals.dtypes", "Object"),
+    "String": ("narwhals.dtypes", "String"),
+    "Struct": ("narwhals.dtypes", "Struct"),
+    "UInt8": ("narwhals.dtypes", "UInt8"),
+    "UInt16": ("narwhals.dtypes", "UInt16"),
+    "UInt32": ("narwhals.dtypes", "UInt32"),
+    "UInt64": ("narwhals.dtypes", "UInt64"),
+    "UInt128": ("narwhals.dtypes", "UInt128"),
+    "Unknown": ("narwhals.dtypes", "Unknown"),
+    "Expr": ("narwhals.expr", "Expr"),
+    "all": ("narwhals.functions", "all_"),
+    "all_horizontal": ("narwhals.functions", "all_horizontal"),
+    "any_horizontal": ("narwhals.functions", "any_horizontal"),
+    "col": ("narwhals.functions", "col"),
+    "concat": ("narwhals.functions", "concat"),
+    "concat_str": ("narwhals.functions", "concat_str"),
+    "from_arrow": ("narwhals.functions", "from_arrow"),
+    "from_dict": ("narwhals.functions", "from_dict"),
+    "from_numpy": ("narwhals.functions", "from_numpy"),
+    "get_level": ("narwhals.functions", "get_level"),
+    "len": ("narwhals.functions", "len_"),
+    "lit": ("narwhals.functions", "lit"),
+    "max": ("narwhals.functions", "max"),
+    "max_horizontal": ("narwhals.functions", "max_horizontal"),
+    "mean": ("narwhals.functions", "mean"),
+    "mean_horizontal": ("narwhals.functions", "mean_horizontal"),
+    "median": ("narwhals.functions", "median"),
+    "min": ("narwhals.functions", "min"),
+    "min_horizontal": ("narwhals.functions", "min_horizontal"),
+    "new_series": ("narwhals.functions", "new_series"),
+    "nth": ("narwhals.functions", "nth"),
+    "read_csv": ("narwhals.functions", "read_csv"),
+    "read_parquet": ("narwhals.functions", "read_parquet"),
+    "scan_csv": ("narwhals.functions", "scan_csv"),
+    "scan_parquet": ("narwhals.functions", "scan_parquet"),
+    "show_versions": ("narwhals.functions", "show_versions"),
+    "sum": ("narwhals.functions", "sum"),
+    "sum_horizontal": ("narwhals.functions", "sum_horizontal"),
+    "when": ("narwhals.functions", "when"),
+    "Schema": ("narwhals.schema", "Schema"),
+    "Series": ("narwhals.series", "Series"),
+    "from_native": ("narwhals.translate", "from_native"),
+    "get_native_namespace": ("narwhals.translate", "get_native_namespace"),
+    "narwhalify": ("narwhals.translate", "narwhalify"),
+    "to_native": ("narwhals.translate", "to_native"),
+    "to_py_scalar": ("narwhals.translate", "to_py_scalar"),
+    "Implementation": ("narwhals.utils", "Implementation"),
+    "generate_temporary_column_name": (
+        "narwhals.utils",
+        "generate_temporary_column_name",
+    ),
+    "is_ordered_categorical": ("narwhals.utils", "is_ordered_categorical"),
+    "maybe_align_index": ("narwhals.utils", "maybe_align_index"),
+    "maybe_convert_dtypes": ("narwhals.utils", "maybe_convert_dtypes"),
+    "maybe_get_index": ("narwhals.utils", "maybe_get_index"),
+    "maybe_reset_index": ("narwhals.utils", "maybe_reset_index"),
+    "maybe_set_index": ("narwhals.utils", "maybe_set_index"),
+}
+
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        from importlib import import_module
+
+        if name in _LAZY_SUBMODULES:
+            return import_module(f"narwhals.{name}")
+        if name not in _LAZY_ATTRIBUTES:
+            msg = f"module 'narwhals' has no attribute {name!r}"
+            raise AttributeError(msg)
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*globals(), *__all__})
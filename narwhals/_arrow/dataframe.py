@@ -9,8 +9,11 @@ from typing import Literal
 from typing import Sequence
 from typing import overload
 
+from narwhals._arrow.utils import asof_join_indices
 from narwhals._arrow.utils import broadcast_series
 from narwhals._arrow.utils import convert_str_slice_to_int_slice
+from narwhals._arrow.utils import dense_group_ids
+from narwhals._arrow.utils import first_occurrences
 from narwhals._arrow.utils import native_to_narwhals_dtype
 from narwhals._arrow.utils import select_rows
 from narwhals._arrow.utils import validate_dataframe_comparand
@@ -19,7 +22,6 @@ from narwhals.dependencies import is_numpy_array
 from narwhals.utils import Implementation
 from narwhals.utils import check_column_exists
 from narwhals.utils import flatten
-from narwhals.utils import generate_temporary_column_name
 from narwhals.utils import is_sequence_but_not_str
 from narwhals.utils import parse_columns_to_drop
 from narwhals.utils import scale_bytes
@@ -38,6 +40,7 @@ if TYPE_CHECKING:
     from narwhals._arrow.namespace import ArrowNamespace
     from narwhals._arrow.series import ArrowSeries
     from narwhals._arrow.typing import IntoArrowExpr
+    from narwhals._lazy_plan import LazyPlanFrame
     from narwhals.dtypes import DType
     from narwhals.typing import SizeUnit
     from narwhals.utils import Version
@@ -347,21 +350,23 @@ class ArrowDataFrame(CompliantDataFrame, CompliantLazyFrame):
         }
 
         if how == "cross":
-            plx = self.__narwhals_namespace__()
-            key_token = generate_temporary_column_name(
-                n_bytes=8, columns=[*self.columns, *other.columns]
-            )
-
+            import numpy as np  # ignore-banned-import
+            import pyarrow as pa  # ignore-banned-import
+
+            # Build the cartesian product directly from row indices: each left row
+            # is repeated once per right row, and the right table is tiled.
+            n_left, n_right = len(self), len(other)
+            left = self._native_frame.take(np.repeat(np.arange(n_left), n_right))
+            right = other._native_frame.take(np.tile(np.arange(n_right), n_left))
+            right_names = [
+                f"{name}{suffix}" if name in left.column_names else name
+                for name in right.column_names
+            ]
             return self._from_native_frame(
-                self.with_columns(**{key_token: plx.lit(0, None)})
-                ._native_frame.join(
-                    other.with_columns(**{key_token: plx.lit(0, None)})._native_frame,
-                    keys=key_token,
-                    right_keys=key_token,
-                    join_type="inner",
-                    right_suffix=suffix,
+                pa.Table.from_arrays(
+                    [*left.columns, *right.columns],
+                    names=[*left.column_names, *right_names],
                 )
-                .drop([key_token]),
             )
 
         return self._from_native_frame(
@@ -386,8 +391,60 @@ class ArrowDataFrame(CompliantDataFrame, CompliantLazyFrame):
         by: str | list[str] | None,
         strategy: Literal["backward", "forward", "nearest"],
     ) -> Self:
-        msg = "join_asof is not yet supported on PyArrow tables"  # pragma: no cover
-        raise NotImplementedError(msg)
+        import numpy as np  # ignore-banned-import
+        import pyarrow as pa
+
+        if on is not None:
+            left_on = right_on = on
+        # help mypy
+        assert left_on is not None  # noqa: S101
+        assert right_on is not None  # noqa: S101
+        if by is not None:
+            by_left = by_right = by
+        by_left = [by_left] if isinstance(by_left, str) else list(by_left or [])
+        by_right = [by_right] if isinstance(by_right, str) else list(by_right or [])
+        left, right = self._native_frame, other._native_frame
+
+        if by_left:
+            # Assign group ids to both tables at once, so that they're consistent.
+            left_keys = left.select(by_left)
+            right_keys = (
+                right.select(by_right).rename_columns(by_left).cast(left_keys.schema)
+            )
+            group_ids = dense_group_ids(
+                pa.concat_tables([left_keys, right_keys]), by_left
+            )
+            left_group_ids = group_ids[: len(left)]
+            right_group_ids = group_ids[len(left) :]
+        else:
+            left_group_ids = np.zeros(len(left), dtype=np.int64)
+            right_group_ids = np.zeros(len(right), dtype=np.int64)
+        indices = asof_join_indices(
+            left[left_on],
+            right[right_on],
+            left_group_ids,
+            right_group_ids,
+            strategy=strategy,
+        )
+
+        right_names = [
+            name
+            for name in right.column_names
+            if name not in by_right and not (name == right_on == left_on)
+        ]
+        matched = right.select(right_names).take(indices)
+        return self._from_native_frame(
+            pa.Table.from_arrays(
+                [*left.columns, *matched.columns],
+                names=[
+                    *left.column_names,
+                    *(
+                        f"{name}_right" if name in left.column_names else name
+                        for name in right_names
+                    ),
+                ],
+            )
+        )
 
     def drop(self: Self, columns: list[str], strict: bool) -> Self:  # noqa: FBT001
         to_drop = parse_columns_to_drop(
@@ -521,8 +578,10 @@ class ArrowDataFrame(CompliantDataFrame, CompliantLazyFrame):
         else:
             return self._from_native_frame(df.slice(abs(n)))
 
-    def lazy(self: Self) -> Self:
-        return self
+    def lazy(self: Self) -> LazyPlanFrame:
+        from narwhals._lazy_plan import LazyPlanFrame
+
+        return LazyPlanFrame.from_compliant_frame(self)
 
     def collect(self: Self) -> ArrowDataFrame:
         return ArrowDataFrame(
@@ -584,51 +643,30 @@ class ArrowDataFrame(CompliantDataFrame, CompliantLazyFrame):
         return pa_csv.write_csv(pa_table, file)
 
     def is_duplicated(self: Self) -> ArrowSeries:
+        import numpy as np  # ignore-banned-import
         import pyarrow as pa
-        import pyarrow.compute as pc
 
         from narwhals._arrow.series import ArrowSeries
 
-        columns = self.columns
-        index_token = generate_temporary_column_name(n_bytes=8, columns=columns)
-        col_token = generate_temporary_column_name(
-            n_bytes=8, columns=[*columns, index_token]
-        )
-        df = self.with_row_index(index_token)._native_frame
-        row_count = (
-            df.append_column(col_token, pa.repeat(pa.scalar(1), len(self)))
-            .group_by(columns)
-            .aggregate([(col_token, "sum")])
-        )
-        is_duplicated = pc.greater(
-            df.join(
-                row_count,
-                keys=columns,
-                right_keys=columns,
-                join_type="left outer",
-                use_threads=False,
-            )
-            .sort_by(index_token)
-            .column(f"{col_token}_sum"),
-            1,
-        )
-        res = ArrowSeries(
-            is_duplicated,
+        group_ids = dense_group_ids(self._native_frame, self.columns)
+        is_duplicated = np.bincount(group_ids)[group_ids] > 1
+        return ArrowSeries(
+            pa.chunked_array([is_duplicated], type=pa.bool_()),
             name="",
             backend_version=self._backend_version,
             version=self._version,
         )
-        return res.fill_null(res.null_count() > 1, strategy=None, limit=None)
 
     def is_unique(self: Self) -> ArrowSeries:
-        import pyarrow.compute as pc
+        import numpy as np  # ignore-banned-import
+        import pyarrow as pa
 
         from narwhals._arrow.series import ArrowSeries
 
-        is_duplicated = self.is_duplicated()._native_series
-
+        group_ids = dense_group_ids(self._native_frame, self.columns)
+        is_unique = np.bincount(group_ids)[group_ids] == 1
         return ArrowSeries(
-            pc.invert(is_duplicated),
+            pa.chunked_array([is_unique], type=pa.bool_()),
             name="",
             backend_version=self._backend_version,
             version=self._version,
@@ -644,29 +682,19 @@ class ArrowDataFrame(CompliantDataFrame, CompliantLazyFrame):
         # The param `maintain_order` is only here for compatibility with the Polars API
         # and has no effect on the output.
         import numpy as np  # ignore-banned-import
-        import pyarrow as pa
-        import pyarrow.compute as pc
 
         df = self._native_frame
         check_column_exists(self.columns, subset)
         subset = subset or self.columns
 
-        if keep in {"any", "first", "last"}:
-            agg_func_map = {"any": "min", "first": "min", "last": "max"}
-
-            agg_func = agg_func_map[keep]
-            col_token = generate_temporary_column_name(n_bytes=8, columns=self.columns)
-            keep_idx = (
-                df.append_column(col_token, pa.array(np.arange(len(self))))
-                .group_by(subset)
-                .aggregate([(col_token, agg_func)])
-                .column(f"{col_token}_{agg_func}")
-            )
-
-            return self._from_native_frame(pc.take(df, keep_idx))
-
-        keep_idx = self.select(*subset).is_unique()
-        return self.filter(keep_idx)
+        if keep in {"any", "first"}:
+            mask = first_occurrences(dense_group_ids(df, subset))
+        elif keep == "last":
+            mask = first_occurrences(dense_group_ids(df[::-1], subset))[::-1]
+        else:
+            group_ids = dense_group_ids(df, subset)
+            mask = np.bincount(group_ids)[group_ids] == 1
+        return self._from_native_frame(df.filter(mask))
 
     def gather_every(self: Self, n: int, offset: int = 0) -> Self:
         return self._from_native_frame(self._native_frame[offset::n])
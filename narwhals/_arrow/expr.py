@@ -12,7 +12,10 @@ from narwhals._arrow.expr_list import ArrowExprListNamespace
 from narwhals._arrow.expr_name import ArrowExprNameNamespace
 from narwhals._arrow.expr_str import ArrowExprStringNamespace
 from narwhals._arrow.series import ArrowSeries
+from narwhals._expression_parsing import evaluate_with_cse
+from narwhals._expression_parsing import make_cse_key
 from narwhals._expression_parsing import reuse_series_implementation
+from narwhals._expression_parsing import with_cse_key
 from narwhals.dependencies import get_numpy
 from narwhals.dependencies import is_numpy_array
 from narwhals.exceptions import ColumnNotFoundError
@@ -25,12 +28,19 @@ if TYPE_CHECKING:
     from narwhals._arrow.dataframe import ArrowDataFrame
     from narwhals._arrow.namespace import ArrowNamespace
     from narwhals._arrow.typing import IntoArrowExpr
+    from narwhals._expression_parsing import CSEKey
     from narwhals.dtypes import DType
     from narwhals.utils import Version
 
 
 class ArrowExpr(CompliantExpr[ArrowSeries]):
     _implementation: Implementation = Implementation.PYARROW
+    # Structural key used to share identical sub-expressions, see
+    # `evaluate_into_exprs`. `None` means the expression is never shared.
+    _cse_key: CSEKey | None = None
+    # The expression which this one was derived from by calling a Series method on
+    # it, if any. Used to split aggregations into elementwise parts and reductions.
+    _input_expr: Self | None = None
 
     def __init__(
         self: Self,
@@ -65,7 +75,7 @@ class ArrowExpr(CompliantExpr[ArrowSeries]):
         )
 
     def __call__(self, df: ArrowDataFrame) -> Sequence[ArrowSeries]:
-        return self._call(df)
+        return evaluate_with_cse(self, df)
 
     @classmethod
     def from_column_names(
@@ -93,15 +103,18 @@ class ArrowExpr(CompliantExpr[ArrowSeries]):
                     missing_columns=missing_columns, available_columns=df.columns
                 ) from e
 
-        return cls(
-            func,
-            depth=0,
-            function_name="col",
-            root_names=list(column_names),
-            output_names=list(column_names),
-            backend_version=backend_version,
-            version=version,
-            kwargs={},
+        return with_cse_key(
+            cls(
+                func,
+                depth=0,
+                function_name="col",
+                root_names=list(column_names),
+                output_names=list(column_names),
+                backend_version=backend_version,
+                version=version,
+                kwargs={},
+            ),
+            make_cse_key("col", names=column_names),
         )
 
     @classmethod
@@ -124,15 +137,18 @@ class ArrowExpr(CompliantExpr[ArrowSeries]):
                 for column_index in column_indices
             ]
 
-        return cls(
-            func,
-            depth=0,
-            function_name="nth",
-            root_names=None,
-            output_names=None,
-            backend_version=backend_version,
-            version=version,
-            kwargs={},
+        return with_cse_key(
+            cls(
+                func,
+                depth=0,
+                function_name="nth",
+                root_names=None,
+                output_names=None,
+                backend_version=backend_version,
+                version=version,
+                kwargs={},
+            ),
+            make_cse_key("nth", indices=column_indices),
         )
 
     def __narwhals_namespace__(self: Self) -> ArrowNamespace:
@@ -266,8 +282,8 @@ class ArrowExpr(CompliantExpr[ArrowSeries]):
     def alias(self: Self, name: str) -> Self:
         # Define this one manually, so that we can
         # override `output_names` and not increase depth
-        return self.__class__(
-            lambda df: [series.alias(name) for series in self._call(df)],
+        result = self.__class__(
+            lambda df: [series.alias(name) for series in self(df)],
             depth=self._depth,
             function_name=self._function_name,
             root_names=self._root_names,
@@ -276,6 +292,8 @@ class ArrowExpr(CompliantExpr[ArrowSeries]):
             version=self._version,
             kwargs={**self._kwargs, "name": name},
         )
+        result._input_expr = self
+        return with_cse_key(result, make_cse_key("alias", self, name=name))
 
     def null_count(self: Self) -> Self:
         return reuse_series_implementation(self, "null_count", returns_scalar=True)
@@ -534,6 +552,70 @@ class ArrowExpr(CompliantExpr[ArrowSeries]):
             ddof=ddof,
         )
 
+    def rolling_min(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_min",
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
+    def rolling_max(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_max",
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
+    def rolling_median(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_median",
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
+    def rolling_quantile(
+        self: Self,
+        quantile: float,
+        interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_quantile",
+            quantile=quantile,
+            interpolation=interpolation,
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
     def rank(
         self: Self,
         method: Literal["average", "min", "max", "dense", "ordinal"],
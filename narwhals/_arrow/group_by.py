@@ -7,9 +7,11 @@ from typing import Callable
 from typing import Iterator
 from typing import Sequence
 
+from narwhals._arrow.utils import dense_group_ids
+from narwhals._arrow.utils import first_occurrences
 from narwhals._expression_parsing import is_simple_aggregation
+from narwhals._expression_parsing import lower_complex_aggregations
 from narwhals._expression_parsing import parse_into_exprs
-from narwhals.utils import generate_temporary_column_name
 from narwhals.utils import remove_prefix
 
 if TYPE_CHECKING:
@@ -18,6 +20,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from narwhals._arrow.dataframe import ArrowDataFrame
+    from narwhals._arrow.expr import ArrowExpr
     from narwhals._arrow.series import ArrowSeries
     from narwhals._arrow.typing import IntoArrowExpr
     from narwhals.typing import CompliantExpr
@@ -68,6 +71,13 @@ class ArrowGroupBy:
                 )
                 raise ValueError(msg)
 
+        if not all(_is_simple_aggregation(expr) for expr in exprs) and (
+            lowered := self._lower_complex_aggregations(exprs)  # type: ignore[arg-type]
+        ):
+            df, simple_exprs = lowered
+            # Null keys, if requested, were already dropped from `self._df`.
+            return ArrowGroupBy(df, self._keys, drop_null_keys=False).agg(*simple_exprs)
+
         return agg_arrow(
             self._grouped,
             exprs,
@@ -76,38 +86,73 @@ class ArrowGroupBy:
             backend_version=self._df._backend_version,
         )
 
-    def __iter__(self: Self) -> Iterator[tuple[Any, ArrowDataFrame]]:
-        import pyarrow as pa
-        import pyarrow.compute as pc
+    def _lower_complex_aggregations(
+        self: Self, exprs: Sequence[ArrowExpr]
+    ) -> tuple[ArrowDataFrame, list[ArrowExpr]] | None:
+        """Rewrite complex aggregations as simple ones over temporary columns.
 
-        col_token = generate_temporary_column_name(n_bytes=8, columns=self._df.columns)
-        null_token = "__null_token_value__"  # noqa: S105
+        See `lower_complex_aggregations`. Filtered-out rows are set to null.
+        """
+        lowered = lower_complex_aggregations(
+            exprs,
+            self._df,
+            keys=self._keys,
+            aggregations=POLARS_TO_ARROW_AGGREGATIONS,
+            mask_columns=_mask_columns,
+        )
+        if lowered is None:
+            return None
+        needed_columns, new_columns, simple_exprs = lowered
+        table = self._df._native_frame.select(needed_columns)
+        for name, column in new_columns.items():
+            table = table.append_column(name, column)
+        return self._df._from_native_frame(table), simple_exprs
+
+    def __iter__(self: Self) -> Iterator[tuple[Any, ArrowDataFrame]]:
+        import numpy as np  # ignore-banned-import
 
         table = self._df._native_frame
-        key_values = pc.binary_join_element_wise(
-            *[pc.cast(table[key], pa.string()) for key in self._keys],
-            "",
-            null_handling="replace",
-            null_replacement=null_token,
+        group_ids = dense_group_ids(table, self._keys)
+        unique_keys = table.select(self._keys).take(
+            np.flatnonzero(first_occurrences(group_ids))
         )
-        table = table.add_column(i=0, field_=col_token, column=key_values)
-
-        yield from (
-            (
-                next(
-                    (
-                        t := self._df._from_native_frame(
-                            table.filter(pc.equal(table[col_token], v)).drop([col_token])
-                        )
-                    )
-                    .select(*self._keys)
-                    .head(1)
-                    .iter_rows(named=False, buffer_size=512)
-                ),
-                t,
+        # Partition the table once: order the rows by group, preserving their
+        # original order within each group, and yield each group as a slice.
+        table = table.take(np.argsort(group_ids, kind="stable"))
+        lengths = np.bincount(group_ids, minlength=len(unique_keys))
+        offsets = np.cumsum(lengths) - lengths
+        key_values = zip(*(column.to_pylist() for column in unique_keys.columns))
+        for key, offset, length in zip(key_values, offsets, lengths):
+            yield key, self._df._from_native_frame(table.slice(offset, length))
+
+
+def _is_simple_aggregation(expr: CompliantExpr[Any]) -> bool:
+    return (
+        is_simple_aggregation(expr)
+        and remove_prefix(expr._function_name, "col->") in POLARS_TO_ARROW_AGGREGATIONS
+    )
+
+
+def _mask_columns(
+    function_name: str,
+    columns: list[pa.ChunkedArray[Any]],
+    predicate: pa.ChunkedArray[Any],
+) -> list[pa.ChunkedArray[Any]]:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    mask = pc.fill_null(predicate, pa.scalar(value=False))
+    masked = []
+    for column in columns:
+        if function_name == "sum":
+            # Filtering out all values of a group gives a sum of zero, not null.
+            fill_value = pa.scalar(
+                False if pa.types.is_boolean(column.type) else 0, type=column.type
             )
-            for v in pc.unique(key_values)
-        )
+        else:
+            fill_value = pa.scalar(None, type=column.type)
+        masked.append(pc.if_else(mask, column, fill_value))
+    return masked
 
 
 def agg_arrow(
@@ -119,26 +164,16 @@ def agg_arrow(
 ) -> ArrowDataFrame:
     import pyarrow.compute as pc
 
-    all_simple_aggs = True
-    for expr in exprs:
-        if not (
-            is_simple_aggregation(expr)
-            and remove_prefix(expr._function_name, "col->")
-            in POLARS_TO_ARROW_AGGREGATIONS
-        ):
-            all_simple_aggs = False
-            break
-
-    if not all_simple_aggs:
+    if not all(_is_simple_aggregation(expr) for expr in exprs):
         msg = (
             "Non-trivial complex aggregation found.\n\n"
             "Hint: you were probably trying to apply a non-elementary aggregation with a "
             "pyarrow table.\n"
             "Please rewrite your query such that group-by aggregations "
             "are elementary. For example, instead of:\n\n"
-            "    df.group_by('a').agg(nw.col('b').round(2).mean())\n\n"
+            "    df.group_by('a').agg(nw.col('b').mean().round(2))\n\n"
             "use:\n\n"
-            "    df.with_columns(nw.col('b').round(2)).group_by('a').agg(nw.col('b').mean())\n\n"
+            "    df.group_by('a').agg(nw.col('b').mean()).with_columns(nw.col('b').round(2))\n\n"
         )
         raise ValueError(msg)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from copy import copy
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -16,8 +17,10 @@ from narwhals._arrow.utils import diagonal_concat
 from narwhals._arrow.utils import horizontal_concat
 from narwhals._arrow.utils import vertical_concat
 from narwhals._expression_parsing import combine_root_names
+from narwhals._expression_parsing import make_cse_key
 from narwhals._expression_parsing import parse_into_exprs
 from narwhals._expression_parsing import reduce_output_names
+from narwhals._expression_parsing import with_cse_key
 from narwhals.typing import CompliantNamespace
 from narwhals.utils import Implementation
 from narwhals.utils import import_dtypes_module
@@ -143,23 +146,26 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
         from narwhals._arrow.expr import ArrowExpr
         from narwhals._arrow.series import ArrowSeries
 
-        return ArrowExpr(
-            lambda df: [
-                ArrowSeries(
-                    df._native_frame[column_name],
-                    name=column_name,
-                    backend_version=df._backend_version,
-                    version=df._version,
-                )
-                for column_name in df.columns
-            ],
-            depth=0,
-            function_name="all",
-            root_names=None,
-            output_names=None,
-            backend_version=self._backend_version,
-            version=self._version,
-            kwargs={},
+        return with_cse_key(
+            ArrowExpr(
+                lambda df: [
+                    ArrowSeries(
+                        df._native_frame[column_name],
+                        name=column_name,
+                        backend_version=df._backend_version,
+                        version=df._version,
+                    )
+                    for column_name in df.columns
+                ],
+                depth=0,
+                function_name="all",
+                root_names=None,
+                output_names=None,
+                backend_version=self._backend_version,
+                version=self._version,
+                kwargs={},
+            ),
+            make_cse_key("all"),
         )
 
     def lit(self: Self, value: Any, dtype: DType | None) -> ArrowExpr:
@@ -174,15 +180,18 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
                 return arrow_series.cast(dtype)
             return arrow_series
 
-        return ArrowExpr(
-            lambda df: [_lit_arrow_series(df)],
-            depth=0,
-            function_name="lit",
-            root_names=None,
-            output_names=["literal"],
-            backend_version=self._backend_version,
-            version=self._version,
-            kwargs={},
+        return with_cse_key(
+            ArrowExpr(
+                lambda df: [_lit_arrow_series(df)],
+                depth=0,
+                function_name="lit",
+                root_names=None,
+                output_names=["literal"],
+                backend_version=self._backend_version,
+                version=self._version,
+                kwargs={},
+            ),
+            make_cse_key("lit", value=value, dtype=dtype),
         )
 
     def all_horizontal(self: Self, *exprs: IntoArrowExpr) -> ArrowExpr:
@@ -192,13 +201,16 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
             series = (s for _expr in parsed_exprs for s in _expr(df))
             return [reduce(lambda x, y: x & y, series)]
 
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="all_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="all_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("all_horizontal", *parsed_exprs),
         )
 
     def any_horizontal(self: Self, *exprs: IntoArrowExpr) -> ArrowExpr:
@@ -208,13 +220,16 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
             series = (s for _expr in parsed_exprs for s in _expr(df))
             return [reduce(lambda x, y: x | y, series)]
 
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="any_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="any_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("any_horizontal", *parsed_exprs),
         )
 
     def sum_horizontal(self: Self, *exprs: IntoArrowExpr) -> ArrowExpr:
@@ -228,13 +243,16 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
             )
             return [reduce(lambda x, y: x + y, series)]
 
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="sum_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="sum_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("sum_horizontal", *parsed_exprs),
         )
 
     def mean_horizontal(self: Self, *exprs: IntoArrowExpr) -> IntoArrowExpr:
@@ -256,13 +274,16 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
                 reduce(lambda x, y: x + y, series) / reduce(lambda x, y: x + y, non_na)
             ]
 
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="mean_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="mean_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("mean_horizontal", *parsed_exprs),
         )
 
     def min_horizontal(self: Self, *exprs: IntoArrowExpr) -> ArrowExpr:
@@ -285,13 +306,16 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
                 )
             ]
 
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="min_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="min_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("min_horizontal", *parsed_exprs),
         )
 
     def max_horizontal(self: Self, *exprs: IntoArrowExpr) -> ArrowExpr:
@@ -314,13 +338,16 @@ class ArrowNamespace(CompliantNamespace[ArrowSeries]):
                 )
             ]
 
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="max_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="max_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("max_horizontal", *parsed_exprs),
         )
 
     def concat(
@@ -420,12 +447,16 @@ class ArrowWhen:
         otherwise_value: Any = None,
         *,
         version: Version,
+        branches: list[tuple[ArrowExpr, Any]] | None = None,
     ) -> None:
         self._backend_version = backend_version
         self._condition = condition
         self._then_value = then_value
         self._otherwise_value = otherwise_value
         self._version = version
+        # `(condition, then_value)` pairs of the preceding branches in a chained
+        # `when(...).then(...).when(...).then(...)`.
+        self._branches = branches or []
 
     def __call__(self: Self, df: ArrowDataFrame) -> Sequence[ArrowSeries]:
         import pyarrow as pa
@@ -433,53 +464,89 @@ class ArrowWhen:
 
         from narwhals._expression_parsing import parse_into_expr
 
+        if self._branches:
+            return self._call_chained(df)
+
         plx = df.__narwhals_namespace__()
         condition = parse_into_expr(self._condition, namespace=plx)(df)[0]
+        condition_native = condition._native_series
         try:
             value_series = parse_into_expr(self._then_value, namespace=plx)(df)[0]
         except TypeError:
-            # `self._otherwise_value` is a scalar and can't be converted to an expression
-            value_series = condition.__class__._from_iterable(
-                pa.repeat(pa.scalar(self._then_value), len(condition)),
-                name="literal",
-                backend_version=self._backend_version,
-                version=self._version,
-            )
-
-        value_series_native = value_series._native_series
-        condition_native = condition._native_series
+            # `self._then_value` is a scalar and can't be converted to an expression,
+            # so we let `pc.if_else` broadcast it.
+            value_native = pa.scalar(self._then_value)
+            name = "literal"
+        else:
+            value_native = value_series._native_series
+            name = value_series.name
 
         if self._otherwise_value is None:
-            otherwise_native = pa.repeat(
-                pa.scalar(None, type=value_series_native.type), len(condition_native)
-            )
-            return [
-                value_series._from_native_series(
-                    pc.if_else(condition_native, value_series_native, otherwise_native)
-                )
-            ]
-        try:
-            otherwise_expr = parse_into_expr(self._otherwise_value, namespace=plx)
-        except TypeError:
-            # `self._otherwise_value` is a scalar and can't be converted to an expression.
-            # Remark that string values _are_ converted into expressions!
-            return [
-                value_series._from_native_series(
-                    pc.if_else(
-                        condition_native, value_series_native, self._otherwise_value
-                    )
-                )
-            ]
+            otherwise_native = pa.scalar(None, type=value_native.type)
         else:
-            otherwise_series = otherwise_expr(df)[0]
-            condition_native, otherwise_native = broadcast_series(
-                [condition, otherwise_series]
-            )
-            return [
-                value_series._from_native_series(
-                    pc.if_else(condition_native, value_series_native, otherwise_native)
+            try:
+                otherwise_expr = parse_into_expr(self._otherwise_value, namespace=plx)
+            except TypeError:
+                # `self._otherwise_value` is a scalar and can't be converted to an
+                # expression. Remark that string values _are_ converted into
+                # expressions!
+                otherwise_native = self._otherwise_value
+            else:
+                otherwise_series = otherwise_expr(df)[0]
+                condition_native, otherwise_native = broadcast_series(
+                    [condition, otherwise_series]
                 )
-            ]
+        return [
+            condition._from_native_series(
+                pc.if_else(condition_native, value_native, otherwise_native)
+            ).alias(name)
+        ]
+
+    def _call_chained(self: Self, df: ArrowDataFrame) -> Sequence[ArrowSeries]:
+        # All branches are evaluated in a single `pc.case_when` call, which picks the
+        # first branch whose condition is true (null conditions count as false).
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        from narwhals._expression_parsing import parse_into_expr
+
+        plx = df.__narwhals_namespace__()
+        branches = [*self._branches, (self._condition, self._then_value)]
+        conditions = [parse_into_expr(c, namespace=plx)(df)[0] for c, _ in branches]
+
+        def evaluate(value: Any) -> ArrowSeries | pa.Scalar[Any]:
+            try:
+                return parse_into_expr(value, namespace=plx)(df)[0]
+            except TypeError:
+                # `value` is a scalar and can't be converted to an expression
+                return pa.scalar(value)  # type: ignore[no-any-return]
+
+        values = [evaluate(then_value) for _, then_value in branches]
+        if self._otherwise_value is not None:
+            values.append(evaluate(self._otherwise_value))
+        name = values[0].name if isinstance(values[0], ArrowSeries) else "literal"
+
+        natives = iter(
+            broadcast_series(
+                [*conditions, *(v for v in values if isinstance(v, ArrowSeries))]
+            )
+        )
+        condition_natives = [
+            native.combine_chunks() if isinstance(native, pa.ChunkedArray) else native
+            for native in (next(natives) for _ in conditions)
+        ]
+        value_natives = [
+            next(natives) if isinstance(v, ArrowSeries) else v for v in values
+        ]
+        result = pc.case_when(
+            pa.StructArray.from_arrays(
+                condition_natives, names=[str(i) for i in range(len(conditions))]
+            ),
+            *value_natives,
+        )
+        if not isinstance(result, pa.ChunkedArray):
+            result = pa.chunked_array([result])
+        return [conditions[0]._from_native_series(result).alias(name)]
 
     def then(self: Self, value: ArrowExpr | ArrowSeries | Any) -> ArrowThen:
         self._then_value = value
@@ -518,10 +585,26 @@ class ArrowThen(ArrowExpr):
         self._output_names = output_names
         self._kwargs = kwargs
 
+    def when(self: Self, *predicates: IntoArrowExpr) -> ArrowWhen:
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: ArrowWhen = self._call  # type: ignore[assignment]
+        plx = ArrowNamespace(backend_version=self._backend_version, version=self._version)
+        return ArrowWhen(
+            plx.all_horizontal(*predicates),
+            self._backend_version,
+            version=self._version,
+            branches=[*call._branches, (call._condition, call._then_value)],
+        )
+
     def otherwise(self: Self, value: ArrowExpr | ArrowSeries | Any) -> ArrowExpr:
-        # type ignore because we are setting the `_call` attribute to a
-        # callable object of type `PandasWhen`, base class has the attribute as
-        # only a `Callable`
-        self._call._otherwise_value = value  # type: ignore[attr-defined]
-        self._function_name = "whenotherwise"
-        return self
+        # The same `then` expression may be followed by different `otherwise` values
+        # (and compliant expressions get reused), so this one is left untouched.
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: ArrowWhen = copy(self._call)  # type: ignore[assignment]
+        call._otherwise_value = value
+        result = copy(self)
+        result._call = call
+        result._function_name = "whenotherwise"
+        return result
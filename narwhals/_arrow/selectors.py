@@ -28,7 +28,7 @@ class ArrowSelectorNamespace:
 
     def by_dtype(self: Self, dtypes: list[DType | type[DType]]) -> ArrowSelector:
         def func(df: ArrowDataFrame) -> list[ArrowSeries]:
-            return [df[col] for col in df.columns if df.schema[col] in dtypes]
+            return [df[col] for col, dtype in df.schema.items() if dtype in dtypes]
 
         return ArrowSelector(
             func,
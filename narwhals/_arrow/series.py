@@ -14,10 +14,15 @@ from narwhals._arrow.series_list import ArrowSeriesListNamespace
 from narwhals._arrow.series_str import ArrowSeriesStringNamespace
 from narwhals._arrow.utils import broadcast_and_extract_native
 from narwhals._arrow.utils import cast_for_truediv
+from narwhals._arrow.utils import dense_group_ids
+from narwhals._arrow.utils import first_occurrences
 from narwhals._arrow.utils import floordiv_compat
 from narwhals._arrow.utils import narwhals_to_native_dtype
 from narwhals._arrow.utils import native_to_narwhals_dtype
 from narwhals._arrow.utils import pad_series
+from narwhals._arrow.utils import rolling_extremum
+from narwhals._arrow.utils import rolling_quantile
+from narwhals._arrow.utils import rolling_valid_count
 from narwhals.typing import CompliantSeries
 from narwhals.utils import Implementation
 from narwhals.utils import generate_temporary_column_name
@@ -746,39 +751,23 @@ class ArrowSeries(CompliantSeries):
         return self.to_frame().is_unique().alias(self.name)
 
     def is_first_distinct(self: Self) -> Self:
-        import numpy as np  # ignore-banned-import
         import pyarrow as pa
-        import pyarrow.compute as pc
 
-        row_number = pa.array(np.arange(len(self)))
-        col_token = generate_temporary_column_name(n_bytes=8, columns=[self.name])
-        first_distinct_index = (
-            pa.Table.from_arrays([self._native_series], names=[self.name])
-            .append_column(col_token, row_number)
-            .group_by(self.name)
-            .aggregate([(col_token, "min")])
-            .column(f"{col_token}_min")
+        table = pa.Table.from_arrays([self._native_series], names=[self.name])
+        is_first_distinct = first_occurrences(dense_group_ids(table, [self.name]))
+        return self._from_native_series(
+            pa.chunked_array([is_first_distinct], type=pa.bool_())
         )
 
-        return self._from_native_series(pc.is_in(row_number, first_distinct_index))
-
     def is_last_distinct(self: Self) -> Self:
-        import numpy as np  # ignore-banned-import
         import pyarrow as pa
-        import pyarrow.compute as pc
 
-        row_number = pa.array(np.arange(len(self)))
-        col_token = generate_temporary_column_name(n_bytes=8, columns=[self.name])
-        last_distinct_index = (
-            pa.Table.from_arrays([self._native_series], names=[self.name])
-            .append_column(col_token, row_number)
-            .group_by(self.name)
-            .aggregate([(col_token, "max")])
-            .column(f"{col_token}_max")
+        table = pa.Table.from_arrays([self._native_series[::-1]], names=[self.name])
+        is_last_distinct = first_occurrences(dense_group_ids(table, [self.name]))[::-1]
+        return self._from_native_series(
+            pa.chunked_array([is_last_distinct], type=pa.bool_())
         )
 
-        return self._from_native_series(pc.is_in(row_number, last_distinct_index))
-
     def is_sorted(self: Self, *, descending: bool) -> bool:
         if not isinstance(descending, bool):
             msg = f"argument 'descending' should be boolean, found {type(descending)}"
@@ -1054,6 +1043,12 @@ class ArrowSeries(CompliantSeries):
 
         min_periods = min_periods if min_periods is not None else window_size
         padded_series, offset = pad_series(self, window_size=window_size, center=center)
+        # The variance doesn't change when shifting all values. Shifting them by one
+        # of them first avoids catastrophic cancellation between the sums below when
+        # values are large compared to their spread.
+        valid_values = padded_series._native_series.drop_null()
+        if len(valid_values):
+            padded_series = padded_series - valid_values[0].as_py()
 
         cum_sum = padded_series.cum_sum(reverse=False).fill_null(
             value=None, strategy="forward", limit=None
@@ -1109,6 +1104,113 @@ class ArrowSeries(CompliantSeries):
             ** 0.5
         )
 
+    def rolling_min(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return self._rolling_extremum(
+            window_size, min_periods=min_periods, center=center, maximum=False
+        )
+
+    def rolling_max(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return self._rolling_extremum(
+            window_size, min_periods=min_periods, center=center, maximum=True
+        )
+
+    def _rolling_extremum(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+        maximum: bool,
+    ) -> Self:
+        import numpy as np  # ignore-banned-import
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        min_periods = min_periods if min_periods is not None else window_size
+        padded_series, offset = pad_series(self, window_size=window_size, center=center)
+        native_series = padded_series._native_series
+        dtype = native_series.type
+        if pa.types.is_floating(dtype):
+            fill_value = -np.inf if maximum else np.inf
+        elif pa.types.is_integer(dtype):
+            info = np.iinfo(dtype.to_pandas_dtype())
+            fill_value = info.min if maximum else info.max
+        else:
+            msg = f"`rolling_{'max' if maximum else 'min'}` is not supported for {dtype}"
+            raise TypeError(msg)
+
+        values = pc.fill_null(native_series, pa.scalar(fill_value, type=dtype))
+        result = rolling_extremum(
+            values.to_numpy(),  # type: ignore[union-attr]
+            window_size=window_size,
+            maximum=maximum,
+        )
+        count_in_window = rolling_valid_count(
+            pc.is_valid(native_series).to_numpy(zero_copy_only=False), window_size
+        )
+        return self._from_native_series(
+            pa.chunked_array(
+                [pa.array(result, type=dtype, mask=count_in_window < min_periods)]
+            )
+        )[offset:]
+
+    def rolling_median(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return self.rolling_quantile(
+            quantile=0.5,
+            interpolation="linear",
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
+    def rolling_quantile(
+        self: Self,
+        quantile: float,
+        interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        min_periods = min_periods if min_periods is not None else window_size
+        padded_series, offset = pad_series(self, window_size=window_size, center=center)
+        native_series = padded_series._native_series
+        count_in_window = rolling_valid_count(
+            pc.is_valid(native_series).to_numpy(zero_copy_only=False), window_size
+        )
+        result = rolling_quantile(
+            pc.cast(native_series, pa.float64()).to_numpy(zero_copy_only=False),
+            window_size,
+            quantile=quantile,
+            interpolation=interpolation,
+        )
+        return self._from_native_series(
+            pa.chunked_array(
+                [pa.array(result, type=pa.float64(), mask=count_in_window < min_periods)]
+            )
+        )[offset:]
+
     def rank(
         self: Self,
         method: Literal["average", "min", "max", "dense", "ordinal"],
@@ -3,6 +3,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Literal
 from typing import Sequence
 from typing import overload
 
@@ -294,6 +295,128 @@ def diagonal_concat(dfs: list[pa.Table], backend_version: tuple[int, ...]) -> pa
     return pa.concat_tables(dfs, **kwargs)
 
 
+def dense_group_ids(table: pa.Table, keys: Sequence[str]) -> np.ndarray[Any, Any]:
+    """Assign a dense group id to each row of `table`, based on its values in `keys`.
+
+    Group ids are numbered in order of first appearance. Nulls compare equal to
+    each other. Each key is hashed once with `dictionary_encode`, and the codes
+    of multiple keys are combined and re-encoded, so that ids stay below the
+    number of rows.
+    """
+    import numpy as np  # ignore-banned-import
+    import pyarrow as pa
+
+    group_ids = np.zeros(len(table), dtype=np.int64)
+    if not len(table):
+        return group_ids
+    for i, key in enumerate(keys):
+        codes = _dictionary_codes(table[key])
+        if i == 0:
+            group_ids = codes
+        else:
+            combined = group_ids * (codes.max() + 1) + codes
+            group_ids = _dictionary_codes(pa.chunked_array([combined]))
+    return group_ids
+
+
+def _dictionary_codes(values: pa.ChunkedArray[Any]) -> np.ndarray[Any, Any]:
+    import numpy as np  # ignore-banned-import
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_dictionary(values.type):
+        # Existing indices aren't in order of first appearance, and each chunk may
+        # have its own dictionary, so the values get encoded afresh.
+        values = values.cast(values.type.value_type)
+    # The dictionary is shared across chunks, so codes are consistent.
+    encoded = pc.dictionary_encode(values, null_encoding="encode")
+    return np.concatenate(
+        [chunk.indices.to_numpy(zero_copy_only=False) for chunk in encoded.chunks]  # type: ignore[attr-defined]
+    ).astype(np.int64)
+
+
+def first_occurrences(group_ids: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """Return a mask of the rows where each group id first appears.
+
+    `group_ids` must be numbered in order of first appearance, as returned by
+    `dense_group_ids`.
+    """
+    import numpy as np  # ignore-banned-import
+
+    running_max = np.maximum.accumulate(group_ids)
+    return np.concatenate([[True], running_max[1:] > running_max[:-1]])[: len(group_ids)]
+
+
+def asof_join_indices(
+    left_on: pa.ChunkedArray[Any],
+    right_on: pa.ChunkedArray[Any],
+    left_group_ids: np.ndarray[Any, Any],
+    right_group_ids: np.ndarray[Any, Any],
+    strategy: Literal["backward", "forward", "nearest"],
+) -> pa.Array[Any]:
+    """Find the row of the right table to join onto each row of the left table.
+
+    Rows only match other rows from the same group. Rows are matched by a binary
+    search on the (group id, value) pairs of the right table, so neither table needs
+    to be sorted. Returns an integer array, with nulls where nothing matches.
+    """
+    import numpy as np  # ignore-banned-import
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    left_rows = np.flatnonzero(pc.is_valid(left_on).to_numpy(zero_copy_only=False))
+    right_rows = np.flatnonzero(pc.is_valid(right_on).to_numpy(zero_copy_only=False))
+    result = np.full(len(left_on), -1, dtype=np.int64)
+    if len(left_rows) and len(right_rows):
+        left_values = left_on.drop_null().to_numpy()
+        right_values = right_on.drop_null().to_numpy()
+        # Replace values by their ranks so that (group id, value) pairs can be
+        # encoded as a single integer.
+        uniques, ranks = np.unique(
+            np.concatenate([left_values, right_values]), return_inverse=True
+        )
+        left_groups = left_group_ids[left_rows]
+        right_groups = right_group_ids[right_rows]
+        left_keys = left_groups * len(uniques) + ranks[: len(left_values)]
+        right_keys = right_groups * len(uniques) + ranks[len(left_values) :]
+        order = np.argsort(right_keys, kind="stable")
+        right_keys, right_groups = right_keys[order], right_groups[order]
+        right_values, right_rows = right_values[order], right_rows[order]
+
+        # Last right row at or before each left value, within the same group.
+        backward = np.searchsorted(right_keys, left_keys, side="right") - 1
+        backward_idx = np.clip(backward, 0, None)
+        has_backward = (backward >= 0) & (right_groups[backward_idx] == left_groups)
+        # First right row at or after each left value, within the same group.
+        forward = np.searchsorted(right_keys, left_keys, side="left")
+        forward_idx = np.clip(forward, None, len(right_keys) - 1)
+        has_forward = (forward < len(right_keys)) & (
+            right_groups[forward_idx] == left_groups
+        )
+        if strategy == "backward":
+            matches = np.where(has_backward, right_rows[backward_idx], -1)
+        elif strategy == "forward":
+            matches = np.where(has_forward, right_rows[forward_idx], -1)
+        else:
+            # Like `backward`, take the last of several equal right values.
+            forward_idx = (
+                np.searchsorted(right_keys, right_keys[forward_idx], side="right") - 1
+            )
+            distance_backward = left_values - right_values[backward_idx]
+            distance_forward = right_values[forward_idx] - left_values
+            # Ties go forward.
+            use_backward = has_backward & (
+                ~has_forward | (distance_backward < distance_forward)
+            )
+            matches = np.where(
+                use_backward,
+                right_rows[backward_idx],
+                np.where(has_forward, right_rows[forward_idx], -1),
+            )
+        result[left_rows] = matches
+    return pa.array(result, mask=result < 0)
+
+
 def floordiv_compat(left: Any, right: Any) -> Any:
     # The following lines are adapted from pandas' pyarrow implementation.
     # Ref: https://github.com/pandas-dev/pandas/blob/262fcfbffcee5c3116e86a951d8b693f90411e68/pandas/core/arrays/arrow/array.py#L124-L154
@@ -553,3 +676,102 @@ def pad_series(
         offset = 0
 
     return padded_arr, offset
+
+
+def rolling_valid_count(
+    valid: np.ndarray[Any, Any], window_size: int
+) -> np.ndarray[Any, Any]:
+    """Count the valid values in each trailing window of `window_size` elements."""
+    import numpy as np  # ignore-banned-import
+
+    cum_count = np.cumsum(valid, dtype=np.int64)
+    shifted = np.zeros_like(cum_count)
+    shifted[window_size:] = cum_count[:-window_size]
+    return cum_count - shifted
+
+
+def rolling_extremum(
+    values: np.ndarray[Any, Any], window_size: int, *, maximum: bool
+) -> np.ndarray[Any, Any]:
+    """Compute the maximum (or minimum) of each trailing window of `window_size` elements.
+
+    Uses the van Herk/Gil-Werman algorithm: the values are split into blocks of
+    `window_size` elements, and each window is covered by the suffix of one block
+    and the prefix of the next one. Each value is visited a constant number of times,
+    whatever the window size.
+    """
+    import numpy as np  # ignore-banned-import
+
+    op = np.maximum if maximum else np.minimum
+    if values.dtype.kind == "f":
+        identity = -np.inf if maximum else np.inf
+    else:
+        info = np.iinfo(values.dtype)
+        identity = info.min if maximum else info.max
+    num_rows = len(values)
+    num_blocks = -(-(num_rows + window_size - 1) // window_size)
+    padded = np.full(num_blocks * window_size, identity, dtype=values.dtype)
+    padded[window_size - 1 : window_size - 1 + num_rows] = values
+    blocks = padded.reshape(num_blocks, window_size)
+    prefix = op.accumulate(blocks, axis=1).ravel()
+    suffix = op.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    # The window ending at row `i` spans `padded[i : i + window_size]`.
+    return op(suffix[:num_rows], prefix[window_size - 1 : window_size - 1 + num_rows])
+
+
+# Upper bound on the number of values which `rolling_quantile` copies at once.
+_ROLLING_QUANTILE_BLOCK_SIZE = 1 << 20
+
+
+def rolling_quantile(
+    values: np.ndarray[Any, Any],
+    window_size: int,
+    *,
+    quantile: float,
+    interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+) -> np.ndarray[Any, Any]:
+    """Compute the `quantile` of each trailing window of `window_size` elements.
+
+    Missing values should be NaN, and are ignored. Windows get sorted a block of
+    rows at a time (NaNs sort last), so that memory use stays bounded however long
+    `values` is, and the quantile is then picked out of each sorted window like
+    `np.nanquantile` would. The exception is "nearest", which picks the element at
+    `floor(quantile * count)` of the `count` valid ones, like Polars'
+    `rolling_quantile` does, rather than rounding half to even like NumPy.
+    """
+    import numpy as np  # ignore-banned-import
+
+    padded = np.concatenate([np.full(window_size - 1, np.nan), values])
+    # A strided view of all windows, without copying the values.
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window_size)
+    is_valid = np.concatenate([[0], np.cumsum(~np.isnan(padded))])
+    valid_count = is_valid[window_size:] - is_valid[:-window_size]
+    # Windows without valid values get masked by the caller.
+    if interpolation == "nearest":
+        position = np.minimum(np.floor(quantile * valid_count), valid_count - 1)
+        position = np.maximum(position, 0)
+    else:
+        position = quantile * np.maximum(valid_count - 1, 0)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    block_rows = max(1, _ROLLING_QUANTILE_BLOCK_SIZE // window_size)
+    result = np.empty(len(values), dtype=np.float64)
+    for start in range(0, len(values), block_rows):
+        rows = slice(start, start + block_rows)
+        block = np.sort(windows[rows], axis=1)
+        lower_value = np.take_along_axis(block, lower[rows, None], axis=1)[:, 0]
+        upper_value = np.take_along_axis(block, upper[rows, None], axis=1)[:, 0]
+        if interpolation in {"lower", "nearest"}:
+            result[rows] = lower_value
+        elif interpolation == "higher":
+            result[rows] = upper_value
+        else:
+            weight = 0.5 if interpolation == "midpoint" else position[rows] - lower[rows]
+            diff = upper_value - lower_value
+            # Same interpolation as NumPy's, which is exact at both ends.
+            result[rows] = np.where(
+                weight >= 0.5,
+                upper_value - diff * (1 - weight),
+                lower_value + diff * weight,
+            )
+    return result
@@ -8,8 +8,10 @@ from typing import Literal
 from typing import Sequence
 
 from narwhals._dask.utils import add_row_index
+from narwhals._dask.utils import broadcast_join
 from narwhals._dask.utils import parse_exprs_and_named_exprs
 from narwhals._pandas_like.utils import native_to_narwhals_dtype
+from narwhals._pandas_like.utils import non_object_native_dtype_to_narwhals_dtype
 from narwhals._pandas_like.utils import select_columns_by_name
 from narwhals.typing import CompliantLazyFrame
 from narwhals.utils import Implementation
@@ -158,11 +160,18 @@ class DaskLazyFrame(CompliantLazyFrame):
 
     @property
     def schema(self) -> dict[str, DType]:
+        # Not cached: the native frame may be the user's own object, which they can
+        # modify in-place. Converting the dtypes themselves is memoised, though.
+        native_frame = self._native_frame
         return {
             col: native_to_narwhals_dtype(
-                self._native_frame[col], self._version, self._implementation
+                native_frame[col], self._version, self._implementation
+            )
+            if native_dtype == "object"
+            else non_object_native_dtype_to_narwhals_dtype(
+                native_dtype, self._version, self._implementation
             )
-            for col in self._native_frame.columns
+            for col, native_dtype in native_frame.dtypes.items()
         }
 
     def collect_schema(self) -> dict[str, DType]:
@@ -243,6 +252,22 @@ class DaskLazyFrame(CompliantLazyFrame):
             left_on = [left_on]
         if isinstance(right_on, str):
             right_on = [right_on]
+        if how in {"cross", "anti", "semi"} and other._native_frame.npartitions == 1:
+            # `other` fits in a single partition (e.g. a small dimension table, or one
+            # which the user repartitioned on purpose): broadcast it to every partition
+            # of `self` rather than shuffling both sides. Dask already does this on its
+            # own for inner and left joins.
+            return self._from_native_frame(
+                self._native_frame.map_partitions(
+                    broadcast_join,
+                    other._native_frame,
+                    how=how,
+                    left_on=left_on,
+                    right_on=right_on,
+                    suffix=suffix,
+                    version=self._version,
+                )
+            )
         if how == "cross":
             key_token = generate_temporary_column_name(
                 n_bytes=8, columns=[*self.columns, *other.columns]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from copy import copy
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -384,6 +385,7 @@ class DaskWhen:
         *,
         returns_scalar: bool,
         version: Version,
+        branches: list[tuple[DaskExpr, Any]] | None = None,
     ) -> None:
         self._backend_version = backend_version
         self._condition = condition
@@ -391,20 +393,26 @@ class DaskWhen:
         self._otherwise_value = otherwise_value
         self._returns_scalar = returns_scalar
         self._version = version
+        # `(condition, then_value)` pairs of the preceding branches in a chained
+        # `when(...).then(...).when(...).then(...)`.
+        self._branches = branches or []
 
     def __call__(self, df: DaskLazyFrame) -> Sequence[dx.Series]:
         from narwhals._expression_parsing import parse_into_expr
 
+        if self._branches:
+            return self._call_chained(df)
+
         plx = df.__narwhals_namespace__()
         condition = parse_into_expr(self._condition, namespace=plx)(df)[0]
         condition = cast("dx.Series", condition)
         try:
             value_series = parse_into_expr(self._then_value, namespace=plx)(df)[0]
         except TypeError:
-            # `self._otherwise_value` is a scalar and can't be converted to an expression
+            # `self._then_value` is a scalar and can't be converted to an expression
             _df = condition.to_frame("a")
-            _df["tmp"] = self._then_value
-            value_series = _df["tmp"]
+            _df["literal"] = self._then_value
+            value_series = _df["literal"]
         value_series = cast("dx.Series", value_series)
         validate_comparand(condition, value_series)
 
@@ -422,6 +430,57 @@ class DaskWhen:
         validate_comparand(condition, otherwise_series)
         return [value_series.where(condition, otherwise_series)]
 
+    def _call_chained(self, df: DaskLazyFrame) -> Sequence[dx.Series]:
+        # All branches are evaluated once and folded with `where`, starting from the
+        # last one, so that the first matching branch wins.
+        from narwhals._expression_parsing import parse_into_expr
+
+        plx = df.__narwhals_namespace__()
+        branches = [*self._branches, (self._condition, self._then_value)]
+        conditions = [
+            cast("dx.Series", parse_into_expr(c, namespace=plx)(df)[0])
+            for c, _ in branches
+        ]
+        reference = conditions[0]
+
+        def evaluate_then(value: Any) -> dx.Series:
+            try:
+                value_series = parse_into_expr(value, namespace=plx)(df)[0]
+            except TypeError:
+                # `value` is a scalar and can't be converted to an expression
+                _df = reference.to_frame("a")
+                _df["literal"] = value
+                return _df["literal"]
+            value_series = cast("dx.Series", value_series)
+            validate_comparand(reference, value_series)
+            return value_series
+
+        def evaluate_otherwise(value: Any) -> Any:
+            try:
+                otherwise_expr = parse_into_expr(value, namespace=plx)
+            except TypeError:
+                # `value` is a scalar and can't be converted to an expression
+                return value
+            otherwise_series = otherwise_expr(df)[0]
+            if otherwise_expr._returns_scalar:  # type: ignore[attr-defined]
+                return otherwise_series[0]
+            validate_comparand(reference, otherwise_series)
+            return otherwise_series
+
+        result = (
+            None
+            if self._otherwise_value is None
+            else evaluate_otherwise(self._otherwise_value)
+        )
+        for (_, then_value), condition in zip(reversed(branches), reversed(conditions)):
+            value_series = evaluate_then(then_value)
+            result = (
+                value_series.where(condition)
+                if result is None
+                else value_series.where(condition, result)
+            )
+        return [result]
+
     def then(self, value: DaskExpr | Any) -> DaskThen:
         self._then_value = value
 
@@ -462,10 +521,27 @@ class DaskThen(DaskExpr):
         self._returns_scalar = returns_scalar
         self._kwargs = kwargs
 
+    def when(self, *predicates: IntoDaskExpr) -> DaskWhen:
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: DaskWhen = self._call  # type: ignore[assignment]
+        plx = DaskNamespace(backend_version=self._backend_version, version=self._version)
+        return DaskWhen(
+            plx.all_horizontal(*predicates),
+            self._backend_version,
+            returns_scalar=self._returns_scalar,
+            version=self._version,
+            branches=[*call._branches, (call._condition, call._then_value)],
+        )
+
     def otherwise(self, value: DaskExpr | Any) -> DaskExpr:
-        # type ignore because we are setting the `_call` attribute to a
-        # callable object of type `DaskWhen`, base class has the attribute as
-        # only a `Callable`
-        self._call._otherwise_value = value  # type: ignore[attr-defined]
-        self._function_name = "whenotherwise"
-        return self
+        # The same `then` expression may be followed by different `otherwise` values
+        # (and compliant expressions get reused), so this one is left untouched.
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: DaskWhen = copy(self._call)  # type: ignore[assignment]
+        call._otherwise_value = value
+        result = copy(self)
+        result._call = call
+        result._function_name = "whenotherwise"
+        return result
@@ -29,7 +29,9 @@ class DaskSelectorNamespace:
     def by_dtype(self: Self, dtypes: list[DType | type[DType]]) -> DaskSelector:
         def func(df: DaskLazyFrame) -> list[Any]:
             return [
-                df._native_frame[col] for col in df.columns if df.schema[col] in dtypes
+                df._native_frame[col]
+                for col, dtype in df.schema.items()
+                if dtype in dtypes
             ]
 
         return DaskSelector(
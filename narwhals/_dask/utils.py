@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Literal
 
 from narwhals._pandas_like.utils import select_columns_by_name
 from narwhals.dependencies import get_pandas
@@ -14,6 +15,7 @@ from narwhals.utils import parse_version
 
 if TYPE_CHECKING:
     import dask.dataframe as dd
+    import pandas as pd
 
     try:
         import dask.dataframe.dask_expr as dx
@@ -86,6 +88,49 @@ def add_row_index(
     )
 
 
+def broadcast_join(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    *,
+    how: Literal["cross", "anti", "semi"],
+    left_on: list[str] | None,
+    right_on: list[str] | None,
+    suffix: str,
+    version: Version,
+) -> pd.DataFrame:
+    """Join one partition of the left frame with the whole right frame.
+
+    Meant to be used with `map_partitions`, with `right` being a single-partition
+    Dask DataFrame which gets broadcast to every partition of `left`.
+    """
+    import pandas as pd  # ignore-banned-import
+
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+
+    backend_version = parse_version(pd.__version__)
+    return (
+        PandasLikeDataFrame(
+            left,
+            implementation=Implementation.PANDAS,
+            backend_version=backend_version,
+            version=version,
+        )
+        .join(
+            PandasLikeDataFrame(
+                right,
+                implementation=Implementation.PANDAS,
+                backend_version=backend_version,
+                version=version,
+            ),
+            how=how,
+            left_on=left_on,
+            right_on=right_on,
+            suffix=suffix,
+        )
+        ._native_frame
+    )
+
+
 def validate_comparand(lhs: dx.Series, rhs: dx.Series) -> None:
     try:
         import dask.dataframe.dask_expr as dx
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import operator
+from copy import copy
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -226,6 +227,7 @@ class DuckDBWhen:
         *,
         returns_scalar: bool,
         version: Version,
+        branches: list[tuple[DuckDBExpr, Any]] | None = None,
     ) -> None:
         self._backend_version = backend_version
         self._condition = condition
@@ -233,6 +235,9 @@ class DuckDBWhen:
         self._otherwise_value = otherwise_value
         self._returns_scalar = returns_scalar
         self._version = version
+        # `(condition, then_value)` pairs of the preceding branches in a chained
+        # `when(...).then(...).when(...).then(...)`.
+        self._branches = branches or []
 
     def __call__(self, df: DuckDBLazyFrame) -> Sequence[duckdb.Expression]:
         from duckdb import CaseExpression
@@ -240,6 +245,9 @@ class DuckDBWhen:
 
         from narwhals._expression_parsing import parse_into_expr
 
+        if self._branches:
+            return self._call_chained(df)
+
         plx = df.__narwhals_namespace__()
         condition = parse_into_expr(self._condition, namespace=plx)(df)[0]
         condition = cast("duckdb.Expression", condition)
@@ -265,6 +273,38 @@ class DuckDBWhen:
         otherwise = otherwise_expr(df)[0]
         return [CaseExpression(condition=condition, value=value).otherwise(otherwise)]
 
+    def _call_chained(self, df: DuckDBLazyFrame) -> Sequence[duckdb.Expression]:
+        # All branches are compiled into a single `CASE WHEN ... WHEN ... END`.
+        from duckdb import CaseExpression
+        from duckdb import ConstantExpression
+
+        from narwhals._expression_parsing import parse_into_expr
+
+        # `DuckDBNamespace` evaluates to native expressions rather than to compliant
+        # series, which `parse_into_expr`'s type hints don't allow for.
+        plx = cast("CompliantNamespace[Any]", df.__narwhals_namespace__())
+
+        def evaluate(value: Any) -> duckdb.Expression:
+            try:
+                expr = parse_into_expr(value, namespace=plx)
+            except TypeError:
+                # `value` is a scalar and can't be converted to an expression
+                return ConstantExpression(value)
+            return cast("duckdb.Expression", expr(df)[0])
+
+        (first_condition, first_value), *branches = [
+            *self._branches,
+            (self._condition, self._then_value),
+        ]
+        result = CaseExpression(
+            condition=evaluate(first_condition), value=evaluate(first_value)
+        )
+        for condition, value in branches:
+            result = result.when(evaluate(condition), evaluate(value))
+        if self._otherwise_value is not None:
+            result = result.otherwise(evaluate(self._otherwise_value))
+        return [result]
+
     def then(self, value: DuckDBExpr | Any) -> DuckDBThen:
         self._then_value = value
 
@@ -305,10 +345,29 @@ class DuckDBThen(DuckDBExpr):
         self._returns_scalar = returns_scalar
         self._kwargs = kwargs
 
+    def when(self, *predicates: IntoDuckDBExpr) -> DuckDBWhen:
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: DuckDBWhen = self._call  # type: ignore[assignment]
+        plx = DuckDBNamespace(
+            backend_version=self._backend_version, version=self._version
+        )
+        return DuckDBWhen(
+            plx.all_horizontal(*predicates),
+            self._backend_version,
+            returns_scalar=self._returns_scalar,
+            version=self._version,
+            branches=[*call._branches, (call._condition, call._then_value)],
+        )
+
     def otherwise(self, value: DuckDBExpr | Any) -> DuckDBExpr:
-        # type ignore because we are setting the `_call` attribute to a
-        # callable object of type `DuckDBWhen`, base class has the attribute as
-        # only a `Callable`
-        self._call._otherwise_value = value  # type: ignore[attr-defined]
-        self._function_name = "whenotherwise"
-        return self
+        # The same `then` expression may be followed by different `otherwise` values
+        # (and compliant expressions get reused), so this one is left untouched.
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: DuckDBWhen = copy(self._call)  # type: ignore[assignment]
+        call._otherwise_value = value
+        result = copy(self)
+        result._call = call
+        result._function_name = "whenotherwise"
+        return result
@@ -6,10 +6,13 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Sequence
 
+from narwhals.dependencies import get_pyarrow
 from narwhals.dtypes import DType
 from narwhals.exceptions import InvalidIntoExprError
+from narwhals.utils import Implementation
 from narwhals.utils import import_dtypes_module
 from narwhals.utils import isinstance_or_issubclass
+from narwhals.utils import parse_version
 
 if TYPE_CHECKING:
     import duckdb
@@ -212,3 +215,142 @@ def binary_operation_returns_scalar(lhs: DuckDBExpr, rhs: DuckDBExpr | Any) -> b
     # it means that it was a scalar (e.g. nw.col('a') + 1), and so we default
     # to `True`.
     return lhs._returns_scalar and getattr(rhs, "_returns_scalar", True)
+
+
+def can_offload_frame(frame: Any) -> bool:
+    """Whether an eager compliant frame can be run through DuckDB and back.
+
+    Only pandas and PyArrow frames are supported, and PyArrow is needed to pass them
+    to DuckDB. DuckDB resolves column names
+    case-insensitively, and some types (e.g. durations, or pandas object columns which
+    don't hold strings) don't round-trip through it.
+    """
+    if (
+        frame._implementation not in {Implementation.PANDAS, Implementation.PYARROW}
+        or get_pyarrow() is None
+    ):
+        return False
+    columns = frame.columns
+    if not all(isinstance(name, str) for name in columns) or len(
+        {name.lower() for name in columns}
+    ) != len(columns):
+        return False
+    dtypes = import_dtypes_module(frame._version)
+    return not any(
+        isinstance_or_issubclass(dtype, (dtypes.Duration, dtypes.Object, dtypes.Unknown))
+        for dtype in frame.schema.values()
+    )
+
+
+def to_duckdb_lazyframe(frame: Any, *, row_index: str | None = None) -> DuckDBLazyFrame:
+    """View an eager pandas or PyArrow compliant frame as a DuckDB relation.
+
+    DuckDB scans PyArrow tables in place. pandas frames are passed as PyArrow tables
+    too, which keeps missing values and extension types intact (DuckDB's own pandas
+    scan doesn't), and NumPy numeric columns are converted without a copy.
+
+    If `row_index` is given, a column with that name holding each row's position is
+    added, as DuckDB doesn't otherwise keep track of the order of rows.
+    """
+    import duckdb  # ignore-banned-import
+    import pyarrow as pa  # ignore-banned-import
+
+    from narwhals._duckdb.dataframe import DuckDBLazyFrame
+
+    native_frame = frame._native_frame
+    if frame._implementation is Implementation.PANDAS:
+        native_frame = pa.Table.from_pandas(native_frame, preserve_index=False)
+    if row_index is not None:
+        import numpy as np  # ignore-banned-import
+
+        native_frame = native_frame.append_column(
+            row_index, pa.array(np.arange(len(native_frame)))
+        )
+    rel = duckdb.from_arrow(native_frame)
+    return DuckDBLazyFrame(
+        rel, backend_version=parse_version(duckdb.__version__), version=frame._version
+    )
+
+
+def collect_like(
+    result: DuckDBLazyFrame,
+    frames: Sequence[Any],
+    inputs: Sequence[DuckDBLazyFrame],
+    *,
+    suffix: str | None = None,
+) -> Any:
+    """Materialise `result` as an eager compliant frame of the same backend as `frames`.
+
+    `result` was computed from the DuckDB views `inputs` of the eager compliant
+    `frames`. Its columns which come from one of `frames` and still have the same
+    DuckDB type (e.g. join and group-by keys, or `min` and `max` aggregations) get
+    their native type back, which DuckDB may have mapped to another one (e.g.
+    categoricals to strings, or timezones to UTC). Integer sums, which DuckDB widens
+    to HUGEINT, become 64-bit integers again. Other columns keep DuckDB's type.
+
+    `suffix` is the one which a join appended to the names of `frames[1]`'s columns.
+    """
+    import numpy as np  # ignore-banned-import
+    import pyarrow as pa  # ignore-banned-import
+
+    rel = result._native_frame
+    target = frames[0]
+    is_pyarrow = target._implementation is Implementation.PYARROW
+    int64 = pa.int64() if is_pyarrow else np.dtype("int64")
+    input_types = [
+        dict(zip(input_._native_frame.columns, map(str, input_._native_frame.types)))
+        for input_ in inputs
+    ]
+
+    def native_dtype(frame: Any, name: str) -> Any:
+        native_frame = frame._native_frame
+        if is_pyarrow:
+            return native_frame.schema.field(name).type
+        return native_frame[name].dtype
+
+    targets: dict[str, Any] = {}
+    for name, duckdb_type in zip(rel.columns, map(str, rel.types)):
+        source = next(
+            ((i, name) for i, frame in enumerate(frames) if name in frame.columns), None
+        )
+        if (
+            source is None
+            and suffix
+            and name.endswith(suffix)
+            and len(frames) > 1
+            and (unsuffixed := name[: -len(suffix)]) in frames[1].columns
+        ):
+            source = (1, unsuffixed)
+        source_type = None if source is None else input_types[source[0]][source[1]]
+        if source is not None and duckdb_type == source_type:
+            targets[name] = native_dtype(frames[source[0]], source[1])
+        elif duckdb_type == "HUGEINT":
+            if source is not None and source_type == "BIGINT":
+                targets[name] = native_dtype(frames[source[0]], source[1])
+            else:
+                targets[name] = int64
+
+    if is_pyarrow:
+        table = rel.arrow()
+        columns = [
+            column
+            if (dtype := targets.get(name)) is None or column.type == dtype
+            else column.cast(dtype)
+            for name, column in zip(table.column_names, table.columns)
+        ]
+        return target._from_native_frame(
+            pa.Table.from_arrays(columns, names=table.column_names)
+        )
+
+    df = rel.df()
+    casts = {
+        name: dtype
+        for name, dtype in targets.items()
+        if df[name].dtype != dtype
+        # NumPy integers and booleans can't hold missing values, in which case pandas
+        # would also have produced floats or objects.
+        and not (
+            isinstance(dtype, np.dtype) and dtype.kind in "iub" and df[name].isna().any()
+        )
+    }
+    return target._from_native_frame(df.astype(casts) if casts else df)
@@ -3,9 +3,13 @@
 # and pandas or PyArrow.
 from __future__ import annotations
 
+from contextvars import ContextVar
 from copy import copy
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
+from typing import Container
+from typing import Hashable
 from typing import Sequence
 from typing import TypeVar
 from typing import Union
@@ -15,11 +19,15 @@ from typing import overload
 from narwhals.dependencies import is_numpy_array
 from narwhals.exceptions import InvalidIntoExprError
 from narwhals.utils import Implementation
+from narwhals.utils import generate_temporary_column_name
+from narwhals.utils import remove_prefix
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from narwhals._arrow.dataframe import ArrowDataFrame
     from narwhals._arrow.expr import ArrowExpr
+    from narwhals._pandas_like.dataframe import PandasLikeDataFrame
     from narwhals._pandas_like.expr import PandasLikeExpr
     from narwhals.typing import CompliantDataFrame
     from narwhals.typing import CompliantExpr
@@ -41,6 +49,46 @@ if TYPE_CHECKING:
 
     T = TypeVar("T")
 
+    # Structural key of a compliant expression: `(name, parameters, child keys)`.
+    CSEKey: TypeAlias = tuple[str, tuple[tuple[str, Any], ...], tuple[Any, ...]]
+
+# Methods whose result may differ between two evaluations on the same frame,
+# and which therefore must never be shared between expressions.
+_NON_DETERMINISTIC_METHODS = frozenset({"sample"})
+
+
+class _CSEScope:
+    """Results of sub-expressions shared between the expressions of a single call.
+
+    Only sub-expressions which are needed more than once are kept, and each one is
+    dropped as soon as its last consumer has read it, so that peak memory doesn't
+    grow compared to evaluating the expressions one by one.
+    """
+
+    def __init__(
+        self, df: CompliantDataFrame, exprs: Sequence[CompliantExpr[Any]]
+    ) -> None:
+        self.df = df
+        self.remaining_uses: dict[CSEKey, int] = {}
+        self.results: dict[CSEKey, Sequence[Any]] = {}
+        for expr in exprs:
+            key = getattr(expr, "_cse_key", None)
+            if key is not None:
+                self._count_uses(key)
+
+    def _count_uses(self, key: CSEKey) -> None:
+        # A sub-expression which was already seen is served from the cache, so
+        # its children don't get evaluated again.
+        if key in self.remaining_uses:
+            self.remaining_uses[key] += 1
+            return
+        self.remaining_uses[key] = 1
+        for child in key[2]:
+            self._count_uses(child)
+
+
+_cse_scope: ContextVar[_CSEScope | None] = ContextVar("_cse_scope", default=None)
+
 
 def evaluate_into_expr(
     df: CompliantDataFrame | CompliantLazyFrame,
@@ -56,22 +104,326 @@ def evaluate_into_exprs(
     *exprs: IntoCompliantExpr[CompliantSeriesT_co],
     **named_exprs: IntoCompliantExpr[CompliantSeriesT_co],
 ) -> Sequence[CompliantSeriesT_co]:
-    """Evaluate each expr into Series."""
-    series = [
-        item
-        for sublist in (evaluate_into_expr(df, into_expr) for into_expr in exprs)
-        for item in sublist
-    ]
-    for name, expr in named_exprs.items():
-        evaluated_expr = evaluate_into_expr(df, expr)
-        if len(evaluated_expr) > 1:
-            msg = "Named expressions must return a single column"  # pragma: no cover
-            raise AssertionError(msg)
-        to_append = evaluated_expr[0].alias(name)
-        series.append(to_append)
+    """Evaluate each expr into Series.
+
+    Sub-expressions which appear more than once across all of `exprs` and
+    `named_exprs` (e.g. `1 - nw.col("discount")`) are only evaluated once.
+    """
+    plx = df.__narwhals_namespace__()
+    parsed_exprs = [parse_into_expr(into_expr, namespace=plx) for into_expr in exprs]
+    parsed_named_exprs = {
+        name: parse_into_expr(expr, namespace=plx) for name, expr in named_exprs.items()
+    }
+    token = _cse_scope.set(_CSEScope(df, [*parsed_exprs, *parsed_named_exprs.values()]))
+    try:
+        series = [item for expr in parsed_exprs for item in expr(df)]
+        for name, expr in parsed_named_exprs.items():
+            evaluated_expr = expr(df)
+            if len(evaluated_expr) > 1:
+                msg = "Named expressions must return a single column"  # pragma: no cover
+                raise AssertionError(msg)
+            to_append = evaluated_expr[0].alias(name)
+            series.append(to_append)
+    finally:
+        _cse_scope.reset(token)
     return series
 
 
+def evaluate_with_cse(expr: ArrowExpr | PandasLikeExpr, df: Any) -> Sequence[Any]:
+    """Evaluate `expr`, reusing the result of an identical sub-expression if possible.
+
+    Results are only shared within a single `evaluate_into_exprs` call on `df`.
+    """
+    key = expr._cse_key
+    scope = _cse_scope.get()
+    if key is None or scope is None or scope.df is not df:
+        return expr._call(df)
+    remaining_uses = scope.remaining_uses.get(key, 0)
+    if remaining_uses <= 1:
+        # Last (or only) consumer: hand out the result and forget about it.
+        scope.remaining_uses.pop(key, None)
+        result = scope.results.pop(key, None)
+        return expr._call(df) if result is None else result
+    scope.remaining_uses[key] = remaining_uses - 1
+    if key not in scope.results:
+        scope.results[key] = expr._call(df)
+    return scope.results[key]
+
+
+def make_cse_key(
+    name: str, /, *children: CompliantExpr[Any], **params: Any
+) -> CSEKey | None:
+    """Build the structural key of an expression from its children and parameters.
+
+    Returns `None` (i.e. "never share this expression") if any child is opaque or
+    any parameter can't be compared reliably.
+    """
+    if name in _NON_DETERMINISTIC_METHODS:
+        return None
+    child_keys = []
+    param_keys: list[tuple[str, Any]] = []
+    for child in children:
+        child_key = getattr(child, "_cse_key", None)
+        if child_key is None:
+            return None
+        child_keys.append(child_key)
+    for param_name in sorted(params):
+        value = params[param_name]
+        if hasattr(value, "__narwhals_expr__"):
+            # Expression arguments become children, in sorted parameter order.
+            child_key = getattr(value, "_cse_key", None)
+            if child_key is None:
+                return None
+            child_keys.append(child_key)
+            param_keys.append((param_name, "expr"))
+        else:
+            param_key = _make_param_cse_key(value)
+            if param_key is None:
+                return None
+            param_keys.append((param_name, param_key))
+    return (name, tuple(param_keys), tuple(child_keys))
+
+
+def _make_param_cse_key(value: Any) -> Hashable | None:
+    if hasattr(value, "__narwhals_series__"):
+        return None
+    # Lists (e.g. in `is_in`) are kept as tuples, the type tells them apart.
+    hashable_value = tuple(value) if isinstance(value, list) else value
+    try:
+        hash(hashable_value)
+    except TypeError:
+        return None
+    # `repr` tells apart values which compare equal but evaluate differently,
+    # such as `1` and `1.0`, `0.0` and `-0.0`, or `Datetime` and `Datetime("ns")`.
+    # The value itself is kept so that plans can be translated for other engines.
+    return (type(value), repr(value), hashable_value)
+
+
+# Methods which, given the same input row, always produce the same output row.
+# Only expressions built exclusively out of these can be moved across steps which
+# change the number of rows, see `is_elementwise`.
+ELEMENTWISE_FUNCTIONS = frozenset(
+    {
+        "col",
+        "nth",
+        "all",
+        "lit",
+        "alias",
+        "cast",
+        "__eq__",
+        "__ne__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__and__",
+        "__or__",
+        "__invert__",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__truediv__",
+        "__floordiv__",
+        "__pow__",
+        "__mod__",
+        "abs",
+        "clip",
+        "round",
+        "is_between",
+        "is_in",
+        "is_null",
+        "is_nan",
+        "is_finite",
+        "replace_strict",
+        "str.contains",
+        "str.ends_with",
+        "str.head",
+        "str.len_chars",
+        "str.replace",
+        "str.replace_all",
+        "str.slice",
+        "str.starts_with",
+        "str.strip_chars",
+        "str.tail",
+        "str.to_lowercase",
+        "str.to_uppercase",
+        "dt.convert_time_zone",
+        "dt.date",
+        "dt.day",
+        "dt.hour",
+        "dt.microsecond",
+        "dt.millisecond",
+        "dt.minute",
+        "dt.month",
+        "dt.nanosecond",
+        "dt.ordinal_day",
+        "dt.replace_time_zone",
+        "dt.second",
+        "dt.timestamp",
+        "dt.to_string",
+        "dt.total_microseconds",
+        "dt.total_milliseconds",
+        "dt.total_minutes",
+        "dt.total_nanoseconds",
+        "dt.total_seconds",
+        "dt.weekday",
+        "dt.year",
+        "list.len",
+        "all_horizontal",
+        "any_horizontal",
+        "sum_horizontal",
+        "mean_horizontal",
+        "min_horizontal",
+        "max_horizontal",
+    }
+)
+
+
+def is_elementwise(expr: Any) -> bool:
+    """Check whether each output row of `expr` only depends on the same input row.
+
+    Only expressions with a known structure (see `make_cse_key`) qualify.
+    """
+    if isinstance(expr, str):
+        return True
+    key = getattr(expr, "_cse_key", None)
+    return key is not None and _is_elementwise_key(key)
+
+
+def _is_elementwise_key(key: Any) -> bool:
+    name, params, children = key
+    if name not in ELEMENTWISE_FUNCTIONS:
+        return False
+    if dict(params).get("returns_scalar", (bool, "False", False))[2] is not False:
+        return False
+    return all(_is_elementwise_key(child) for child in children)
+
+
+def split_aggregation(
+    expr: ArrowOrPandasLikeExpr,
+) -> (
+    tuple[str, dict[str, Any], ArrowOrPandasLikeExpr, ArrowOrPandasLikeExpr | None] | None
+):
+    """Split an aggregation into its reduction and the expression it reduces.
+
+    For example, `(nw.col('a') * nw.col('b')).sum()` is split into `'sum'`, its
+    (empty) parameters, and `nw.col('a') * nw.col('b')`. If the reduced expression is
+    filtered, as in `nw.col('a').filter(nw.col('b') > 0).mean()`, then the filter's
+    predicate is returned separately, otherwise the last element is `None`.
+
+    Returns `None` if `expr` isn't an elementwise expression (possibly filtered),
+    followed by a single reduction without expression parameters.
+    """
+    while expr._cse_key is not None and expr._cse_key[0] == "alias":
+        # Output names are taken from the original expression.
+        expr = expr._input_expr  # type: ignore[assignment]
+    inner: ArrowOrPandasLikeExpr | None = expr._input_expr  # type: ignore[assignment]
+    if expr._cse_key is None or inner is None:
+        return None
+    function_name, params, _ = expr._cse_key
+    returns_scalar = dict(params).get("returns_scalar")
+    if (
+        returns_scalar is None
+        or returns_scalar[2] is not True
+        or any(param == "expr" for _, param in params)
+    ):
+        return None
+    kwargs = {name: param[2] for name, param in params if name != "returns_scalar"}
+    if is_elementwise(inner):
+        return function_name, kwargs, inner, None
+    if (
+        inner._cse_key is not None
+        and inner._cse_key[0] == "filter"
+        and inner._input_expr is not None
+        and is_elementwise(inner._input_expr)
+        and is_elementwise(predicate := inner._kwargs["other"])
+    ):
+        return function_name, kwargs, inner._input_expr, predicate  # type: ignore[return-value]
+    return None
+
+
+# Aggregations which ignore missing values: aggregating a filtered column is the
+# same as aggregating the column with the filtered-out rows set to null.
+NULL_SKIPPING_AGGREGATIONS = frozenset(
+    {"sum", "mean", "median", "max", "min", "std", "var", "count"}
+)
+
+
+def lower_complex_aggregations(
+    exprs: Sequence[ArrowOrPandasLikeExpr],
+    df: ArrowDataFrame | PandasLikeDataFrame,
+    *,
+    keys: Sequence[str],
+    aggregations: Container[str],
+    mask_columns: Callable[[str, list[Any], Any], list[Any] | None],
+) -> tuple[list[str], dict[str, Any], list[ArrowOrPandasLikeExpr]] | None:
+    """Rewrite complex aggregations as simple ones over temporary columns.
+
+    For example, `(nw.col('a') * nw.col('b')).sum()` becomes `nw.col(tmp).sum()`,
+    where `tmp` is `nw.col('a') * nw.col('b')` evaluated on the whole frame, so that
+    the backend can run all of them in a single native group-by. `aggregations` are
+    the ones which the backend supports natively.
+
+    Filters (e.g. `nw.col('a').filter(nw.col('b') > 0).mean()`) are only supported
+    for aggregations which ignore missing values: `mask_columns(function_name,
+    columns, predicate)` should then hide the rows of the native `columns` where the
+    native `predicate` isn't true, or return `None` if it can't.
+
+    Returns the columns of `df` which the simple aggregations need (`keys` first),
+    the temporary native columns to add to them, and the simple aggregations. Returns
+    `None` if any aggregation can't be rewritten.
+    """
+    plx = df.__narwhals_namespace__()
+    taken_names = list(df.columns)
+    new_columns: dict[str, Any] = {}
+    simple_exprs: list[ArrowOrPandasLikeExpr] = []
+    for expr in exprs:
+        if (
+            is_simple_aggregation(expr)
+            and remove_prefix(expr._function_name, "col->") in aggregations
+        ):
+            simple_exprs.append(expr)
+            continue
+        split = split_aggregation(expr)
+        if split is None or split[0] not in aggregations:
+            return None
+        function_name, kwargs, inner, predicate = split
+        columns = [series._native_series for series in inner(df)]  # type: ignore[arg-type]
+        if any(len(column) != len(df) for column in columns):
+            # e.g. `nw.lit(1).sum()`
+            return None
+        if predicate is not None:
+            if function_name not in NULL_SKIPPING_AGGREGATIONS:
+                return None
+            mask = predicate(df)[0]._native_series  # type: ignore[arg-type]
+            masked = mask_columns(function_name, columns, mask)
+            if masked is None:
+                return None
+            columns = masked
+        for output_name, column in zip(expr._output_names, columns):  # type: ignore[arg-type]
+            name = generate_temporary_column_name(n_bytes=8, columns=taken_names)
+            taken_names.append(name)
+            new_columns[name] = column
+            simple_exprs.append(
+                getattr(plx.col(name), function_name)(**kwargs).alias(output_name)
+            )
+    needed_columns = list(keys)
+    for expr in simple_exprs:
+        needed_columns.extend(
+            name
+            for name in expr._root_names or []
+            if name in df.columns and name not in needed_columns
+        )
+    return needed_columns, new_columns, simple_exprs
+
+
+def with_cse_key(
+    expr: ArrowOrPandasLikeExpr, key: CSEKey | None
+) -> ArrowOrPandasLikeExpr:
+    expr._cse_key = key
+    return expr
+
+
 def maybe_evaluate_expr(
     df: CompliantDataFrame, expr: CompliantExpr[CompliantSeriesT_co] | T
 ) -> Sequence[CompliantSeriesT_co] | T:
@@ -235,7 +587,7 @@ def reuse_series_implementation(
 
     root_names, output_names = infer_new_root_output_names(expr, **kwargs)
 
-    return plx._create_expr_from_callable(  # type: ignore[return-value]
+    result = plx._create_expr_from_callable(
         func,  # type: ignore[arg-type]
         depth=expr._depth + 1,
         function_name=f"{expr._function_name}->{attr}",
@@ -243,6 +595,10 @@ def reuse_series_implementation(
         output_names=output_names,
         kwargs={**expr._kwargs, **kwargs},
     )
+    result._input_expr = expr
+    return with_cse_key(  # type: ignore[return-value]
+        result, make_cse_key(attr, expr, returns_scalar=returns_scalar, **kwargs)
+    )
 
 
 @overload
@@ -272,16 +628,19 @@ def reuse_series_namespace_implementation(
         kwargs: keyword arguments to pass to function.
     """
     plx = expr.__narwhals_namespace__()
-    return plx._create_expr_from_callable(  # type: ignore[return-value]
-        lambda df: [
-            getattr(getattr(series, series_namespace), attr)(**kwargs)
-            for series in expr(df)  # type: ignore[arg-type]
-        ],
-        depth=expr._depth + 1,
-        function_name=f"{expr._function_name}->{series_namespace}.{attr}",
-        root_names=expr._root_names,
-        output_names=expr._output_names,
-        kwargs={**expr._kwargs, **kwargs},
+    return with_cse_key(  # type: ignore[return-value]
+        plx._create_expr_from_callable(
+            lambda df: [
+                getattr(getattr(series, series_namespace), attr)(**kwargs)
+                for series in expr(df)  # type: ignore[arg-type]
+            ],
+            depth=expr._depth + 1,
+            function_name=f"{expr._function_name}->{series_namespace}.{attr}",
+            root_names=expr._root_names,
+            output_names=expr._output_names,
+            kwargs={**expr._kwargs, **kwargs},
+        ),
+        make_cse_key(f"{series_namespace}.{attr}", expr, **kwargs),
     )
 
 
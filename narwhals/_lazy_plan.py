@@ -0,0 +1,973 @@
+# Deferred query plans for backends which only have eager dataframes, such as
+# pandas-like libraries or PyArrow.
+#
+# `LazyPlanFrame.select`, `filter`, `join`, ... only record a step. When the plan is
+# collected, it first gets rewritten by `optimize_plan` (e.g. fusing consecutive
+# steps, or filtering rows as early as possible), and is then run against the
+# backend's eager compliant dataframe.
+from __future__ import annotations
+
+import operator
+from datetime import date
+from decimal import Decimal
+from functools import reduce
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import Literal
+from typing import Sequence
+
+from narwhals._expression_parsing import is_elementwise
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from typing_extensions import Self
+
+    from narwhals.dtypes import DType
+    from narwhals.utils import Implementation
+    from narwhals.utils import Version
+
+
+def _root_names(exprs: Iterable[Any]) -> set[str] | None:
+    """Return the input columns which `exprs` depend on, or `None` if unknown."""
+    names: set[str] = set()
+    for expr in exprs:
+        if isinstance(expr, str):
+            names.add(expr)
+        elif expr._depth == 0 and expr._function_name in {"len", "lit"}:
+            continue
+        elif expr._root_names is None or "over" in expr._function_name.split("->"):
+            # `over` depends on its partition keys, which aren't part of its roots.
+            return None
+        else:
+            names.update(expr._root_names)
+    return names
+
+
+def _output_names(exprs: Iterable[Any], named_exprs: dict[str, Any]) -> set[str] | None:
+    names: set[str] = set(named_exprs)
+    for expr in exprs:
+        if isinstance(expr, str):
+            names.add(expr)
+        elif getattr(expr, "_output_names", None) is not None:
+            names.update(expr._output_names)
+        else:
+            return None
+    return names
+
+
+class PlanNode:
+    """A step of a deferred query plan."""
+
+    @property
+    def inputs(self) -> tuple[PlanNode, ...]:
+        """The nodes whose frames this step consumes."""
+        return ()
+
+    def with_inputs(self, *inputs: PlanNode) -> PlanNode:
+        """Return a copy of this step which consumes `inputs` instead."""
+        return self
+
+    def execute(self, results: dict[int, Any]) -> Any:
+        """Run this step (and its inputs), returning an eager compliant dataframe.
+
+        `results` maps already-executed nodes to their result, so that a node which
+        is shared by several branches of the plan (e.g. in a self-join) only runs once.
+        """
+        node_id = id(self)
+        if node_id not in results:
+            results[node_id] = self._execute(results)
+        return results[node_id]
+
+    def _execute(self, results: dict[int, Any]) -> Any:
+        raise NotImplementedError
+
+
+class SourceNode(PlanNode):
+    """An eager compliant dataframe which the plan starts from."""
+
+    def __init__(self, frame: Any) -> None:
+        self.frame = frame
+
+    def _execute(self, results: dict[int, Any]) -> Any:
+        return self.frame
+
+
+class ScanParquetNode(PlanNode):
+    """A Parquet file which the plan starts from.
+
+    If `columns` is set (see `push_down_projections`), only those columns are read.
+    If `filters` is set (see `push_down_predicates`), row groups and rows which don't
+    satisfy it are skipped while reading.
+    """
+
+    def __init__(
+        self,
+        source: str | Sequence[str],
+        *,
+        native_namespace: ModuleType,
+        implementation: Implementation,
+        backend_version: tuple[int, ...],
+        version: Version,
+        kwargs: dict[str, Any],
+        columns: list[str] | None = None,
+        filters: pc.Expression | None = None,
+    ) -> None:
+        self.source = source
+        self.native_namespace = native_namespace
+        self.implementation = implementation
+        self.backend_version = backend_version
+        self.version = version
+        self.kwargs = kwargs
+        self.columns = columns
+        self.filters = filters
+
+    def file_columns(self) -> list[str] | None:
+        """Return the columns which reading the file would produce, if cheap to know.
+
+        Only the files' footers get read. If `source` refers to several files whose
+        columns differ, then `None` is returned.
+        """
+        if (columns := self.kwargs.get("columns")) is not None:
+            return list(columns)
+        if len(self.kwargs) > int("engine" in self.kwargs):
+            # Other options (e.g. `filesystem`) may change what gets read.
+            return None
+        if (schemas := self._file_schemas()) is None:
+            return None
+        names = [schema.names for schema in schemas]
+        return names[0] if all(name == names[0] for name in names) else None
+
+    def accepts_filters(self, filters: pc.Expression) -> bool:
+        """Whether `filters` can be passed to the reader.
+
+        Only PyArrow's reader is passed filters: pandas' would convert the filtered
+        table, whose dtypes may then differ (e.g. integers without missing values
+        don't become floats). They also need to apply to the files' column types
+        (e.g. a string column can't be compared to an integer).
+        """
+        import pyarrow as pa  # ignore-banned-import
+
+        from narwhals.utils import Implementation
+
+        if (
+            self.implementation is not Implementation.PYARROW
+            or "filters" in self.kwargs
+            or "hive_partitioning" in self.kwargs
+            or (schemas := self._file_schemas()) is None
+        ):
+            return False
+        try:
+            for schema in schemas:
+                schema.empty_table().filter(filters)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return False
+        return True
+
+    def empty_frame(self) -> Any:
+        """Return a frame with the columns and dtypes which reading would produce.
+
+        It has no rows, and only the files' footers get read. Returns `None` if that's
+        not enough: e.g. if several files have different schemas, or with pandas-like
+        readers, whose dtypes depend on the data (integer columns with missing values
+        become floats).
+        """
+        from narwhals.utils import Implementation
+
+        if self.implementation is not Implementation.PYARROW:
+            return None
+        if len(self.kwargs) > int("columns" in self.kwargs):
+            # Other options (e.g. `filesystem`) may change what gets read.
+            return None
+        if (schemas := self._file_schemas()) is None or any(
+            schema != schemas[0] for schema in schemas
+        ):
+            return None
+        table = schemas[0].empty_table()
+        columns = self.kwargs.get("columns") if self.columns is None else self.columns
+        if columns is not None:
+            table = table.select(columns)
+        return self._from_native_frame(table)
+
+    def _file_schemas(self) -> list[pa.Schema] | None:
+        try:
+            import pyarrow.parquet as pq  # ignore-banned-import
+        except ImportError:  # pragma: no cover
+            return None
+        from narwhals._multi_file import expand_paths
+
+        try:
+            return [pq.read_schema(path) for path in expand_paths(self.source)]
+        except (OSError, ValueError, TypeError):
+            # e.g. a directory, a remote path, or a buffer.
+            return None
+
+    def replace(self, **changes: Any) -> ScanParquetNode:
+        params = {"columns": self.columns, "filters": self.filters, **changes}
+        return ScanParquetNode(
+            self.source,
+            native_namespace=self.native_namespace,
+            implementation=self.implementation,
+            backend_version=self.backend_version,
+            version=self.version,
+            kwargs=self.kwargs,
+            **params,
+        )
+
+    def _execute(self, results: dict[int, Any]) -> Any:
+        kwargs = self.kwargs
+        if self.columns is not None:
+            kwargs = {**kwargs, "columns": self.columns}
+        if self.filters is not None:
+            kwargs = {**kwargs, "filters": self.filters}
+        return self._read(kwargs)
+
+    def _read(self, kwargs: dict[str, Any]) -> Any:
+        from narwhals._multi_file import read_multi_file_source
+
+        kwargs = kwargs.copy()
+        hive_partitioning = kwargs.pop("hive_partitioning", False)
+        native_frame = read_multi_file_source(
+            self.source,
+            lambda path: self._read_native(path, kwargs),
+            implementation=self.implementation,
+            hive_partitioning=hive_partitioning,
+        )
+        return self._from_native_frame(native_frame)
+
+    def _from_native_frame(self, native_frame: Any) -> Any:
+        from narwhals.utils import Implementation
+
+        if self.implementation is Implementation.PYARROW:
+            from narwhals._arrow.dataframe import ArrowDataFrame
+
+            return ArrowDataFrame(
+                native_frame,
+                backend_version=self.backend_version,
+                version=self.version,
+            )
+        from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+
+        return PandasLikeDataFrame(
+            native_frame,
+            implementation=self.implementation,
+            backend_version=self.backend_version,
+            version=self.version,
+        )
+
+    def _read_native(self, path: str, kwargs: dict[str, Any]) -> Any:
+        from narwhals.utils import Implementation
+
+        if self.implementation is Implementation.PYARROW:
+            import pyarrow.parquet as pq  # ignore-banned-import
+
+            return pq.read_table(path, **kwargs)
+        return self.native_namespace.read_parquet(path, **kwargs)
+
+
+class StepNode(PlanNode):
+    """A deferred call to `method` on the frame produced by `parent`.
+
+    If `others` is non-empty (e.g. for joins), the frames they produce are passed
+    as the first positional arguments.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        parent: PlanNode,
+        *args: Any,
+        others: Sequence[PlanNode] = (),
+        **kwargs: Any,
+    ) -> None:
+        self.method = method
+        self.parent = parent
+        self.args = args
+        self.others = tuple(others)
+        self.kwargs = kwargs
+
+    @property
+    def inputs(self) -> tuple[PlanNode, ...]:
+        return (self.parent, *self.others)
+
+    def with_inputs(self, *inputs: PlanNode) -> StepNode:
+        parent, *others = inputs
+        return StepNode(self.method, parent, *self.args, others=others, **self.kwargs)
+
+    def replace(
+        self,
+        *,
+        parent: PlanNode | None = None,
+        args: tuple[Any, ...] | None = None,
+        **kwargs: Any,
+    ) -> StepNode:
+        return StepNode(
+            self.method,
+            self.parent if parent is None else parent,
+            *(self.args if args is None else args),
+            others=self.others,
+            **{**self.kwargs, **kwargs},
+        )
+
+    def _execute(self, results: dict[int, Any]) -> Any:
+        frame = self.parent.execute(results)
+        others = [other.execute(results) for other in self.others]
+        return getattr(frame, self.method)(*others, *self.args, **self.kwargs)
+
+
+class GroupByAggNode(PlanNode):
+    """A deferred `group_by(*keys).agg(*aggs, **named_aggs)`."""
+
+    def __init__(
+        self,
+        parent: PlanNode,
+        keys: Sequence[str],
+        *,
+        drop_null_keys: bool,
+        aggs: Sequence[Any],
+        named_aggs: dict[str, Any],
+    ) -> None:
+        self.parent = parent
+        self.keys = keys
+        self.drop_null_keys = drop_null_keys
+        self.aggs = aggs
+        self.named_aggs = named_aggs
+
+    @property
+    def inputs(self) -> tuple[PlanNode, ...]:
+        return (self.parent,)
+
+    def with_inputs(self, *inputs: PlanNode) -> GroupByAggNode:
+        (parent,) = inputs
+        return GroupByAggNode(
+            parent,
+            self.keys,
+            drop_null_keys=self.drop_null_keys,
+            aggs=self.aggs,
+            named_aggs=self.named_aggs,
+        )
+
+    def _execute(self, results: dict[int, Any]) -> Any:
+        frame = self.parent.execute(results)
+        return frame.group_by(*self.keys, drop_null_keys=self.drop_null_keys).agg(
+            *self.aggs, **self.named_aggs
+        )
+
+
+def optimize_plan(node: PlanNode) -> PlanNode:
+    """Rewrite `node` into an equivalent plan which is cheaper to run.
+
+    The following rewrites are applied, bottom-up:
+
+    - consecutive `with_columns` steps which don't depend on each other are fused,
+      so that the frame only gets rebuilt once (and common sub-expressions between
+      them are shared);
+    - consecutive `filter` steps with elementwise predicates are fused, so that only
+      one boolean mask gets built and applied;
+    - elementwise filters are moved before `with_columns` and `sort` steps which
+      they don't depend on, so that those steps process fewer rows.
+
+    Then, file scans skip rows which get filtered out straight away (see
+    `push_down_predicates`), and only read the columns which the rest of the plan
+    needs (see `push_down_projections`).
+    """
+    return push_down_projections(push_down_predicates(_rewrite_plan(node, {})))
+
+
+def _rewrite_plan(node: PlanNode, optimized: dict[int, PlanNode]) -> PlanNode:
+    node_id = id(node)
+    if node_id not in optimized:
+        result = node.with_inputs(
+            *(_rewrite_plan(child, optimized) for child in node.inputs)
+        )
+        if isinstance(result, StepNode):
+            result = _rewrite(result)
+        optimized[node_id] = result
+    return optimized[node_id]
+
+
+def _rewrite(node: StepNode) -> PlanNode:
+    child = node.parent
+    if not isinstance(child, StepNode) or child.others:
+        return node
+    if node.method == "with_columns" and child.method == "with_columns":
+        child_outputs = _output_names(child.args, child.kwargs)
+        outputs = _output_names(node.args, node.kwargs)
+        roots = _root_names([*node.args, *node.kwargs.values()])
+        if (
+            child_outputs is not None
+            and outputs is not None
+            and roots is not None
+            and not child_outputs & (outputs | roots)
+        ):
+            return child.replace(args=(*child.args, *node.args), **node.kwargs)
+    if node.method == "filter" and _is_elementwise_filter(node):
+        if child.method == "filter" and _is_elementwise_filter(child):
+            return child.replace(args=(*child.args, *node.args))
+        elif child.method == "sort":
+            return child.replace(parent=_rewrite(node.replace(parent=child.parent)))
+        elif child.method == "with_columns" and all(
+            is_elementwise(expr) for expr in [*child.args, *child.kwargs.values()]
+        ):
+            child_outputs = _output_names(child.args, child.kwargs)
+            roots = _root_names(node.args)
+            if (
+                child_outputs is not None
+                and roots is not None
+                and not child_outputs & roots
+            ):
+                return child.replace(parent=_rewrite(node.replace(parent=child.parent)))
+    return node
+
+
+def _is_elementwise_filter(node: StepNode) -> bool:
+    # `filter` also accepts a list of booleans, which is tied to the input rows, and
+    # constraints, whose values may be too.
+    return not node.kwargs and all(is_elementwise(predicate) for predicate in node.args)
+
+
+def push_down_predicates(plan: PlanNode) -> PlanNode:
+    """Pass filters which directly follow a file scan on to the Parquet reader.
+
+    This lets the reader skip row groups whose statistics rule them out, without
+    decoding them. Only predicates which can be translated into PyArrow filter
+    expressions (see `to_arrow_filter`) are passed on. The `filter` step itself is
+    kept, so that the result doesn't depend on how exactly the reader applies them.
+    """
+    consumers: dict[int, int] = {}
+    seen: set[int] = set()
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        for child in node.inputs:
+            consumers[id(child)] = consumers.get(id(child), 0) + 1
+            stack.append(child)
+    replaced: dict[int, PlanNode] = {}
+
+    def push(node: PlanNode) -> PlanNode:
+        node_id = id(node)
+        if node_id not in replaced:
+            scan = node.inputs[0] if node.inputs else None
+            if (
+                isinstance(node, StepNode)
+                and node.method == "filter"
+                and isinstance(scan, ScanParquetNode)
+                and consumers[id(scan)] == 1
+                and scan.filters is None
+                and (filters := _predicates_to_arrow_filter(node)) is not None
+                and scan.accepts_filters(filters)
+            ):
+                node = node.replace(parent=scan.replace(filters=filters))
+            elif node.inputs:
+                node = node.with_inputs(*(push(child) for child in node.inputs))
+            replaced[node_id] = node
+        return replaced[node_id]
+
+    return push(plan)
+
+
+def _predicates_to_arrow_filter(node: StepNode) -> pc.Expression | None:
+    predicates = node.args
+    if len(predicates) == 1 and isinstance(predicates[0], list):
+        return None
+    filters = [
+        to_arrow_filter(key)
+        for predicate in predicates
+        if (key := getattr(predicate, "_cse_key", None)) is not None
+    ]
+    filters.extend(
+        _field(name) == value
+        for name, value in node.kwargs.items()
+        if _is_plain_value(value)
+    )
+    pushed = [arrow_filter for arrow_filter in filters if arrow_filter is not None]
+    return reduce(operator.and_, pushed) if pushed else None
+
+
+def _field(name: str) -> pc.Expression:
+    import pyarrow.compute as pc
+
+    return pc.field(name)
+
+
+def _is_plain_value(value: Any) -> bool:
+    return isinstance(value, (bool, int, float, str, date, Decimal))
+
+
+_COMPARISONS = {
+    "__eq__": operator.eq,
+    "__ne__": operator.ne,
+    "__ge__": operator.ge,
+    "__gt__": operator.gt,
+    "__le__": operator.le,
+    "__lt__": operator.lt,
+}
+
+_IS_BETWEEN_OPERATORS = {
+    "both": (operator.ge, operator.le),
+    "left": (operator.ge, operator.lt),
+    "right": (operator.gt, operator.le),
+    "none": (operator.gt, operator.lt),
+}
+
+
+def to_arrow_filter(key: Any) -> pc.Expression | None:
+    """Translate the structural key of a predicate into a PyArrow filter expression.
+
+    Returns `None` if the predicate (or, for `&`, both of its sides) can't be
+    translated. The translation keeps at least all the rows which the predicate
+    keeps.
+    """
+    name, params, children = key
+    params = dict(params)
+    if name in _COMPARISONS:
+        lhs = _to_arrow_operand(children[0])
+        rhs = _to_arrow_operand_param(params["other"], children)
+        if lhs is None or rhs is None:
+            return None
+        return _COMPARISONS[name](lhs, rhs)  # type: ignore[no-any-return]
+    if name in {"__and__", "__or__"}:
+        if params["other"] != "expr":
+            return None
+        lhs = to_arrow_filter(children[0])
+        rhs = to_arrow_filter(children[1])
+        if name == "__or__":
+            return None if lhs is None or rhs is None else lhs | rhs
+        # Keeping more rows than `&` would is fine, the filter is applied again.
+        if lhs is None or rhs is None:
+            return lhs if rhs is None else rhs
+        return lhs & rhs  # type: ignore[no-any-return]
+    if name == "__invert__":
+        operand = to_arrow_filter(children[0])
+        return None if operand is None else ~operand
+    if name == "is_between":
+        operand = _to_arrow_operand(children[0])
+        lower_bound = _to_arrow_operand_param(params["lower_bound"], children)
+        upper_bound = _to_arrow_operand_param(params["upper_bound"], children)
+        if operand is None or lower_bound is None or upper_bound is None:
+            return None
+        lower, upper = _IS_BETWEEN_OPERATORS[params["closed"][2]]
+        return lower(operand, lower_bound) & upper(operand, upper_bound)  # type: ignore[no-any-return]
+    if name == "is_in":
+        operand = _to_arrow_operand(children[0])
+        if operand is None or params["other"] == "expr":
+            return None
+        values = params["other"][2]
+        if not isinstance(values, tuple) or not all(
+            _is_plain_value(value) or value is None for value in values
+        ):
+            return None
+        return operand.isin(list(values))
+    if name == "is_null":
+        operand = _to_arrow_operand(children[0])
+        return None if operand is None else operand.is_null()
+    return None
+
+
+def _to_arrow_operand(key: Any) -> pc.Expression | None:
+    name, params, _ = key
+    params = dict(params)
+    if name == "col" and len(names := params["names"][2]) == 1:
+        return _field(names[0])
+    return None
+
+
+def _to_arrow_operand_param(param: Any, children: Sequence[Any]) -> Any:
+    # Non-expression parameters are stored as `(type, repr, value)`, expression ones
+    # as `"expr"`, in which case the (single) expression is the last child.
+    if param == "expr":
+        return _to_arrow_operand(children[-1]) if len(children) == 2 else None
+    value = param[2]
+    return value if _is_plain_value(value) else None
+
+
+def push_down_projections(plan: PlanNode) -> PlanNode:
+    """Make file scans in `plan` only read the columns which are needed downstream.
+
+    Requirements are propagated from the output of the plan (which needs all of its
+    columns) towards the scans. Whenever they can't be worked out (e.g. because of
+    `nw.all()`), all columns get read.
+    """
+    required: dict[int, set[str] | None] = {}
+    _collect_required_columns(plan, None, required)
+    replaced: dict[int, PlanNode] = {}
+
+    def prune(node: PlanNode) -> PlanNode:
+        node_id = id(node)
+        if node_id not in replaced:
+            if isinstance(node, ScanParquetNode):
+                columns = required[node_id]
+                file_columns = None if columns is None else node.file_columns()
+                if columns is not None and file_columns is not None:
+                    node = node.replace(
+                        columns=[name for name in file_columns if name in columns]
+                    )
+            elif node.inputs:
+                node = node.with_inputs(*(prune(child) for child in node.inputs))
+            replaced[node_id] = node
+        return replaced[node_id]
+
+    return prune(plan)
+
+
+def _collect_required_columns(
+    node: PlanNode,
+    columns: set[str] | None,
+    required: dict[int, set[str] | None],
+) -> None:
+    # Accumulate, for each scan, the union of the columns which its consumers need.
+    if isinstance(node, ScanParquetNode):
+        node_id = id(node)
+        if node_id not in required:
+            required[node_id] = columns
+        elif (previous := required[node_id]) is not None and columns is not None:
+            required[node_id] = previous | columns
+        else:
+            required[node_id] = None
+    elif isinstance(node, GroupByAggNode):
+        roots = _root_names([*node.aggs, *node.named_aggs.values()])
+        _collect_required_columns(
+            node.parent, None if roots is None else roots | set(node.keys), required
+        )
+    elif isinstance(node, StepNode):
+        for child, child_columns in zip(node.inputs, _required_by_step(node, columns)):
+            _collect_required_columns(child, child_columns, required)
+
+
+def _names(columns: str | Iterable[str] | None) -> set[str]:
+    if columns is None:
+        return set()
+    return {columns} if isinstance(columns, str) else set(columns)
+
+
+def _required_by_step(
+    node: StepNode, columns: set[str] | None
+) -> tuple[set[str] | None, ...]:
+    """Return which columns each input of `node` needs to produce `columns`."""
+    method, args, kwargs = node.method, node.args, node.kwargs
+    if method == "select":
+        return (_root_names([*args, *kwargs.values()]),)
+    if method == "join":
+        keys = (_names(kwargs["left_on"]), _names(kwargs["right_on"]))
+        if kwargs["how"] in {"anti", "semi"}:
+            return (None if columns is None else columns | keys[0], keys[1])
+        if columns is None:
+            return (None, None)
+        # Any required column may come from either side, possibly with a suffix if
+        # both sides have it.
+        suffix = kwargs["suffix"]
+        names = columns | {
+            name[: -len(suffix)] for name in columns if suffix and name.endswith(suffix)
+        }
+        return (names | keys[0], names | keys[1])
+    if columns is None:
+        return (None,) * len(node.inputs)
+    if method == "with_columns":
+        outputs = _output_names(args, kwargs)
+        roots = _root_names([*args, *kwargs.values()])
+        if outputs is None or roots is None:
+            return (None,)
+        return ((columns - outputs) | roots,)
+    if method == "filter":
+        if len(args) == 1 and isinstance(args[0], list):
+            return (columns,)
+        roots = _root_names(args)
+        return (None if roots is None else columns | roots | set(kwargs),)
+    if method == "sort":
+        return (columns.union(*(_names(by) for by in args)),)
+    if method == "rename":
+        inverse = {new: old for old, new in args[0].items()}
+        return ({inverse.get(name, name) for name in columns},)
+    if method == "drop":
+        return (columns | _names(args[0]) if kwargs["strict"] else columns,)
+    if method in {"drop_nulls", "unique"}:
+        subset = kwargs["subset"] if method == "drop_nulls" else args[0]
+        return (None if subset is None else columns | _names(subset),)
+    if method == "with_row_index":
+        return (columns - {args[0]},)
+    if method == "explode":
+        return (columns.union(*(_names(name) for name in args)),)
+    if method in {"head", "tail", "gather_every", "clone"}:
+        return (columns,)
+    return (None,) * len(node.inputs)
+
+
+def empty_plan(plan: PlanNode) -> PlanNode:
+    """Replace the sources of `plan` with frames which have the same schema but no rows.
+
+    Running the result then gives the schema of `plan`'s output without computing it.
+    Scans whose schema can't be known from the files' footers still get read (only
+    the columns which are needed), and the rest of the plan runs on none of the rows.
+    """
+    replaced: dict[int, PlanNode] = {}
+
+    def empty(node: PlanNode) -> PlanNode:
+        node_id = id(node)
+        if node_id not in replaced:
+            if isinstance(node, SourceNode):
+                node = SourceNode(node.frame.head(0))
+            elif isinstance(node, ScanParquetNode):
+                frame = node.empty_frame()
+                node = StepNode("head", node, 0) if frame is None else SourceNode(frame)
+            elif node.inputs:
+                node = node.with_inputs(*(empty(child) for child in node.inputs))
+            replaced[node_id] = node
+        return replaced[node_id]
+
+    return empty(plan)
+
+
+class LazyPlanFrame:
+    """Compliant lazy frame for backends which only have eager dataframes.
+
+    Operations are recorded into a plan (see `PlanNode`) and only get run, after
+    optimisation, when the frame is collected.
+    """
+
+    def __init__(
+        self,
+        plan: PlanNode,
+        *,
+        implementation: Implementation,
+        backend_version: tuple[int, ...],
+        version: Version,
+    ) -> None:
+        self._plan = plan
+        self._implementation = implementation
+        self._backend_version = backend_version
+        self._version = version
+        self._collected: Any = None
+        self._collected_empty: Any = None
+
+    @classmethod
+    def from_compliant_frame(cls: type[Self], frame: Any) -> Self:
+        return cls(
+            SourceNode(frame),
+            implementation=frame._implementation,
+            backend_version=frame._backend_version,
+            version=frame._version,
+        )
+
+    def __narwhals_lazyframe__(self: Self) -> Self:
+        return self
+
+    def __narwhals_namespace__(self: Self) -> Any:
+        from narwhals.utils import Implementation
+
+        if self._implementation is Implementation.PYARROW:
+            from narwhals._arrow.namespace import ArrowNamespace
+
+            return ArrowNamespace(
+                backend_version=self._backend_version, version=self._version
+            )
+        from narwhals._pandas_like.namespace import PandasLikeNamespace
+
+        return PandasLikeNamespace(
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+            version=self._version,
+        )
+
+    def __native_namespace__(self: Self) -> ModuleType:
+        return self._implementation.to_native_namespace()
+
+    @property
+    def _native_frame(self: Self) -> Any:
+        return self.collect()._native_frame
+
+    def _change_version(self: Self, version: Version) -> Self:
+        return self.__class__(
+            self._plan,
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+            version=version,
+        )
+
+    def _from_native_frame(self: Self, df: Any) -> Self:
+        return self.from_compliant_frame(self.collect()._from_native_frame(df))
+
+    def _with_step(self: Self, method: str, *args: Any, **kwargs: Any) -> Self:
+        return self.__class__(
+            StepNode(method, self._plan, *args, **kwargs),
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+            version=self._version,
+        )
+
+    def _to_plan(self: Self, other: Any) -> PlanNode:
+        if isinstance(other, LazyPlanFrame):
+            return other._plan
+        return SourceNode(other)
+
+    # --- convert ---
+    def collect(self: Self) -> Any:
+        if self._collected is None:
+            self._collected = self._execute(optimize_plan(self._plan))
+        return self._collected
+
+    def _collect_empty(self: Self) -> Any:
+        """Return a frame with the schema which `collect` would produce, but no rows."""
+        if self._collected is not None:
+            return self._collected
+        if self._collected_empty is None:
+            self._collected_empty = self._execute(empty_plan(optimize_plan(self._plan)))
+        return self._collected_empty
+
+    def _execute(self: Self, plan: PlanNode) -> Any:
+        df = plan.execute({})
+        if df._version is not self._version:
+            df = df._change_version(self._version)
+        return df
+
+    def lazy(self: Self) -> Self:
+        return self
+
+    # --- properties ---
+    @property
+    def columns(self: Self) -> list[str]:
+        return self._collect_empty().columns  # type: ignore[no-any-return]
+
+    @property
+    def schema(self: Self) -> dict[str, DType]:
+        return self._collect_empty().schema  # type: ignore[no-any-return]
+
+    def collect_schema(self: Self) -> dict[str, DType]:
+        return self.schema
+
+    # --- reshape ---
+    def select(self: Self, *exprs: Any, **named_exprs: Any) -> Self:
+        return self._with_step("select", *exprs, **named_exprs)
+
+    def with_columns(self: Self, *exprs: Any, **named_exprs: Any) -> Self:
+        return self._with_step("with_columns", *exprs, **named_exprs)
+
+    def filter(self: Self, *predicates: Any, **constraints: Any) -> Self:
+        return self._with_step("filter", *predicates, **constraints)
+
+    def rename(self: Self, mapping: dict[str, str]) -> Self:
+        return self._with_step("rename", mapping)
+
+    def drop(self: Self, columns: list[str], strict: bool) -> Self:  # noqa: FBT001
+        return self._with_step("drop", columns, strict=strict)
+
+    def drop_nulls(self: Self, subset: str | list[str] | None) -> Self:
+        return self._with_step("drop_nulls", subset=subset)
+
+    def with_row_index(self: Self, name: str) -> Self:
+        return self._with_step("with_row_index", name)
+
+    def unpivot(
+        self: Self,
+        on: str | list[str] | None,
+        index: str | list[str] | None,
+        variable_name: str | None,
+        value_name: str | None,
+    ) -> Self:
+        return self._with_step(
+            "unpivot",
+            on=on,
+            index=index,
+            variable_name=variable_name,
+            value_name=value_name,
+        )
+
+    def explode(self: Self, columns: str | Sequence[str], *more_columns: str) -> Self:
+        return self._with_step("explode", columns, *more_columns)
+
+    # --- transform ---
+    def sort(
+        self: Self,
+        by: str | Iterable[str],
+        *more_by: str,
+        descending: bool | Sequence[bool],
+        nulls_last: bool,
+    ) -> Self:
+        return self._with_step(
+            "sort", by, *more_by, descending=descending, nulls_last=nulls_last
+        )
+
+    def join(
+        self: Self,
+        other: Any,
+        *,
+        how: Literal["left", "inner", "cross", "anti", "semi"],
+        left_on: str | list[str] | None,
+        right_on: str | list[str] | None,
+        suffix: str,
+    ) -> Self:
+        return self.__class__(
+            StepNode(
+                "join",
+                self._plan,
+                others=[self._to_plan(other)],
+                how=how,
+                left_on=left_on,
+                right_on=right_on,
+                suffix=suffix,
+            ),
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+            version=self._version,
+        )
+
+    def join_asof(self: Self, other: Any, **kwargs: Any) -> Self:
+        return self.__class__(
+            StepNode("join_asof", self._plan, others=[self._to_plan(other)], **kwargs),
+            implementation=self._implementation,
+            backend_version=self._backend_version,
+            version=self._version,
+        )
+
+    def group_by(self: Self, *keys: str, drop_null_keys: bool) -> LazyPlanGroupBy:
+        return LazyPlanGroupBy(self, list(keys), drop_null_keys=drop_null_keys)
+
+    # --- partial reduction ---
+    def head(self: Self, n: int) -> Self:
+        return self._with_step("head", n)
+
+    def tail(self: Self, n: int) -> Self:
+        return self._with_step("tail", n)
+
+    def gather_every(self: Self, n: int, offset: int = 0) -> Self:
+        return self._with_step("gather_every", n=n, offset=offset)
+
+    def unique(
+        self: Self,
+        subset: list[str] | None,
+        *,
+        keep: Literal["any", "first", "last", "none"],
+        maintain_order: bool = False,
+    ) -> Self:
+        return self._with_step("unique", subset, keep=keep, maintain_order=maintain_order)
+
+    def clone(self: Self) -> Self:
+        return self._with_step("clone")
+
+
+class LazyPlanGroupBy:
+    def __init__(
+        self, df: LazyPlanFrame, keys: list[str], *, drop_null_keys: bool
+    ) -> None:
+        self._df = df
+        self._keys = keys
+        self._drop_null_keys = drop_null_keys
+
+    def agg(self, *aggs: Any, **named_aggs: Any) -> LazyPlanFrame:
+        return LazyPlanFrame(
+            GroupByAggNode(
+                self._df._plan,
+                self._keys,
+                drop_null_keys=self._drop_null_keys,
+                aggs=aggs,
+                named_aggs=named_aggs,
+            ),
+            implementation=self._df._implementation,
+            backend_version=self._df._backend_version,
+            version=self._df._version,
+        )
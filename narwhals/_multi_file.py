@@ -0,0 +1,128 @@
+# Reading several files (e.g. the daily partitions of a dataset) into a single frame,
+# for backends whose readers only accept one path at a time.
+#
+# Files are read concurrently on a thread pool (the native readers release the GIL
+# while parsing) and then concatenated, unifying their schemas.
+from __future__ import annotations
+
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Sequence
+from urllib.parse import unquote
+
+from narwhals.utils import Implementation
+from narwhals.utils import parse_version
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+def is_multi_file_source(source: str | Sequence[str]) -> bool:
+    """Whether `source` is a list of paths or a glob pattern, rather than one path."""
+    return not isinstance(source, str) or _is_glob(source)
+
+
+def _is_glob(path: str) -> bool:
+    # Paths which exist (e.g. `data[1].csv`) and URLs (e.g. with a `?token=...` query)
+    # are read as they are, even if they contain glob characters.
+    return glob.has_magic(path) and "://" not in path and not os.path.exists(path)  # noqa: PTH110
+
+
+def expand_paths(source: str | Sequence[str]) -> list[str]:
+    """Return the files which `source` refers to, expanding glob patterns."""
+    paths: list[str] = []
+    for path in [source] if isinstance(source, str) else source:
+        if not _is_glob(path):
+            paths.append(path)
+            continue
+        # `Path.glob` only accepts patterns relative to a directory.
+        if not (matches := sorted(glob.glob(path, recursive=True))):  # noqa: PTH207
+            msg = f"No files match the pattern: {path!r}"
+            raise FileNotFoundError(msg)
+        paths.extend(matches)
+    if not paths:
+        msg = "Expected at least one path to read from, got an empty list."
+        raise ValueError(msg)
+    return paths
+
+
+def hive_partitions(path: str) -> dict[str, str]:
+    """Return the `key=value` directories in `path`, e.g. `{"date": "2024-01-01"}`."""
+    partitions: dict[str, str] = {}
+    for directory in PurePath(path).parent.parts:
+        if "=" in directory:
+            key, value = directory.split("=", 1)
+            partitions[unquote(key)] = unquote(value)
+    return partitions
+
+
+def read_paths(paths: Sequence[str], read: Callable[[str], Any]) -> list[Any]:
+    """Read each of `paths` with `read`, concurrently, preserving their order."""
+    if len(paths) == 1:
+        return [read(paths[0])]
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(read, paths))
+
+
+def read_multi_file_source(
+    source: str | Sequence[str],
+    read: Callable[[str], Any],
+    *,
+    implementation: Implementation,
+    hive_partitioning: bool = False,
+) -> Any:
+    """Read all the files which `source` refers to into a single native frame.
+
+    `read` reads a single file into a native frame. Columns which only some files
+    have are filled with nulls for the others. If `hive_partitioning` is set, the
+    `key=value` directories of each path are added as string columns.
+    """
+    paths = expand_paths(source)
+    frames = read_paths(paths, read)
+    native_namespace = implementation.to_native_namespace()
+    if hive_partitioning:
+        frames = [
+            _with_constant_columns(
+                frame, hive_partitions(path), implementation, native_namespace
+            )
+            for frame, path in zip(frames, paths)
+        ]
+    if len(frames) == 1:
+        return frames[0]
+    if implementation is Implementation.PYARROW:
+        if parse_version(native_namespace.__version__) >= (14,):
+            # Chunks are reused as they are, only the schemas get unified.
+            return native_namespace.concat_tables(frames, promote_options="permissive")
+        return native_namespace.concat_tables(frames, promote=True)  # pragma: no cover
+    if implementation is Implementation.POLARS:
+        return native_namespace.concat(frames, how="diagonal_relaxed")
+    return native_namespace.concat(frames, ignore_index=True)
+
+
+def _with_constant_columns(
+    frame: Any,
+    columns: dict[str, str],
+    implementation: Implementation,
+    native_namespace: ModuleType,
+) -> Any:
+    if implementation is Implementation.PYARROW:
+        for name, value in columns.items():
+            column = native_namespace.array(
+                [value] * len(frame), native_namespace.string()
+            )
+            if name in frame.column_names:
+                # e.g. PyArrow itself already read it as a dictionary-encoded column.
+                frame = frame.set_column(frame.column_names.index(name), name, column)
+            else:
+                frame = frame.append_column(name, column)
+        return frame
+    if implementation is Implementation.POLARS:
+        return frame.with_columns(
+            native_namespace.lit(value).alias(name) for name, value in columns.items()
+        )
+    return frame.assign(**columns)
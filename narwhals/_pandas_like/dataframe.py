@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import warnings
 from itertools import chain
 from typing import TYPE_CHECKING
 from typing import Any
@@ -15,6 +16,7 @@ from narwhals._pandas_like.utils import convert_str_slice_to_int_slice
 from narwhals._pandas_like.utils import create_compliant_series
 from narwhals._pandas_like.utils import horizontal_concat
 from narwhals._pandas_like.utils import native_to_narwhals_dtype
+from narwhals._pandas_like.utils import non_object_native_dtype_to_narwhals_dtype
 from narwhals._pandas_like.utils import pivot_table
 from narwhals._pandas_like.utils import rename
 from narwhals._pandas_like.utils import select_columns_by_name
@@ -23,7 +25,6 @@ from narwhals.dependencies import is_numpy_array
 from narwhals.utils import Implementation
 from narwhals.utils import check_column_exists
 from narwhals.utils import flatten
-from narwhals.utils import generate_temporary_column_name
 from narwhals.utils import import_dtypes_module
 from narwhals.utils import is_sequence_but_not_str
 from narwhals.utils import parse_columns_to_drop
@@ -38,6 +39,7 @@ if TYPE_CHECKING:
     import polars as pl
     from typing_extensions import Self
 
+    from narwhals._lazy_plan import LazyPlanFrame
     from narwhals._pandas_like.group_by import PandasLikeGroupBy
     from narwhals._pandas_like.namespace import PandasLikeNamespace
     from narwhals._pandas_like.series import PandasLikeSeries
@@ -94,9 +96,17 @@ class PandasLikeDataFrame:
     def _validate_columns(self, columns: pd.Index) -> None:
         try:
             len_unique_columns = len(columns.drop_duplicates())
-        except Exception:  # noqa: BLE001  # pragma: no cover
-            msg = f"Expected hashable (e.g. str or int) column names, got: {columns}"
-            raise ValueError(msg) from None
+        except Exception:  # noqa: BLE001
+            # Unhashable column names (e.g. lists) can still be compared for equality.
+            unique_columns: list[Any] = []
+            try:
+                for column in columns:
+                    if column not in unique_columns:
+                        unique_columns.append(column)
+            except Exception:  # noqa: BLE001  # pragma: no cover
+                msg = f"Expected hashable (e.g. str or int) column names, got: {columns}"
+                raise ValueError(msg) from None
+            len_unique_columns = len(unique_columns)
 
         if len(columns) != len_unique_columns:
             from collections import Counter
@@ -332,11 +342,18 @@ class PandasLikeDataFrame:
 
     @property
     def schema(self) -> dict[str, DType]:
+        # Not cached: the native frame may be the user's own object, which they can
+        # modify in-place. Converting the dtypes themselves is memoised, though.
+        native_frame = self._native_frame
         return {
             col: native_to_narwhals_dtype(
-                self._native_frame[col], self._version, self._implementation
+                native_frame[col], self._version, self._implementation
             )
-            for col in self._native_frame.columns
+            if native_dtype == "object"
+            else non_object_native_dtype_to_narwhals_dtype(
+                native_dtype, self._version, self._implementation
+            )
+            for col, native_dtype in native_frame.dtypes.items()
         }
 
     def collect_schema(self) -> dict[str, DType]:
@@ -431,6 +448,23 @@ class PandasLikeDataFrame:
         if not new_columns and len(self) == 0:
             return self
 
+        if self._implementation is Implementation.PANDAS and (
+            self._backend_version >= (2,)
+        ):
+            # Assign into a shallow copy: only the new columns are inserted or
+            # replaced, and the blocks of the untouched columns are left in place.
+            # `__setitem__` never writes into the existing (shared) arrays here.
+            df = self._native_frame.copy(deep=False)
+            with warnings.catch_warnings():
+                # Inserting many columns one by one fragments the frame, which pandas
+                # consolidates lazily when it needs to.
+                warnings.filterwarnings(
+                    "ignore", message=".*DataFrame is highly fragmented", category=Warning
+                )
+                for s in new_columns:
+                    df[s.name] = validate_dataframe_comparand(index, s)
+            return self._from_native_frame(df)
+
         new_column_name_to_new_column_map = {s.name: s for s in new_columns}
         to_concat = []
         # Make sure to preserve column order
@@ -530,21 +564,27 @@ class PandasLikeDataFrame:
                 self._implementation is Implementation.PANDAS
                 and self._backend_version < (1, 4)
             ):
-                key_token = generate_temporary_column_name(
-                    n_bytes=8, columns=[*self.columns, *other.columns]
-                )
-
-                return self._from_native_frame(
-                    self._native_frame.assign(**{key_token: 0})
-                    .merge(
-                        other._native_frame.assign(**{key_token: 0}),
-                        how="inner",
-                        left_on=key_token,
-                        right_on=key_token,
-                        suffixes=("", suffix),
+                import numpy as np  # ignore-banned-import
+
+                # Build the cartesian product directly from row positions: each
+                # left row is repeated once per right row, and `other` is tiled.
+                n_left, n_right = len(self), len(other)
+                left = self._native_frame.take(
+                    np.repeat(np.arange(n_left), n_right)
+                ).reset_index(drop=True)
+                right = (
+                    other._native_frame.take(np.tile(np.arange(n_right), n_left))
+                    .reset_index(drop=True)
+                    .rename(
+                        columns={
+                            name: f"{name}{suffix}"
+                            for name in other.columns
+                            if name in self.columns
+                        }
                     )
-                    .drop(columns=key_token),
                 )
+                # Both sides share the same default index, so this aligns by position.
+                return self._from_native_frame(left.join(right))
             else:
                 return self._from_native_frame(
                     self._native_frame.merge(
@@ -554,73 +594,22 @@ class PandasLikeDataFrame:
                     ),
                 )
 
-        if how == "anti":
+        if how in {"anti", "semi"}:
+            if right_on is None:  # pragma: no cover
+                msg = f"`right_on` cannot be `None` in {how}-join"
+                raise TypeError(msg)
             if self._implementation is Implementation.CUDF:
                 return self._from_native_frame(
                     self._native_frame.merge(
                         other._native_frame,
-                        how="leftanti",
+                        how=f"left{how}",
                         left_on=left_on,
                         right_on=right_on,
                     )
                 )
-            else:
-                indicator_token = generate_temporary_column_name(
-                    n_bytes=8, columns=[*self.columns, *other.columns]
-                )
-                if right_on is None:  # pragma: no cover
-                    msg = "`right_on` cannot be `None` in anti-join"
-                    raise TypeError(msg)
-
-                # rename to avoid creating extra columns in join
-                other_native = rename(
-                    select_columns_by_name(
-                        other._native_frame,
-                        right_on,
-                        self._backend_version,
-                        self._implementation,
-                    ),
-                    columns=dict(zip(right_on, left_on)),  # type: ignore[arg-type]
-                    implementation=self._implementation,
-                    backend_version=self._backend_version,
-                ).drop_duplicates()
-                return self._from_native_frame(
-                    self._native_frame.merge(
-                        other_native,
-                        how="outer",
-                        indicator=indicator_token,
-                        left_on=left_on,
-                        right_on=left_on,
-                    )
-                    .loc[lambda t: t[indicator_token] == "left_only"]
-                    .drop(columns=indicator_token)
-                )
-
-        if how == "semi":
-            if right_on is None:  # pragma: no cover
-                msg = "`right_on` cannot be `None` in semi-join"
-                raise TypeError(msg)
-            # rename to avoid creating extra columns in join
-            other_native = (
-                rename(
-                    select_columns_by_name(
-                        other._native_frame,
-                        right_on,
-                        self._backend_version,
-                        self._implementation,
-                    ),
-                    columns=dict(zip(right_on, left_on)),  # type: ignore[arg-type]
-                    implementation=self._implementation,
-                    backend_version=self._backend_version,
-                ).drop_duplicates()  # avoids potential rows duplication from inner join
-            )
+            mask = self._join_membership_mask(other, left_on, right_on)  # type: ignore[arg-type]
             return self._from_native_frame(
-                self._native_frame.merge(
-                    other_native,
-                    how="inner",
-                    left_on=left_on,
-                    right_on=left_on,
-                )
+                self._native_frame.loc[~mask if how == "anti" else mask]
             )
 
         if how == "left":
@@ -650,6 +639,33 @@ class PandasLikeDataFrame:
             ),
         )
 
+    def _join_membership_mask(
+        self, other: Self, left_on: list[str], right_on: list[str]
+    ) -> Any:
+        """Boolean mask of the rows whose `left_on` keys appear in `other`'s `right_on`.
+
+        This is enough for semi and anti joins, without materialising a joined frame.
+        As with `merge`, missing keys match missing keys.
+        """
+        left_keys = select_columns_by_name(
+            self._native_frame, left_on, self._backend_version, self._implementation
+        )
+        right_keys = select_columns_by_name(
+            other._native_frame, right_on, self._backend_version, self._implementation
+        )
+        # Unlike `merge`, `isin` doesn't raise for keys of incompatible types (e.g.
+        # integers and strings), so let `merge` check the keys' first rows.
+        left_keys.head(1).merge(right_keys.head(1), left_on=left_on, right_on=right_on)
+        if len(left_on) == 1:
+            left_key = left_keys[left_on[0]]
+            right_key = right_keys[right_on[0]]
+            # `isin` doesn't match missing values in nullable dtypes.
+            return left_key.isin(right_key) | (left_key.isna() & right_key.isna().any())
+        # Hash the composite keys via a (column-less) MultiIndex.
+        return left_keys.set_index(left_on).index.isin(
+            right_keys.set_index(right_on).index
+        )
+
     def join_asof(
         self,
         other: Self,
@@ -702,8 +718,10 @@ class PandasLikeDataFrame:
         )
 
     # --- lazy-only ---
-    def lazy(self) -> Self:
-        return self
+    def lazy(self) -> LazyPlanFrame:
+        from narwhals._lazy_plan import LazyPlanFrame
+
+        return LazyPlanFrame.from_compliant_frame(self)
 
     @property
     def shape(self) -> tuple[int, int]:
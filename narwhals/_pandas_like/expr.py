@@ -6,7 +6,10 @@ from typing import Callable
 from typing import Literal
 from typing import Sequence
 
+from narwhals._expression_parsing import evaluate_with_cse
+from narwhals._expression_parsing import make_cse_key
 from narwhals._expression_parsing import reuse_series_implementation
+from narwhals._expression_parsing import with_cse_key
 from narwhals._pandas_like.expr_cat import PandasLikeExprCatNamespace
 from narwhals._pandas_like.expr_dt import PandasLikeExprDateTimeNamespace
 from narwhals._pandas_like.expr_list import PandasLikeExprListNamespace
@@ -22,6 +25,7 @@ from narwhals.typing import CompliantExpr
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from narwhals._expression_parsing import CSEKey
     from narwhals._pandas_like.dataframe import PandasLikeDataFrame
     from narwhals._pandas_like.namespace import PandasLikeNamespace
     from narwhals.dtypes import DType
@@ -43,6 +47,13 @@ MANY_TO_MANY_AGG_FUNCTIONS_TO_PANDAS_EQUIVALENT = {
 
 
 class PandasLikeExpr(CompliantExpr[PandasLikeSeries]):
+    # Structural key used to share identical sub-expressions, see
+    # `evaluate_into_exprs`. `None` means the expression is never shared.
+    _cse_key: CSEKey | None = None
+    # The expression which this one was derived from by calling a Series method on
+    # it, if any. Used to split aggregations into elementwise parts and reductions.
+    _input_expr: Self | None = None
+
     def __init__(
         self: Self,
         call: Callable[[PandasLikeDataFrame], Sequence[PandasLikeSeries]],
@@ -67,7 +78,7 @@ class PandasLikeExpr(CompliantExpr[PandasLikeSeries]):
         self._kwargs = kwargs
 
     def __call__(self, df: PandasLikeDataFrame) -> Sequence[PandasLikeSeries]:
-        return self._call(df)
+        return evaluate_with_cse(self, df)
 
     def __repr__(self) -> str:  # pragma: no cover
         return (
@@ -114,16 +125,19 @@ class PandasLikeExpr(CompliantExpr[PandasLikeSeries]):
                     available_columns=df.columns,
                 ) from e
 
-        return cls(
-            func,
-            depth=0,
-            function_name="col",
-            root_names=list(column_names),
-            output_names=list(column_names),
-            implementation=implementation,
-            backend_version=backend_version,
-            version=version,
-            kwargs={},
+        return with_cse_key(
+            cls(
+                func,
+                depth=0,
+                function_name="col",
+                root_names=list(column_names),
+                output_names=list(column_names),
+                implementation=implementation,
+                backend_version=backend_version,
+                version=version,
+                kwargs={},
+            ),
+            make_cse_key("col", names=column_names),
         )
 
     @classmethod
@@ -145,16 +159,19 @@ class PandasLikeExpr(CompliantExpr[PandasLikeSeries]):
                 for column_index in column_indices
             ]
 
-        return cls(
-            func,
-            depth=0,
-            function_name="nth",
-            root_names=None,
-            output_names=None,
-            implementation=implementation,
-            backend_version=backend_version,
-            version=version,
-            kwargs={},
+        return with_cse_key(
+            cls(
+                func,
+                depth=0,
+                function_name="nth",
+                root_names=None,
+                output_names=None,
+                implementation=implementation,
+                backend_version=backend_version,
+                version=version,
+                kwargs={},
+            ),
+            make_cse_key("nth", indices=column_indices),
         )
 
     def cast(
@@ -379,8 +396,8 @@ class PandasLikeExpr(CompliantExpr[PandasLikeSeries]):
     def alias(self, name: str) -> Self:
         # Define this one manually, so that we can
         # override `output_names` and not increase depth
-        return self.__class__(
-            lambda df: [series.alias(name) for series in self._call(df)],
+        result = self.__class__(
+            lambda df: [series.alias(name) for series in self(df)],
             depth=self._depth,
             function_name=self._function_name,
             root_names=self._root_names,
@@ -390,6 +407,8 @@ class PandasLikeExpr(CompliantExpr[PandasLikeSeries]):
             version=self._version,
             kwargs={**self._kwargs, "name": name},
         )
+        result._input_expr = self
+        return with_cse_key(result, make_cse_key("alias", self, name=name))
 
     def over(self: Self, keys: list[str]) -> Self:
         if self._function_name in MANY_TO_MANY_AGG_FUNCTIONS_TO_PANDAS_EQUIVALENT:
@@ -632,6 +651,70 @@ class PandasLikeExpr(CompliantExpr[PandasLikeSeries]):
             ddof=ddof,
         )
 
+    def rolling_min(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_min",
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
+    def rolling_max(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_max",
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
+    def rolling_median(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_median",
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
+    def rolling_quantile(
+        self: Self,
+        quantile: float,
+        interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        return reuse_series_implementation(
+            self,
+            "rolling_quantile",
+            quantile=quantile,
+            interpolation=interpolation,
+            window_size=window_size,
+            min_periods=min_periods,
+            center=center,
+        )
+
     def rank(
         self: Self,
         method: Literal["average", "min", "max", "dense", "ordinal"],
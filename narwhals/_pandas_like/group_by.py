@@ -10,6 +10,7 @@ from typing import Iterator
 from typing import Sequence
 
 from narwhals._expression_parsing import is_simple_aggregation
+from narwhals._expression_parsing import lower_complex_aggregations
 from narwhals._expression_parsing import parse_into_exprs
 from narwhals._pandas_like.utils import horizontal_concat
 from narwhals._pandas_like.utils import native_series_from_iterable
@@ -21,6 +22,7 @@ from narwhals.utils import remove_prefix
 
 if TYPE_CHECKING:
     from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+    from narwhals._pandas_like.expr import PandasLikeExpr
     from narwhals._pandas_like.series import PandasLikeSeries
     from narwhals._pandas_like.typing import IntoPandasLikeExpr
     from narwhals.typing import CompliantExpr
@@ -45,6 +47,7 @@ class PandasLikeGroupBy:
     ) -> None:
         self._df = df
         self._keys = keys
+        self._drop_null_keys = drop_null_keys
         if (
             self._df._implementation is Implementation.PANDAS
             and self._df._backend_version < (1, 1)
@@ -100,6 +103,14 @@ class PandasLikeGroupBy:
                 raise ValueError(msg)
             output_names.extend(expr._output_names)
 
+        if not all(_is_simple_aggregation(expr) for expr in exprs) and (
+            lowered := self._lower_complex_aggregations(exprs)  # type: ignore[arg-type]
+        ):
+            df, simple_exprs = lowered
+            return PandasLikeGroupBy(
+                df, self._keys, drop_null_keys=self._drop_null_keys
+            ).agg(*simple_exprs)
+
         return agg_pandas(
             self._grouped,
             exprs,
@@ -112,6 +123,32 @@ class PandasLikeGroupBy:
             native_namespace=self._df.__native_namespace__(),
         )
 
+    def _lower_complex_aggregations(
+        self, exprs: Sequence[PandasLikeExpr]
+    ) -> tuple[PandasLikeDataFrame, list[PandasLikeExpr]] | None:
+        """Rewrite complex aggregations as simple ones over temporary columns.
+
+        See `lower_complex_aggregations`. This lets them run in a single vectorised
+        `groupby.agg`. Filtered-out rows are masked.
+        """
+        lowered = lower_complex_aggregations(
+            exprs,
+            self._df,
+            keys=self._keys,
+            aggregations=POLARS_TO_PANDAS_AGGREGATIONS,
+            mask_columns=_mask_columns,
+        )
+        if lowered is None:
+            return None
+        needed_columns, new_columns, simple_exprs = lowered
+        df = select_columns_by_name(
+            self._df._native_frame,
+            needed_columns,
+            self._df._backend_version,
+            self._df._implementation,
+        ).assign(**new_columns)
+        return self._from_native_frame(df), simple_exprs
+
     def _from_native_frame(self, df: PandasLikeDataFrame) -> PandasLikeDataFrame:
         from narwhals._pandas_like.dataframe import PandasLikeDataFrame
 
@@ -133,6 +170,35 @@ class PandasLikeGroupBy:
                 yield (key, self._from_native_frame(group))
 
 
+def _is_simple_aggregation(expr: CompliantExpr[Any]) -> bool:
+    return (
+        is_simple_aggregation(expr)
+        and remove_prefix(expr._function_name, "col->") in POLARS_TO_PANDAS_AGGREGATIONS
+    )
+
+
+def _mask_columns(
+    function_name: str, columns: list[Any], predicate: Any
+) -> list[Any] | None:
+    mask = predicate.fillna(False).astype(bool)  # noqa: FBT003
+    masked = []
+    for column in columns:
+        kind = getattr(column.dtype, "kind", None)
+        if function_name == "sum":
+            if kind not in {"b", "i", "u", "f"}:
+                # e.g. Durations, which can't be filled with an integer zero.
+                return None
+            # Fill with zeros rather than missing values, to keep integer dtypes.
+            masked.append(column.where(mask, False if kind == "b" else 0))
+        elif function_name in {"min", "max"} and kind not in {"f", "M", "m"}:
+            # Missing values would turn integers into floats, and object columns
+            # (e.g. strings) can't be reduced natively once they contain them.
+            return None
+        else:
+            masked.append(column.where(mask))
+    return masked
+
+
 def agg_pandas(  # noqa: PLR0915
     grouped: Any,
     exprs: Sequence[CompliantExpr[PandasLikeSeries]],
@@ -150,15 +216,7 @@ def agg_pandas(  # noqa: PLR0915
     - https://github.com/rapidsai/cudf/issues/15118
     - https://github.com/rapidsai/cudf/issues/15084
     """
-    all_aggs_are_simple = True
-    for expr in exprs:
-        if not (
-            is_simple_aggregation(expr)
-            and remove_prefix(expr._function_name, "col->")
-            in POLARS_TO_PANDAS_AGGREGATIONS
-        ):
-            all_aggs_are_simple = False
-            break
+    all_aggs_are_simple = all(_is_simple_aggregation(expr) for expr in exprs)
 
     # dict of {output_name: root_name} that we count n_unique on
     # We need to do this separately from the rest so that we
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from copy import copy
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -9,24 +10,29 @@ from typing import Literal
 from typing import Sequence
 
 from narwhals._expression_parsing import combine_root_names
+from narwhals._expression_parsing import make_cse_key
 from narwhals._expression_parsing import parse_into_exprs
 from narwhals._expression_parsing import reduce_output_names
+from narwhals._expression_parsing import with_cse_key
 from narwhals._pandas_like.dataframe import PandasLikeDataFrame
 from narwhals._pandas_like.expr import PandasLikeExpr
 from narwhals._pandas_like.selectors import PandasSelectorNamespace
 from narwhals._pandas_like.series import PandasLikeSeries
+from narwhals._pandas_like.utils import broadcast_series
 from narwhals._pandas_like.utils import create_compliant_series
 from narwhals._pandas_like.utils import diagonal_concat
 from narwhals._pandas_like.utils import horizontal_concat
 from narwhals._pandas_like.utils import rename
 from narwhals._pandas_like.utils import vertical_concat
 from narwhals.typing import CompliantNamespace
+from narwhals.utils import Implementation
 from narwhals.utils import import_dtypes_module
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from narwhals._pandas_like.typing import IntoPandasLikeExpr
     from narwhals.dtypes import DType
-    from narwhals.utils import Implementation
     from narwhals.utils import Version
 
 
@@ -123,24 +129,27 @@ class PandasLikeNamespace(CompliantNamespace[PandasLikeSeries]):
         )
 
     def all(self) -> PandasLikeExpr:
-        return PandasLikeExpr(
-            lambda df: [
-                PandasLikeSeries(
-                    df._native_frame[column_name],
-                    implementation=self._implementation,
-                    backend_version=self._backend_version,
-                    version=self._version,
-                )
-                for column_name in df.columns
-            ],
-            depth=0,
-            function_name="all",
-            root_names=None,
-            output_names=None,
-            implementation=self._implementation,
-            backend_version=self._backend_version,
-            version=self._version,
-            kwargs={},
+        return with_cse_key(
+            PandasLikeExpr(
+                lambda df: [
+                    PandasLikeSeries(
+                        df._native_frame[column_name],
+                        implementation=self._implementation,
+                        backend_version=self._backend_version,
+                        version=self._version,
+                    )
+                    for column_name in df.columns
+                ],
+                depth=0,
+                function_name="all",
+                root_names=None,
+                output_names=None,
+                implementation=self._implementation,
+                backend_version=self._backend_version,
+                version=self._version,
+                kwargs={},
+            ),
+            make_cse_key("all"),
         )
 
     def lit(self, value: Any, dtype: DType | None) -> PandasLikeExpr:
@@ -157,16 +166,19 @@ class PandasLikeNamespace(CompliantNamespace[PandasLikeSeries]):
                 return pandas_series.cast(dtype)
             return pandas_series
 
-        return PandasLikeExpr(
-            lambda df: [_lit_pandas_series(df)],
-            depth=0,
-            function_name="lit",
-            root_names=None,
-            output_names=["literal"],
-            implementation=self._implementation,
-            backend_version=self._backend_version,
-            version=self._version,
-            kwargs={},
+        return with_cse_key(
+            PandasLikeExpr(
+                lambda df: [_lit_pandas_series(df)],
+                depth=0,
+                function_name="lit",
+                root_names=None,
+                output_names=["literal"],
+                implementation=self._implementation,
+                backend_version=self._backend_version,
+                version=self._version,
+                kwargs={},
+            ),
+            make_cse_key("lit", value=value, dtype=dtype),
         )
 
     def len(self) -> PandasLikeExpr:
@@ -192,71 +204,125 @@ class PandasLikeNamespace(CompliantNamespace[PandasLikeSeries]):
         )
 
     # --- horizontal ---
+    def _reduce_horizontal(
+        self, series: list[PandasLikeSeries], function_name: str
+    ) -> PandasLikeSeries:
+        """Reduce `series` row-wise in a single pass, rather than folding pairwise.
+
+        NumPy-backed pandas operands are stacked into one 2-D block and reduced along
+        the first axis. Anything else is concatenated into a native frame and goes
+        through the backend's (null-aware) `axis=1` reduction.
+        """
+        import numpy as np  # ignore-banned-import
+
+        native_series = broadcast_series(series)
+        block_dtype_kinds = "b" if function_name in {"all", "any"} else "iuf"
+        if self._implementation is Implementation.PANDAS and all(
+            isinstance(s.dtype, np.dtype) and s.dtype.kind in block_dtype_kinds
+            for s in native_series
+        ):
+            block = np.stack([s.to_numpy() for s in native_series])
+            result = (
+                series[0]
+                .__native_namespace__()
+                .Series(
+                    _reduce_block(block, function_name),
+                    index=native_series[0].index,
+                    name=series[0].name,
+                )
+            )
+        else:
+            frame = horizontal_concat(
+                native_series,
+                implementation=self._implementation,
+                backend_version=self._backend_version,
+            )
+            result = rename(
+                _reduce_frame(frame, function_name),
+                series[0].name,
+                implementation=self._implementation,
+                backend_version=self._backend_version,
+            )
+        return series[0]._from_native_series(result)
+
     def sum_horizontal(self, *exprs: IntoPandasLikeExpr) -> PandasLikeExpr:
         parsed_exprs = parse_into_exprs(*exprs, namespace=self)
 
         def func(df: PandasLikeDataFrame) -> list[PandasLikeSeries]:
-            series = (s.fill_null(0) for _expr in parsed_exprs for s in _expr(df))
-            return [reduce(lambda x, y: x + y, series)]
-
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="sum_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+            series = [s for _expr in parsed_exprs for s in _expr(df)]
+            return [self._reduce_horizontal(series, "sum")]
+
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="sum_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("sum_horizontal", *parsed_exprs),
         )
 
     def all_horizontal(self, *exprs: IntoPandasLikeExpr) -> PandasLikeExpr:
         parsed_exprs = parse_into_exprs(*exprs, namespace=self)
 
         def func(df: PandasLikeDataFrame) -> list[PandasLikeSeries]:
-            series = (s for _expr in parsed_exprs for s in _expr(df))
-            return [reduce(lambda x, y: x & y, series)]
-
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="all_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+            series = [s for _expr in parsed_exprs for s in _expr(df)]
+            if len(series) == 1:
+                return series
+            return [self._reduce_horizontal(series, "all")]
+
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="all_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("all_horizontal", *parsed_exprs),
         )
 
     def any_horizontal(self, *exprs: IntoPandasLikeExpr) -> PandasLikeExpr:
         parsed_exprs = parse_into_exprs(*exprs, namespace=self)
 
         def func(df: PandasLikeDataFrame) -> list[PandasLikeSeries]:
-            series = (s for _expr in parsed_exprs for s in _expr(df))
-            return [reduce(lambda x, y: x | y, series)]
-
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="any_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+            series = [s for _expr in parsed_exprs for s in _expr(df)]
+            if len(series) == 1:
+                return series
+            return [self._reduce_horizontal(series, "any")]
+
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="any_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("any_horizontal", *parsed_exprs),
         )
 
     def mean_horizontal(self, *exprs: IntoPandasLikeExpr) -> PandasLikeExpr:
         parsed_exprs = parse_into_exprs(*exprs, namespace=self)
 
         def func(df: PandasLikeDataFrame) -> list[PandasLikeSeries]:
-            series = (s.fill_null(0) for _expr in parsed_exprs for s in _expr(df))
-            non_na = (1 - s.is_null() for _expr in parsed_exprs for s in _expr(df))
-            return [
-                reduce(lambda x, y: x + y, series) / reduce(lambda x, y: x + y, non_na)
-            ]
-
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="mean_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+            series = [s for _expr in parsed_exprs for s in _expr(df)]
+            return [self._reduce_horizontal(series, "mean")]
+
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="mean_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("mean_horizontal", *parsed_exprs),
         )
 
     def min_horizontal(self, *exprs: IntoPandasLikeExpr) -> PandasLikeExpr:
@@ -264,30 +330,18 @@ class PandasLikeNamespace(CompliantNamespace[PandasLikeSeries]):
 
         def func(df: PandasLikeDataFrame) -> list[PandasLikeSeries]:
             series = [s for _expr in parsed_exprs for s in _expr(df)]
-
-            return [
-                PandasLikeSeries(
-                    native_series=rename(
-                        self.concat(
-                            (s.to_frame() for s in series), how="horizontal"
-                        )._native_frame.min(axis=1),
-                        series[0].name,
-                        implementation=self._implementation,
-                        backend_version=self._backend_version,
-                    ),
-                    implementation=self._implementation,
-                    backend_version=self._backend_version,
-                    version=self._version,
-                )
-            ]
-
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="min_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+            return [self._reduce_horizontal(series, "min")]
+
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="min_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("min_horizontal", *parsed_exprs),
         )
 
     def max_horizontal(self, *exprs: IntoPandasLikeExpr) -> PandasLikeExpr:
@@ -295,30 +349,18 @@ class PandasLikeNamespace(CompliantNamespace[PandasLikeSeries]):
 
         def func(df: PandasLikeDataFrame) -> list[PandasLikeSeries]:
             series = [s for _expr in parsed_exprs for s in _expr(df)]
-
-            return [
-                PandasLikeSeries(
-                    rename(
-                        self.concat(
-                            (s.to_frame() for s in series), how="horizontal"
-                        )._native_frame.max(axis=1),
-                        series[0].name,
-                        implementation=self._implementation,
-                        backend_version=self._backend_version,
-                    ),
-                    implementation=self._implementation,
-                    backend_version=self._backend_version,
-                    version=self._version,
-                )
-            ]
-
-        return self._create_expr_from_callable(
-            func=func,
-            depth=max(x._depth for x in parsed_exprs) + 1,
-            function_name="max_horizontal",
-            root_names=combine_root_names(parsed_exprs),
-            output_names=reduce_output_names(parsed_exprs),
-            kwargs={"exprs": exprs},
+            return [self._reduce_horizontal(series, "max")]
+
+        return with_cse_key(
+            self._create_expr_from_callable(
+                func=func,
+                depth=max(x._depth for x in parsed_exprs) + 1,
+                function_name="max_horizontal",
+                root_names=combine_root_names(parsed_exprs),
+                output_names=reduce_output_names(parsed_exprs),
+                kwargs={"exprs": exprs},
+            ),
+            make_cse_key("max_horizontal", *parsed_exprs),
         )
 
     def concat(
@@ -437,6 +479,48 @@ class PandasLikeNamespace(CompliantNamespace[PandasLikeSeries]):
         )
 
 
+def _reduce_block(
+    block: np.ndarray[Any, Any], function_name: str
+) -> np.ndarray[Any, Any]:
+    import numpy as np  # ignore-banned-import
+
+    if function_name == "all":
+        return np.logical_and.reduce(block, axis=0)  # type: ignore[no-any-return]
+    if function_name == "any":
+        return np.logical_or.reduce(block, axis=0)  # type: ignore[no-any-return]
+    if function_name == "min":
+        return np.fmin.reduce(block, axis=0)  # type: ignore[no-any-return]
+    if function_name == "max":
+        return np.fmax.reduce(block, axis=0)  # type: ignore[no-any-return]
+    if block.dtype.kind != "f":
+        # Integer data can't contain nulls.
+        if function_name == "sum":
+            return block.sum(axis=0, dtype=block.dtype)  # type: ignore[no-any-return]
+        return block.mean(axis=0)  # type: ignore[no-any-return]
+    # `block` is freshly allocated by the caller, so nulls can be zeroed in-place.
+    null_mask = np.isnan(block)
+    block[null_mask] = 0
+    total = block.sum(axis=0)
+    if function_name == "sum":
+        return total  # type: ignore[no-any-return]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return total / (len(block) - null_mask.sum(axis=0))  # type: ignore[no-any-return]
+
+
+def _reduce_frame(frame: Any, function_name: str) -> Any:
+    if function_name not in {"all", "any"}:
+        return getattr(frame, function_name)(axis=1)
+    # `DataFrame.all` / `DataFrame.any` skip nulls, whereas `x & y` / `x | y` follow
+    # Kleene logic: the result is null if it isn't already decided by a `False` (for
+    # `all`) or a `True` (for `any`) and there is at least one null in the row.
+    result = getattr(frame, function_name)(axis=1)
+    null_mask = frame.isna().any(axis=1)
+    if not null_mask.any():
+        return result
+    undecided = result if function_name == "all" else ~result
+    return result.mask(undecided & null_mask)
+
+
 class PandasWhen:
     def __init__(
         self,
@@ -447,6 +531,7 @@ class PandasWhen:
         otherwise_value: Any = None,
         *,
         version: Version,
+        branches: list[tuple[PandasLikeExpr, Any]] | None = None,
     ) -> None:
         self._implementation = implementation
         self._backend_version = backend_version
@@ -454,24 +539,29 @@ class PandasWhen:
         self._then_value = then_value
         self._otherwise_value = otherwise_value
         self._version = version
+        # `(condition, then_value)` pairs of the preceding branches in a chained
+        # `when(...).then(...).when(...).then(...)`.
+        self._branches = branches or []
 
     def __call__(self, df: PandasLikeDataFrame) -> Sequence[PandasLikeSeries]:
         from narwhals._expression_parsing import parse_into_expr
         from narwhals._pandas_like.utils import broadcast_align_and_extract_native
 
+        if self._branches:
+            return self._call_chained(df)
+
         plx = df.__narwhals_namespace__()
         condition = parse_into_expr(self._condition, namespace=plx)(df)[0]
         try:
             value_series = parse_into_expr(self._then_value, namespace=plx)(df)[0]
         except TypeError:
-            # `self._otherwise_value` is a scalar and can't be converted to an expression
-            value_series = condition.__class__._from_iterable(
-                [self._then_value] * len(condition),
-                name="literal",
-                index=condition._native_series.index,
-                implementation=self._implementation,
-                backend_version=self._backend_version,
-                version=self._version,
+            # `self._then_value` is a scalar and can't be converted to an expression,
+            # so we let the native constructor broadcast it.
+            condition_native = condition._native_series
+            value_series = condition._from_native_series(
+                condition_native.__class__(
+                    self._then_value, index=condition_native.index, name="literal"
+                )
             )
         value_series_native, condition_native = broadcast_align_and_extract_native(
             value_series, condition
@@ -496,6 +586,43 @@ class PandasWhen:
             otherwise_series = otherwise_expr(df)[0]
             return [value_series.zip_with(condition, otherwise_series)]
 
+    def _call_chained(self, df: PandasLikeDataFrame) -> Sequence[PandasLikeSeries]:
+        # All branches are evaluated once and folded with a native `where`, starting
+        # from the last one, so that the first matching branch wins.
+        from narwhals._expression_parsing import parse_into_expr
+        from narwhals._pandas_like.utils import broadcast_align_and_extract_native
+
+        plx = df.__narwhals_namespace__()
+        branches = [*self._branches, (self._condition, self._then_value)]
+        conditions = [parse_into_expr(c, namespace=plx)(df)[0] for c, _ in branches]
+        reference = conditions[0]
+        reference_index = reference._native_series.index
+
+        def evaluate(value: Any) -> Any:
+            try:
+                series = parse_into_expr(value, namespace=plx)(df)[0]
+            except TypeError:
+                # `value` is a scalar and can't be converted to an expression
+                return value
+            return broadcast_align_and_extract_native(reference, series)[1]
+
+        result = (
+            None if self._otherwise_value is None else evaluate(self._otherwise_value)
+        )
+        for (_, then_value), condition in zip(reversed(branches), reversed(conditions)):
+            value_native = evaluate(then_value)
+            if not isinstance(value_native, reference._native_series.__class__):
+                value_native = reference._native_series.__class__(
+                    value_native, index=reference_index, name="literal"
+                )
+            condition_native = broadcast_align_and_extract_native(reference, condition)[1]
+            result = (
+                value_native.where(condition_native)
+                if result is None
+                else value_native.where(condition_native, result)
+            )
+        return [reference._from_native_series(result)]
+
     def then(self, value: PandasLikeExpr | PandasLikeSeries | Any) -> PandasThen:
         self._then_value = value
 
@@ -536,10 +663,29 @@ class PandasThen(PandasLikeExpr):
         self._output_names = output_names
         self._kwargs = kwargs
 
+    def when(self, *predicates: IntoPandasLikeExpr) -> PandasWhen:
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: PandasWhen = self._call  # type: ignore[assignment]
+        plx = PandasLikeNamespace(
+            self._implementation, self._backend_version, version=self._version
+        )
+        return PandasWhen(
+            plx.all_horizontal(*predicates),
+            self._implementation,
+            self._backend_version,
+            version=self._version,
+            branches=[*call._branches, (call._condition, call._then_value)],
+        )
+
     def otherwise(self, value: PandasLikeExpr | PandasLikeSeries | Any) -> PandasLikeExpr:
-        # type ignore because we are setting the `_call` attribute to a
-        # callable object of type `PandasWhen`, base class has the attribute as
-        # only a `Callable`
-        self._call._otherwise_value = value  # type: ignore[attr-defined]
-        self._function_name = "whenotherwise"
-        return self
+        # The same `then` expression may be followed by different `otherwise` values
+        # (and compliant expressions get reused), so this one is left untouched.
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: PandasWhen = copy(self._call)  # type: ignore[assignment]
+        call._otherwise_value = value
+        result = copy(self)
+        result._call = call
+        result._function_name = "whenotherwise"
+        return result
@@ -29,7 +29,7 @@ class PandasSelectorNamespace:
 
     def by_dtype(self, dtypes: list[DType | type[DType]]) -> PandasSelector:
         def func(df: PandasLikeDataFrame) -> list[PandasLikeSeries]:
-            return [df[col] for col in df.columns if df.schema[col] in dtypes]
+            return [df[col] for col, dtype in df.schema.items() if dtype in dtypes]
 
         return PandasSelector(
             func,
@@ -19,6 +19,7 @@ from narwhals._pandas_like.utils import native_to_narwhals_dtype
 from narwhals._pandas_like.utils import rename
 from narwhals._pandas_like.utils import select_columns_by_name
 from narwhals._pandas_like.utils import set_index
+from narwhals._pandas_like.utils import validate_dataframe_comparand
 from narwhals.dependencies import is_numpy_scalar
 from narwhals.exceptions import InvalidOperationError
 from narwhals.typing import CompliantSeries
@@ -215,7 +216,7 @@ class PandasLikeSeries(CompliantSeries):
         if isinstance(values, self.__class__):
             # .copy() is necessary in some pre-2.2 versions of pandas to avoid
             # `values` also getting modified (!)
-            _, values = broadcast_align_and_extract_native(self, values)
+            values = validate_dataframe_comparand(self._native_series.index, values)
             values = set_index(
                 values.copy(),
                 self._native_series.index[indices],
@@ -1122,6 +1123,56 @@ class PandasLikeSeries(CompliantSeries):
         ).std(ddof=ddof)
         return self._from_native_series(result)
 
+    def rolling_min(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        result = self._native_series.rolling(
+            window=window_size, min_periods=min_periods, center=center
+        ).min()
+        return self._from_native_series(result)
+
+    def rolling_max(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        result = self._native_series.rolling(
+            window=window_size, min_periods=min_periods, center=center
+        ).max()
+        return self._from_native_series(result)
+
+    def rolling_median(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        result = self._native_series.rolling(
+            window=window_size, min_periods=min_periods, center=center
+        ).median()
+        return self._from_native_series(result)
+
+    def rolling_quantile(
+        self: Self,
+        quantile: float,
+        interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+        window_size: int,
+        *,
+        min_periods: int | None,
+        center: bool,
+    ) -> Self:
+        result = self._native_series.rolling(
+            window=window_size, min_periods=min_periods, center=center
+        ).quantile(quantile, interpolation=interpolation)
+        return self._from_native_series(result)
+
     def __iter__(self: Self) -> Iterator[Any]:
         yield from self._native_series.__iter__()
 
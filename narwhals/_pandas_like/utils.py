@@ -24,6 +24,8 @@ from narwhals.utils import isinstance_or_issubclass
 T = TypeVar("T")
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from narwhals._pandas_like.dataframe import PandasLikeDataFrame
     from narwhals._pandas_like.expr import PandasLikeExpr
     from narwhals._pandas_like.series import PandasLikeSeries
@@ -125,6 +127,8 @@ def broadcast_align_and_extract_native(
         if rhs.len() == 1:
             # broadcast
             s = rhs._native_series
+            if _can_broadcast_as_scalar(lhs._native_series.dtype, s.dtype):
+                return lhs._native_series, s.iloc[0]
             return (
                 lhs._native_series,
                 s.__class__(s.iloc[0], index=lhs_index, dtype=s.dtype),
@@ -152,6 +156,28 @@ def broadcast_align_and_extract_native(
     return lhs._native_series, rhs
 
 
+def _can_broadcast_as_scalar(lhs_dtype: Any, rhs_dtype: Any) -> bool:
+    """Whether a length-1 RHS can be passed on as a scalar rather than a full Series.
+
+    pandas treats scalars as "weakly" typed, so this is only done if the result dtype
+    is the same as with a full-length Series. Booleans are excluded as they may be
+    used as masks, which need to be full-length, and so are object-like dtypes as
+    their values may be list-like.
+    """
+    import numpy as np  # ignore-banned-import
+
+    if rhs_dtype.kind not in "iufmM":
+        return False
+    if lhs_dtype == rhs_dtype:
+        return True
+    # Integer data with a float64 scalar gives float64, just like with a float64 Series.
+    return (
+        isinstance(lhs_dtype, np.dtype)
+        and lhs_dtype.kind in "iu"
+        and rhs_dtype == np.float64
+    )
+
+
 def validate_dataframe_comparand(index: Any, other: Any) -> Any:
     """Validate RHS of binary operation.
 
@@ -450,19 +476,44 @@ def non_object_native_to_narwhals_dtype(
     return dtypes.Unknown()  # pragma: no cover
 
 
+@lru_cache(maxsize=16)
+def _numpy_dtype_to_narwhals_dtype(
+    native_dtype: np.dtype[Any], version: Version, implementation: Implementation
+) -> DType:
+    return non_object_native_to_narwhals_dtype(str(native_dtype), version, implementation)
+
+
+def non_object_native_dtype_to_narwhals_dtype(
+    native_dtype: Any, version: Version, implementation: Implementation
+) -> DType:
+    """Map a native dtype to a Narwhals one, without needing the column it belongs to.
+
+    This only works for non-object dtypes, as object columns need to be inspected.
+    """
+    import numpy as np  # ignore-banned-import
+
+    if isinstance(native_dtype, np.dtype):
+        # NumPy dtypes are cheap to hash, but not to convert to strings.
+        return _numpy_dtype_to_narwhals_dtype(native_dtype, version, implementation)
+    dtype = str(native_dtype)
+    if dtype.startswith(("large_list", "list", "struct", "fixed_size_list")):
+        if implementation is Implementation.CUDF:
+            return arrow_native_to_narwhals_dtype(native_dtype.to_arrow(), version)
+        return arrow_native_to_narwhals_dtype(native_dtype.pyarrow_dtype, version)
+    return non_object_native_to_narwhals_dtype(dtype, version, implementation)
+
+
 def native_to_narwhals_dtype(
     native_column: Any, version: Version, implementation: Implementation
 ) -> DType:
-    dtype = str(native_column.dtype)
+    native_dtype = native_column.dtype
+    if str(native_dtype) != "object":
+        return non_object_native_dtype_to_narwhals_dtype(
+            native_dtype, version, implementation
+        )
 
     dtypes = import_dtypes_module(version)
 
-    if dtype.startswith(("large_list", "list", "struct", "fixed_size_list")):
-        if implementation is Implementation.CUDF:
-            return arrow_native_to_narwhals_dtype(native_column.dtype.to_arrow(), version)
-        return arrow_native_to_narwhals_dtype(native_column.dtype.pyarrow_dtype, version)
-    if dtype != "object":
-        return non_object_native_to_narwhals_dtype(dtype, version, implementation)
     if implementation is Implementation.DASK:
         # Dask columns are lazy, so we can't inspect values.
         # The most useful assumption is probably String
@@ -510,14 +561,38 @@ def get_dtype_backend(dtype: Any, implementation: Implementation) -> str:
         return "numpy"
 
 
-def narwhals_to_native_dtype(  # noqa: PLR0915
+def narwhals_to_native_dtype(
     dtype: DType | type[DType],
     starting_dtype: Any,
     implementation: Implementation,
     backend_version: tuple[int, ...],
     version: Version,
 ) -> Any:
+    from narwhals.dtypes import DType
+
     dtype_backend = get_dtype_backend(starting_dtype, implementation)
+    dtype_class = dtype if isinstance(dtype, type) else type(dtype)
+    if dtype_class.__hash__ is DType.__hash__:
+        # Dtype without parameters (e.g. `Int64`), so its class is all we need.
+        return _non_parametric_narwhals_to_native_dtype(
+            dtype_class,  # type: ignore[arg-type]
+            dtype_backend,
+            implementation,
+            backend_version,
+            version,
+        )
+    return _narwhals_to_native_dtype(
+        dtype, dtype_backend, implementation, backend_version, version
+    )
+
+
+def _narwhals_to_native_dtype(  # noqa: PLR0915
+    dtype: DType | type[DType],
+    dtype_backend: str,
+    implementation: Implementation,
+    backend_version: tuple[int, ...],
+    version: Version,
+) -> Any:
     dtypes = import_dtypes_module(version)
     if isinstance_or_issubclass(dtype, dtypes.Float64):
         if dtype_backend == "pyarrow-nullable":
@@ -704,6 +779,11 @@ def narwhals_to_native_dtype(  # noqa: PLR0915
     raise AssertionError(msg)
 
 
+_non_parametric_narwhals_to_native_dtype = lru_cache(maxsize=16)(
+    _narwhals_to_native_dtype
+)
+
+
 def broadcast_series(series: Sequence[PandasLikeSeries]) -> list[Any]:
     native_namespace = series[0].__native_namespace__()
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import operator
+from copy import copy
 from functools import reduce
 from typing import TYPE_CHECKING
 from typing import Any
@@ -355,6 +356,7 @@ class SparkLikeWhen:
         *,
         returns_scalar: bool,
         version: Version,
+        branches: list[tuple[SparkLikeExpr, Any]] | None = None,
     ) -> None:
         self._backend_version = backend_version
         self._condition = condition
@@ -362,20 +364,38 @@ class SparkLikeWhen:
         self._otherwise_value = otherwise_value
         self._returns_scalar = returns_scalar
         self._version = version
+        # `(condition, then_value)` pairs of the preceding branches in a chained
+        # `when(...).then(...).when(...).then(...)`.
+        self._branches = branches or []
 
     def __call__(self, df: SparkLikeLazyFrame) -> list[Column]:
         from pyspark.sql import functions as F  # noqa: N812
 
         plx = df.__narwhals_namespace__()
-        condition = parse_into_expr(self._condition, namespace=plx)(df)[0]
 
-        try:
-            value_ = parse_into_expr(self._then_value, namespace=plx)(df)[0]
-            col_name = get_column_name(df, value_)
-        except TypeError:
-            # `self._then_value` is a scalar and can't be converted to an expression
-            value_ = F.lit(self._then_value)
-            col_name = "literal"
+        def evaluate(value: Any) -> tuple[Column, str]:
+            try:
+                value_ = parse_into_expr(value, namespace=plx)(df)[0]
+            except TypeError:
+                # `value` is a scalar and can't be converted to an expression
+                return F.lit(value), "literal"
+            return value_, get_column_name(df, value_)
+
+        (first_condition, first_value), *branches = [
+            *self._branches,
+            (self._condition, self._then_value),
+        ]
+        value_, col_name = evaluate(first_value)
+        result = F.when(
+            condition=parse_into_expr(first_condition, namespace=plx)(df)[0],
+            value=value_,
+        )
+        # Chained branches are compiled into a single `CASE WHEN ... WHEN ... END`.
+        for condition, value in branches:
+            result = result.when(
+                condition=parse_into_expr(condition, namespace=plx)(df)[0],
+                value=evaluate(value)[0],
+            )
 
         try:
             other_ = parse_into_expr(self._otherwise_value, namespace=plx)(df)[0]
@@ -383,11 +403,7 @@ class SparkLikeWhen:
             # `self._otherwise_value` is a scalar and can't be converted to an expression
             other_ = F.lit(self._otherwise_value)
 
-        return [
-            F.when(condition=condition, value=value_)
-            .otherwise(value=other_)
-            .alias(col_name)
-        ]
+        return [result.otherwise(value=other_).alias(col_name)]
 
     def then(self, value: SparkLikeExpr | Any) -> SparkLikeThen:
         self._then_value = value
@@ -429,10 +445,29 @@ class SparkLikeThen(SparkLikeExpr):
         self._returns_scalar = returns_scalar
         self._kwargs = kwargs
 
+    def when(self, *predicates: IntoSparkLikeExpr) -> SparkLikeWhen:
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: SparkLikeWhen = self._call  # type: ignore[assignment]
+        plx = SparkLikeNamespace(
+            backend_version=self._backend_version, version=self._version
+        )
+        return SparkLikeWhen(
+            plx.all_horizontal(*predicates),
+            self._backend_version,
+            returns_scalar=self._returns_scalar,
+            version=self._version,
+            branches=[*call._branches, (call._condition, call._then_value)],
+        )
+
     def otherwise(self, value: SparkLikeExpr | Any) -> SparkLikeExpr:
-        # type ignore because we are setting the `_call` attribute to a
-        # callable object of type `SparkLikeWhen`, base class has the attribute as
-        # only a `Callable`
-        self._call._otherwise_value = value  # type: ignore[attr-defined]
-        self._function_name = "whenotherwise"
-        return self
+        # The same `then` expression may be followed by different `otherwise` values
+        # (and compliant expressions get reused), so this one is left untouched.
+        # type ignore because the base class has the `_call` attribute as only a
+        # `Callable`
+        call: SparkLikeWhen = copy(self._call)  # type: ignore[assignment]
+        call._otherwise_value = value
+        result = copy(self)
+        result._call = call
+        result._function_name = "whenotherwise"
+        return result
@@ -20,6 +20,7 @@ from narwhals.translate import to_native
 from narwhals.utils import find_stacklevel
 from narwhals.utils import flatten
 from narwhals.utils import generate_repr
+from narwhals.utils import generate_temporary_column_name
 from narwhals.utils import is_sequence_but_not_str
 from narwhals.utils import parse_version
 
@@ -264,22 +265,12 @@ class BaseFrame(Generic[FrameT]):
         if (by is not None) and (by_left is not None or by_right is not None):
             msg = "If `by` is specified, `by_left` and `by_right` should be None."
             raise ValueError(msg)
-        if on is not None:
-            return self._from_compliant_dataframe(
-                self._compliant_frame.join_asof(
-                    self._extract_compliant(other),
-                    on=on,
-                    by_left=by_left,
-                    by_right=by_right,
-                    by=by,
-                    strategy=strategy,
-                )
-            )
         return self._from_compliant_dataframe(
             self._compliant_frame.join_asof(
                 self._extract_compliant(other),
                 left_on=left_on,
                 right_on=right_on,
+                on=on,
                 by_left=by_left,
                 by_right=by_right,
                 by=by,
@@ -366,6 +357,9 @@ class DataFrame(BaseFrame[DataFrameT]):
 
         return Series
 
+    # Execution engine which heavy operations get offloaded to, see `with_engine`.
+    _engine: Literal["duckdb"] | None = None
+
     @property
     def _lazyframe(self) -> type[LazyFrame[Any]]:
         return LazyFrame
@@ -383,6 +377,86 @@ class DataFrame(BaseFrame[DataFrameT]):
             msg = f"Expected an object which implements `__narwhals_dataframe__`, got: {type(df)}"
             raise AssertionError(msg)
 
+    def _from_compliant_dataframe(self, df: Any) -> Self:
+        result = super()._from_compliant_dataframe(df)
+        result._engine = self._engine
+        return result
+
+    def _run_on_engine(
+        self,
+        function: Callable[..., Any],
+        *others: DataFrame[Any],
+        ordered_function: Callable[..., Any] | None = None,
+        suffix: str | None = None,
+    ) -> Self:
+        """Run `function` on `self` (and `others`) through the execution engine.
+
+        `function` gets called with one engine-backed LazyFrame per frame. If the frames
+        can't be offloaded, or the engine fails to run `function`, it gets called with
+        the frames themselves instead.
+
+        The engine doesn't keep track of the order of rows. If `ordered_function` is
+        given, it's called with the engine instead of `function`, with the names of a
+        row index column added to each frame as last argument, so that it can produce
+        rows in the same order as the native backends. Row index columns are dropped
+        from its result. `suffix` is the one of a join, see `collect_like`.
+        """
+        from narwhals._duckdb.utils import can_offload_frame
+        from narwhals._duckdb.utils import collect_like
+        from narwhals._duckdb.utils import to_duckdb_lazyframe
+
+        frames: list[DataFrame[Any]] = [
+            self._with_engine(None),
+            *(other._with_engine(None) for other in others),
+        ]
+        if all(can_offload_frame(frame._compliant_frame) for frame in frames):
+            row_index: list[str] = []
+            if ordered_function is not None:
+                # DuckDB would parse some bare hex tokens (e.g. "1e10") as numbers.
+                prefix = "row_index_"
+                tokens = [
+                    name[len(prefix) :]
+                    for frame in frames
+                    for name in frame.columns
+                    if name.startswith(prefix)
+                ]
+                for _ in frames:
+                    token = generate_temporary_column_name(n_bytes=8, columns=tokens)
+                    tokens.append(token)
+                    row_index.append(f"{prefix}{token}")
+            try:
+                inputs = [
+                    to_duckdb_lazyframe(
+                        frame._compliant_frame,
+                        row_index=row_index[i] if row_index else None,
+                    )
+                    for i, frame in enumerate(frames)
+                ]
+                lazy_frames = [self._lazyframe(input_, level="full") for input_ in inputs]
+                if ordered_function is None:
+                    result = function(*lazy_frames)._compliant_frame
+                else:
+                    result = ordered_function(*lazy_frames, row_index)._compliant_frame
+                    result = result.drop(row_index, strict=False)
+                return self._from_compliant_dataframe(
+                    collect_like(
+                        result,
+                        [frame._compliant_frame for frame in frames],
+                        inputs,
+                        suffix=suffix,
+                    )
+                )
+            except Exception:  # noqa: BLE001, S110
+                # e.g. expressions which the DuckDB backend doesn't support, such as
+                # `filter` in aggregations, or cross joins on older DuckDB versions.
+                pass
+        return function(*frames)._with_engine(self._engine)  # type: ignore[no-any-return]
+
+    def _with_engine(self, engine: Literal["duckdb"] | None) -> Self:
+        result = self._from_compliant_dataframe(self._compliant_frame)
+        result._engine = engine
+        return result
+
     @property
     def implementation(self) -> Implementation:
         """Return implementation of native frame.
@@ -444,7 +518,9 @@ class DataFrame(BaseFrame[DataFrameT]):
     def lazy(self) -> LazyFrame[Any]:
         """Lazify the DataFrame (if possible).
 
-        If a library does not support lazy execution, then this is a no-op.
+        If a library does not support lazy execution (e.g. pandas or PyArrow), then
+        operations on the resulting LazyFrame are recorded, and only get optimised and
+        run when calling `collect` (or `to_native`).
 
         Returns:
             A new LazyFrame.
@@ -468,8 +544,8 @@ class DataFrame(BaseFrame[DataFrameT]):
             ...     df = nw.from_native(df_native)
             ...     return df.lazy().to_native()
 
-            Note that then, pandas and pyarrow dataframe stay eager, but Polars DataFrame
-            becomes a Polars LazyFrame:
+            Note that then, pandas and pyarrow dataframe are computed and returned as
+            eager dataframes, but Polars DataFrame becomes a Polars LazyFrame:
 
             >>> agnostic_lazy(df_pd)
                foo  bar ham
@@ -490,6 +566,47 @@ class DataFrame(BaseFrame[DataFrameT]):
         """
         return self._lazyframe(self._compliant_frame.lazy(), level="lazy")
 
+    def with_engine(self, engine: Literal["duckdb"] | None) -> Self:
+        """Offload heavy operations to another execution engine.
+
+        !!! warning
+            This functionality is considered **unstable**. It may be changed at any point
+            without it being considered a breaking change.
+
+        With `engine="duckdb"`, `join`, `sort` and `group_by(...).agg` on pandas and
+        PyArrow DataFrames run as DuckDB queries over the native data, using all cores,
+        and their results are converted back to the original backend. Other backends,
+        and operations which DuckDB can't run, are not affected. Neither are those
+        whose order of rows DuckDB can't reproduce: inner joins, PyArrow left joins,
+        and pandas sorts on a single column.
+
+        Arguments:
+            engine: Engine to offload operations to, or `None` to run them with the
+                DataFrame's own backend.
+
+        Returns:
+            A new DataFrame.
+
+        Note:
+            Offloaded operations follow Polars semantics, even where the native backend
+            doesn't: for example, missing join keys don't match each other. pandas
+            results have a default index.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import narwhals as nw
+            >>> df_native = pd.DataFrame({"a": [1, 2, 1], "b": [4, 5, 6]})
+            >>> df = nw.from_native(df_native).with_engine("duckdb")
+            >>> df.group_by("a").agg(nw.col("b").sum()).sort("a").to_native()
+               a   b
+            0  1  10
+            1  2   5
+        """
+        if engine not in {"duckdb", None}:
+            msg = f"Only the following engines are supported: ('duckdb',); found '{engine}'."
+            raise NotImplementedError(msg)
+        return self._with_engine(engine)
+
     def to_native(self) -> DataFrameT:
         """Convert Narwhals DataFrame to native one.
 
@@ -2567,6 +2684,29 @@ class DataFrame(BaseFrame[DataFrameT]):
             b: [[6,4,5]]
             c: [["a","b","c"]]
         """
+        keys = flatten([*flatten([by]), *more_by])
+        # pandas sorts on a single column aren't stable, so ties come in an order which
+        # the engine can't reproduce.
+        if self._engine is not None and (
+            len(keys) > 1 or not self.implementation.is_pandas()
+        ):
+            descending_ = (
+                [descending] * len(keys)
+                if isinstance(descending, bool)
+                else list(descending)
+            )
+            return self._run_on_engine(
+                lambda df: df.sort(
+                    by, *more_by, descending=descending, nulls_last=nulls_last
+                ),
+                # Ties keep their original order, like with the native backends.
+                ordered_function=lambda df, row_index: df.sort(
+                    *keys,
+                    *row_index,
+                    descending=[*descending_, False],
+                    nulls_last=nulls_last,
+                ),
+            )
         return super().sort(by, *more_by, descending=descending, nulls_last=nulls_last)
 
     def join(
@@ -2663,6 +2803,38 @@ class DataFrame(BaseFrame[DataFrameT]):
             ham: [["a","b"]]
             apple: [["x","y"]]
         """
+        # The order of the rows of inner joins, and of PyArrow left joins, depends on
+        # the native join algorithm, so the engine can't reproduce it.
+        if (
+            self._engine is not None
+            and isinstance(other, DataFrame)
+            and (
+                how in {"semi", "anti", "cross"}
+                or (how == "left" and self.implementation.is_pandas())
+            )
+        ):
+
+            def join(df: Any, other: Any) -> Any:
+                return df.join(
+                    other,
+                    how=how,
+                    left_on=left_on,
+                    right_on=right_on,
+                    on=on,
+                    suffix=suffix,
+                )
+
+            def ordered_join(df: Any, other: Any, row_index: list[str]) -> Any:
+                # Keep the order of the left rows, and then of their matches.
+                result = join(df, other)
+                return result.sort(
+                    *(name for name in row_index if name in result.columns),
+                    nulls_last=True,
+                )
+
+            return self._run_on_engine(
+                join, other, ordered_function=ordered_join, suffix=suffix
+            )
         return super().join(
             other, how=how, left_on=left_on, right_on=right_on, on=on, suffix=suffix
         )
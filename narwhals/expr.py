@@ -30,7 +30,22 @@ if TYPE_CHECKING:
 class Expr:
     def __init__(self, to_compliant_expr: Callable[[Any], Any]) -> None:
         # callable from CompliantNamespace to CompliantExpr
-        self._to_compliant_expr = to_compliant_expr
+        self._build_compliant_expr = to_compliant_expr
+        # Compliant expressions don't hold any frame-specific state, so they're
+        # built once per backend and reused for every frame the expression
+        # is applied to.
+        self._compliant_exprs: dict[tuple[Any, ...], Any] = {}
+
+    def _to_compliant_expr(self, plx: Any) -> Any:
+        key = (
+            plx.__class__,
+            getattr(plx, "_implementation", None),
+            plx._backend_version,
+            plx._version,
+        )
+        if (compliant_expr := self._compliant_exprs.get(key)) is None:
+            compliant_expr = self._compliant_exprs[key] = self._build_compliant_expr(plx)
+        return compliant_expr
 
     def _taxicab_norm(self) -> Self:
         # This is just used to test out the stable api feature in a realistic-ish way.
@@ -4104,6 +4119,394 @@ class Expr:
             )
         )
 
+    def rolling_min(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None = None,
+        center: bool = False,
+    ) -> Self:
+        """Apply a rolling minimum (moving minimum) over the values.
+
+        !!! warning
+            This functionality is considered **unstable**. It may be changed at any point
+            without it being considered a breaking change.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their minimum.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_periods: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Returns:
+            A new expression.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import pyarrow as pa
+            >>> import narwhals as nw
+            >>> from narwhals.typing import IntoFrameT
+            >>>
+            >>> data = {"a": [1.0, 2.0, None, 4.0]}
+            >>> df_pd = pd.DataFrame(data)
+            >>> df_pl = pl.DataFrame(data)
+            >>> df_pa = pa.table(data)
+
+            We define a library agnostic function:
+
+            >>> def agnostic_rolling_min(df_native: IntoFrameT) -> IntoFrameT:
+            ...     df = nw.from_native(df_native)
+            ...     return df.with_columns(
+            ...         b=nw.col("a").rolling_min(window_size=3, min_periods=1)
+            ...     ).to_native()
+
+            We can then pass any supported library such as pandas, Polars, or
+            PyArrow to `agnostic_rolling_min`:
+
+            >>> agnostic_rolling_min(df_pd)
+                 a    b
+            0  1.0  1.0
+            1  2.0  1.0
+            2  NaN  1.0
+            3  4.0  2.0
+
+            >>> agnostic_rolling_min(df_pl)
+            shape: (4, 2)
+            ┌──────┬─────┐
+            │ a    ┆ b   │
+            │ ---  ┆ --- │
+            │ f64  ┆ f64 │
+            ╞══════╪═════╡
+            │ 1.0  ┆ 1.0 │
+            │ 2.0  ┆ 1.0 │
+            │ null ┆ 1.0 │
+            │ 4.0  ┆ 2.0 │
+            └──────┴─────┘
+
+            >>> agnostic_rolling_min(df_pa)
+            pyarrow.Table
+            a: double
+            b: double
+            ----
+            a: [[1,2,null,4]]
+            b: [[1,1,1,2]]
+        """
+        window_size, min_periods = _validate_rolling_arguments(
+            window_size=window_size, min_periods=min_periods
+        )
+
+        return self.__class__(
+            lambda plx: self._to_compliant_expr(plx).rolling_min(
+                window_size=window_size,
+                min_periods=min_periods,
+                center=center,
+            )
+        )
+
+    def rolling_max(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None = None,
+        center: bool = False,
+    ) -> Self:
+        """Apply a rolling maximum (moving maximum) over the values.
+
+        !!! warning
+            This functionality is considered **unstable**. It may be changed at any point
+            without it being considered a breaking change.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their maximum.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_periods: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Returns:
+            A new expression.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import pyarrow as pa
+            >>> import narwhals as nw
+            >>> from narwhals.typing import IntoFrameT
+            >>>
+            >>> data = {"a": [1.0, 2.0, None, 4.0]}
+            >>> df_pd = pd.DataFrame(data)
+            >>> df_pl = pl.DataFrame(data)
+            >>> df_pa = pa.table(data)
+
+            We define a library agnostic function:
+
+            >>> def agnostic_rolling_max(df_native: IntoFrameT) -> IntoFrameT:
+            ...     df = nw.from_native(df_native)
+            ...     return df.with_columns(
+            ...         b=nw.col("a").rolling_max(window_size=3, min_periods=1)
+            ...     ).to_native()
+
+            We can then pass any supported library such as pandas, Polars, or
+            PyArrow to `agnostic_rolling_max`:
+
+            >>> agnostic_rolling_max(df_pd)
+                 a    b
+            0  1.0  1.0
+            1  2.0  2.0
+            2  NaN  2.0
+            3  4.0  4.0
+
+            >>> agnostic_rolling_max(df_pl)
+            shape: (4, 2)
+            ┌──────┬─────┐
+            │ a    ┆ b   │
+            │ ---  ┆ --- │
+            │ f64  ┆ f64 │
+            ╞══════╪═════╡
+            │ 1.0  ┆ 1.0 │
+            │ 2.0  ┆ 2.0 │
+            │ null ┆ 2.0 │
+            │ 4.0  ┆ 4.0 │
+            └──────┴─────┘
+
+            >>> agnostic_rolling_max(df_pa)
+            pyarrow.Table
+            a: double
+            b: double
+            ----
+            a: [[1,2,null,4]]
+            b: [[1,2,2,4]]
+        """
+        window_size, min_periods = _validate_rolling_arguments(
+            window_size=window_size, min_periods=min_periods
+        )
+
+        return self.__class__(
+            lambda plx: self._to_compliant_expr(plx).rolling_max(
+                window_size=window_size,
+                min_periods=min_periods,
+                center=center,
+            )
+        )
+
+    def rolling_median(
+        self: Self,
+        window_size: int,
+        *,
+        min_periods: int | None = None,
+        center: bool = False,
+    ) -> Self:
+        """Apply a rolling median (moving median) over the values.
+
+        !!! warning
+            This functionality is considered **unstable**. It may be changed at any point
+            without it being considered a breaking change.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their median.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Arguments:
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_periods: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Returns:
+            A new expression.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import pyarrow as pa
+            >>> import narwhals as nw
+            >>> from narwhals.typing import IntoFrameT
+            >>>
+            >>> data = {"a": [1.0, 2.0, None, 4.0]}
+            >>> df_pd = pd.DataFrame(data)
+            >>> df_pl = pl.DataFrame(data)
+            >>> df_pa = pa.table(data)
+
+            We define a library agnostic function:
+
+            >>> def agnostic_rolling_median(df_native: IntoFrameT) -> IntoFrameT:
+            ...     df = nw.from_native(df_native)
+            ...     return df.with_columns(
+            ...         b=nw.col("a").rolling_median(window_size=3, min_periods=1)
+            ...     ).to_native()
+
+            We can then pass any supported library such as pandas, Polars, or
+            PyArrow to `agnostic_rolling_median`:
+
+            >>> agnostic_rolling_median(df_pd)
+                 a    b
+            0  1.0  1.0
+            1  2.0  1.5
+            2  NaN  1.5
+            3  4.0  3.0
+
+            >>> agnostic_rolling_median(df_pl)
+            shape: (4, 2)
+            ┌──────┬─────┐
+            │ a    ┆ b   │
+            │ ---  ┆ --- │
+            │ f64  ┆ f64 │
+            ╞══════╪═════╡
+            │ 1.0  ┆ 1.0 │
+            │ 2.0  ┆ 1.5 │
+            │ null ┆ 1.5 │
+            │ 4.0  ┆ 3.0 │
+            └──────┴─────┘
+
+            >>> agnostic_rolling_median(df_pa)
+            pyarrow.Table
+            a: double
+            b: double
+            ----
+            a: [[1,2,null,4]]
+            b: [[1,1.5,1.5,3]]
+        """
+        window_size, min_periods = _validate_rolling_arguments(
+            window_size=window_size, min_periods=min_periods
+        )
+
+        return self.__class__(
+            lambda plx: self._to_compliant_expr(plx).rolling_median(
+                window_size=window_size,
+                min_periods=min_periods,
+                center=center,
+            )
+        )
+
+    def rolling_quantile(
+        self: Self,
+        quantile: float,
+        interpolation: Literal["nearest", "higher", "lower", "midpoint", "linear"],
+        window_size: int,
+        *,
+        min_periods: int | None = None,
+        center: bool = False,
+    ) -> Self:
+        """Apply a rolling quantile (moving quantile) over the values.
+
+        !!! warning
+            This functionality is considered **unstable**. It may be changed at any point
+            without it being considered a breaking change.
+
+        A window of length `window_size` will traverse the values. The resulting values
+        will be aggregated to their quantile.
+
+        The window at a given row will include the row itself and the `window_size - 1`
+        elements before it.
+
+        Arguments:
+            quantile: Quantile between 0.0 and 1.0.
+            interpolation: Interpolation method.
+            window_size: The length of the window in number of elements. It must be a
+                strictly positive integer.
+            min_periods: The number of values in the window that should be non-null before
+                computing a result. If set to `None` (default), it will be set equal to
+                `window_size`. If provided, it must be a strictly positive integer, and
+                less than or equal to `window_size`
+            center: Set the labels at the center of the window.
+
+        Returns:
+            A new expression.
+
+        Note:
+            pandas and Polars may have implementation differences for a given interpolation
+            method.
+
+        Examples:
+            >>> import pandas as pd
+            >>> import polars as pl
+            >>> import pyarrow as pa
+            >>> import narwhals as nw
+            >>> from narwhals.typing import IntoFrameT
+            >>>
+            >>> data = {"a": [1.0, 2.0, None, 4.0]}
+            >>> df_pd = pd.DataFrame(data)
+            >>> df_pl = pl.DataFrame(data)
+            >>> df_pa = pa.table(data)
+
+            We define a library agnostic function:
+
+            >>> def agnostic_rolling_quantile(df_native: IntoFrameT) -> IntoFrameT:
+            ...     df = nw.from_native(df_native)
+            ...     return df.with_columns(
+            ...         b=nw.col("a").rolling_quantile(
+            ...             0.25, "linear", window_size=3, min_periods=1
+            ...         )
+            ...     ).to_native()
+
+            We can then pass any supported library such as pandas, Polars, or
+            PyArrow to `agnostic_rolling_quantile`:
+
+            >>> agnostic_rolling_quantile(df_pd)
+                 a     b
+            0  1.0  1.00
+            1  2.0  1.25
+            2  NaN  1.25
+            3  4.0  2.50
+
+            >>> agnostic_rolling_quantile(df_pl)
+            shape: (4, 2)
+            ┌──────┬──────┐
+            │ a    ┆ b    │
+            │ ---  ┆ ---  │
+            │ f64  ┆ f64  │
+            ╞══════╪══════╡
+            │ 1.0  ┆ 1.0  │
+            │ 2.0  ┆ 1.25 │
+            │ null ┆ 1.25 │
+            │ 4.0  ┆ 2.5  │
+            └──────┴──────┘
+
+            >>> agnostic_rolling_quantile(df_pa)
+            pyarrow.Table
+            a: double
+            b: double
+            ----
+            a: [[1,2,null,4]]
+            b: [[1,1.25,1.25,2.5]]
+        """
+        window_size, min_periods = _validate_rolling_arguments(
+            window_size=window_size, min_periods=min_periods
+        )
+
+        return self.__class__(
+            lambda plx: self._to_compliant_expr(plx).rolling_quantile(
+                quantile=quantile,
+                interpolation=interpolation,
+                window_size=window_size,
+                min_periods=min_periods,
+                center=center,
+            )
+        )
+
     def rank(
         self: Self,
         method: Literal["average", "min", "max", "dense", "ordinal"] = "average",
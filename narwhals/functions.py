@@ -4,6 +4,7 @@ import platform
 import sys
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Iterable
 from typing import Literal
 from typing import Protocol
@@ -13,7 +14,8 @@ from typing import Union
 from typing import overload
 
 from narwhals._expression_parsing import extract_compliant
-from narwhals._pandas_like.utils import broadcast_align_and_extract_native
+from narwhals._multi_file import is_multi_file_source
+from narwhals._multi_file import read_multi_file_source
 from narwhals.dataframe import DataFrame
 from narwhals.dataframe import LazyFrame
 from narwhals.dependencies import is_numpy_array
@@ -479,6 +481,8 @@ def _from_dict_impl(
         Implementation.MODIN,
         Implementation.CUDF,
     }:
+        from narwhals._pandas_like.utils import validate_dataframe_comparand
+
         aligned_data = {}
         left_most_series = None
         for key, native_series in data.items():
@@ -490,9 +494,9 @@ def _from_dict_impl(
                     left_most_series = compliant_series
                     aligned_data[key] = native_series
                 else:
-                    aligned_data[key] = broadcast_align_and_extract_native(
-                        left_most_series, compliant_series
-                    )[1]
+                    aligned_data[key] = validate_dataframe_comparand(
+                        left_most_series._native_series.index, compliant_series
+                    )
             else:
                 aligned_data[key] = native_series
 
@@ -985,8 +989,47 @@ def get_level(
     return obj._level
 
 
+# Backends whose readers only accept a single path: for those, lists of paths and glob
+# patterns get read file by file, concurrently. Polars, Dask and DuckDB handle them
+# natively (except for Polars' `read_csv`).
+_MULTI_FILE_PARQUET_IMPLEMENTATIONS = (
+    Implementation.PANDAS,
+    Implementation.MODIN,
+    Implementation.CUDF,
+    Implementation.PYARROW,
+)
+_MULTI_FILE_CSV_IMPLEMENTATIONS = (
+    Implementation.POLARS,
+    *_MULTI_FILE_PARQUET_IMPLEMENTATIONS,
+)
+
+
+def _is_multi_file_read(source: str | Sequence[str], kwargs: dict[str, Any]) -> bool:
+    # Reading hive partitions goes through the multi-file reader even for a single
+    # path, as the native readers don't support it.
+    return is_multi_file_source(source) or "hive_partitioning" in kwargs
+
+
+def _read_multi_file_source(
+    read_impl: Callable[..., DataFrame[Any]],
+    source: str | Sequence[str],
+    *,
+    native_namespace: ModuleType,
+    **kwargs: Any,
+) -> Any:
+    hive_partitioning = kwargs.pop("hive_partitioning", False)
+    return read_multi_file_source(
+        source,
+        lambda path: read_impl(
+            path, native_namespace=native_namespace, **kwargs
+        ).to_native(),
+        implementation=Implementation.from_native_namespace(native_namespace),
+        hive_partitioning=hive_partitioning,
+    )
+
+
 def read_csv(
-    source: str,
+    source: str | Sequence[str],
     *,
     native_namespace: ModuleType,
     **kwargs: Any,
@@ -994,7 +1037,10 @@ def read_csv(
     """Read a CSV file into a DataFrame.
 
     Arguments:
-        source: Path to a file.
+        source: Path to a file, a glob pattern, or a list of either. Multiple files
+            are read concurrently and concatenated, with columns which only some of
+            them have filled with nulls for the others. Pass `hive_partitioning=True`
+            to also get a column for each `key=value` directory in their paths.
         native_namespace: The native library to use for DataFrame creation.
         kwargs: Extra keyword arguments which are passed to the native CSV reader.
             For example, you could use
@@ -1046,10 +1092,16 @@ def read_csv(
 
 
 def _read_csv_impl(
-    source: str, *, native_namespace: ModuleType, **kwargs: Any
+    source: str | Sequence[str], *, native_namespace: ModuleType, **kwargs: Any
 ) -> DataFrame[Any]:
     implementation = Implementation.from_native_namespace(native_namespace)
-    if implementation in (
+    if implementation in _MULTI_FILE_CSV_IMPLEMENTATIONS and _is_multi_file_read(
+        source, kwargs
+    ):
+        native_frame = _read_multi_file_source(
+            _read_csv_impl, source, native_namespace=native_namespace, **kwargs
+        )
+    elif implementation in (
         Implementation.POLARS,
         Implementation.PANDAS,
         Implementation.MODIN,
@@ -1059,6 +1111,7 @@ def _read_csv_impl(
     elif implementation is Implementation.PYARROW:
         from pyarrow import csv  # ignore-banned-import
 
+        assert isinstance(source, str)  # noqa: S101
         native_frame = csv.read_csv(source, **kwargs)
     else:  # pragma: no cover
         try:
@@ -1072,7 +1125,7 @@ def _read_csv_impl(
 
 
 def scan_csv(
-    source: str, *, native_namespace: ModuleType, **kwargs: Any
+    source: str | Sequence[str], *, native_namespace: ModuleType, **kwargs: Any
 ) -> LazyFrame[Any]:
     """Lazily read from a CSV file.
 
@@ -1080,7 +1133,10 @@ def scan_csv(
     a csv file eagerly and then converts the resulting dataframe to a lazyframe.
 
     Arguments:
-        source: Path to a file.
+        source: Path to a file, a glob pattern, or a list of either. Multiple files
+            are read concurrently and concatenated, with columns which only some of
+            them have filled with nulls for the others. Pass `hive_partitioning=True`
+            to also get a column for each `key=value` directory in their paths.
         native_namespace: The native library to use for DataFrame creation.
         kwargs: Extra keyword arguments which are passed to the native CSV reader.
             For example, you could use
@@ -1125,11 +1181,17 @@ def scan_csv(
 
 
 def _scan_csv_impl(
-    source: str, *, native_namespace: ModuleType, **kwargs: Any
+    source: str | Sequence[str], *, native_namespace: ModuleType, **kwargs: Any
 ) -> LazyFrame[Any]:
     implementation = Implementation.from_native_namespace(native_namespace)
     if implementation is Implementation.POLARS:
         native_frame = native_namespace.scan_csv(source, **kwargs)
+    elif implementation in _MULTI_FILE_CSV_IMPLEMENTATIONS and _is_multi_file_read(
+        source, kwargs
+    ):
+        native_frame = _read_multi_file_source(
+            _read_csv_impl, source, native_namespace=native_namespace, **kwargs
+        )
     elif implementation in (
         Implementation.PANDAS,
         Implementation.MODIN,
@@ -1141,6 +1203,7 @@ def _scan_csv_impl(
     elif implementation is Implementation.PYARROW:
         from pyarrow import csv  # ignore-banned-import
 
+        assert isinstance(source, str)  # noqa: S101
         native_frame = csv.read_csv(source, **kwargs)
     else:  # pragma: no cover
         try:
@@ -1154,7 +1217,7 @@ def _scan_csv_impl(
 
 
 def read_parquet(
-    source: str,
+    source: str | Sequence[str],
     *,
     native_namespace: ModuleType,
     **kwargs: Any,
@@ -1162,7 +1225,10 @@ def read_parquet(
     """Read into a DataFrame from a parquet file.
 
     Arguments:
-        source: Path to a file.
+        source: Path to a file, a glob pattern, or a list of either. Multiple files
+            are read concurrently and concatenated, with columns which only some of
+            them have filled with nulls for the others. Pass `hive_partitioning=True`
+            to also get a column for each `key=value` directory in their paths.
         native_namespace: The native library to use for DataFrame creation.
         kwargs: Extra keyword arguments which are passed to the native parquet reader.
             For example, you could use
@@ -1216,10 +1282,16 @@ def read_parquet(
 
 
 def _read_parquet_impl(
-    source: str, *, native_namespace: ModuleType, **kwargs: Any
+    source: str | Sequence[str], *, native_namespace: ModuleType, **kwargs: Any
 ) -> DataFrame[Any]:
     implementation = Implementation.from_native_namespace(native_namespace)
-    if implementation in (
+    if implementation in _MULTI_FILE_PARQUET_IMPLEMENTATIONS and _is_multi_file_read(
+        source, kwargs
+    ):
+        native_frame = _read_multi_file_source(
+            _read_parquet_impl, source, native_namespace=native_namespace, **kwargs
+        )
+    elif implementation in (
         Implementation.POLARS,
         Implementation.PANDAS,
         Implementation.MODIN,
@@ -1230,6 +1302,7 @@ def _read_parquet_impl(
     elif implementation is Implementation.PYARROW:
         import pyarrow.parquet as pq  # ignore-banned-import
 
+        assert isinstance(source, str)  # noqa: S101
         native_frame = pq.read_table(source, **kwargs)
     else:  # pragma: no cover
         try:
@@ -1243,15 +1316,19 @@ def _read_parquet_impl(
 
 
 def scan_parquet(
-    source: str, *, native_namespace: ModuleType, **kwargs: Any
+    source: str | Sequence[str], *, native_namespace: ModuleType, **kwargs: Any
 ) -> LazyFrame[Any]:
     """Lazily read from a parquet file.
 
-    For the libraries that do not support lazy dataframes, the function reads
-    a parquet file eagerly and then converts the resulting dataframe to a lazyframe.
+    For the libraries that do not support lazy dataframes, the file only gets read
+    when the resulting lazyframe is collected, and only the columns which the query
+    needs are loaded.
 
     Arguments:
-        source: Path to a file.
+        source: Path to a file, a glob pattern, or a list of either. Multiple files
+            are read concurrently and concatenated, with columns which only some of
+            them have filled with nulls for the others. Pass `hive_partitioning=True`
+            to also get a column for each `key=value` directory in their paths.
         native_namespace: The native library to use for DataFrame creation.
         kwargs: Extra keyword arguments which are passed to the native parquet reader.
             For example, you could use
@@ -1298,7 +1375,7 @@ def scan_parquet(
 
 
 def _scan_parquet_impl(
-    source: str, *, native_namespace: ModuleType, **kwargs: Any
+    source: str | Sequence[str], *, native_namespace: ModuleType, **kwargs: Any
 ) -> LazyFrame[Any]:
     implementation = Implementation.from_native_namespace(native_namespace)
     if implementation is Implementation.POLARS:
@@ -1307,14 +1384,32 @@ def _scan_parquet_impl(
         Implementation.PANDAS,
         Implementation.MODIN,
         Implementation.CUDF,
-        Implementation.DASK,
-        Implementation.DUCKDB,
+        Implementation.PYARROW,
     ):
+        # Eager backends: defer the read, so that it only loads what the query needs.
+        from narwhals._lazy_plan import LazyPlanFrame
+        from narwhals._lazy_plan import ScanParquetNode
+
+        backend_version = parse_version(native_namespace.__version__)
+        scan = ScanParquetNode(
+            source,
+            native_namespace=native_namespace,
+            implementation=implementation,
+            backend_version=backend_version,
+            version=Version.MAIN,
+            kwargs=kwargs,
+        )
+        return LazyFrame(
+            LazyPlanFrame(
+                scan,
+                implementation=implementation,
+                backend_version=backend_version,
+                version=Version.MAIN,
+            ),
+            level="lazy",
+        )
+    elif implementation in (Implementation.DASK, Implementation.DUCKDB):
         native_frame = native_namespace.read_parquet(source, **kwargs)
-    elif implementation is Implementation.PYARROW:
-        import pyarrow.parquet as pq  # ignore-banned-import
-
-        native_frame = pq.read_table(source, **kwargs)
     else:  # pragma: no cover
         try:
             # implementation is UNKNOWN, Narwhals extension using this feature should
@@ -2065,6 +2160,9 @@ class When:
 
 
 class Then(Expr):
+    def when(self, *predicates: IntoExpr | Iterable[IntoExpr]) -> ChainedWhen:
+        return ChainedWhen(self, *predicates)
+
     def otherwise(self, value: Any) -> Expr:
         return Expr(
             lambda plx: self._to_compliant_expr(plx).otherwise(
@@ -2073,6 +2171,19 @@ class Then(Expr):
         )
 
 
+class ChainedWhen(When):
+    def __init__(self, above: Then, *predicates: IntoExpr | Iterable[IntoExpr]) -> None:
+        super().__init__(*predicates)
+        self._above = above
+
+    def then(self, value: Any) -> Then:
+        return Then(
+            lambda plx: self._above._to_compliant_expr(plx)
+            .when(*self._extract_predicates(plx))
+            .then(extract_compliant(plx, value))
+        )
+
+
 def when(*predicates: IntoExpr | Iterable[IntoExpr]) -> When:
     """Start a `when-then-otherwise` expression.
 
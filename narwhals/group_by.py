@@ -23,6 +23,7 @@ class GroupBy(Generic[DataFrameT]):
     def __init__(self, df: DataFrameT, *keys: str, drop_null_keys: bool) -> None:
         self._df = cast(DataFrame[Any], df)
         self._keys = keys
+        self._drop_null_keys = drop_null_keys
         self._grouped = self._df._compliant_frame.group_by(
             *self._keys, drop_null_keys=drop_null_keys
         )
@@ -109,6 +110,12 @@ class GroupBy(Generic[DataFrameT]):
             │ c   ┆ 3   ┆ 1   │
             └─────┴─────┴─────┘
         """
+        if self._df._engine is not None:
+            return self._df._run_on_engine(  # type: ignore[return-value]
+                lambda df: df.group_by(
+                    *self._keys, drop_null_keys=self._drop_null_keys
+                ).agg(*aggs, **named_aggs)
+            )
         aggs, named_aggs = self._df._flatten_and_extract(*aggs, **named_aggs)
         return self._df._from_compliant_dataframe(  # type: ignore[return-value]
             self._grouped.agg(*aggs, **named_aggs),
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from datetime import datetime
 from datetime import timedelta
 from decimal import Decimal
@@ -426,8 +427,10 @@ def _from_native_impl(  # noqa: PLR0915
         msg = "Invalid parameter combination: `eager_only=True` and `eager_or_interchange_only=True`"
         raise ValueError(msg)
 
+    native_check = _find_native_object_check(native_object)
+
     # Extensions
-    if hasattr(native_object, "__narwhals_dataframe__"):
+    if native_check is None and hasattr(native_object, "__narwhals_dataframe__"):
         if series_only:
             if not pass_through:
                 msg = "Cannot only use `series_only` with dataframe"
@@ -437,7 +440,7 @@ def _from_native_impl(  # noqa: PLR0915
             native_object.__narwhals_dataframe__(),
             level="full",
         )
-    elif hasattr(native_object, "__narwhals_lazyframe__"):
+    elif native_check is None and hasattr(native_object, "__narwhals_lazyframe__"):
         if series_only:
             if not pass_through:
                 msg = "Cannot only use `series_only` with lazyframe"
@@ -452,7 +455,7 @@ def _from_native_impl(  # noqa: PLR0915
             native_object.__narwhals_lazyframe__(),
             level="full",
         )
-    elif hasattr(native_object, "__narwhals_series__"):
+    elif native_check is None and hasattr(native_object, "__narwhals_series__"):
         if not allow_series:
             if not pass_through:
                 msg = "Please set `allow_series=True` or `series_only=True`"
@@ -464,7 +467,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # Polars
-    elif is_polars_dataframe(native_object):
+    elif native_check is is_polars_dataframe:
         from narwhals._polars.dataframe import PolarsDataFrame
 
         if series_only:
@@ -481,7 +484,7 @@ def _from_native_impl(  # noqa: PLR0915
             ),
             level="full",
         )
-    elif is_polars_lazyframe(native_object):
+    elif native_check is is_polars_lazyframe:
         from narwhals._polars.dataframe import PolarsLazyFrame
 
         if series_only:
@@ -503,7 +506,7 @@ def _from_native_impl(  # noqa: PLR0915
             ),
             level="lazy",
         )
-    elif is_polars_series(native_object):
+    elif native_check is is_polars_series:
         from narwhals._polars.series import PolarsSeries
 
         pl = get_polars()
@@ -522,7 +525,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # pandas
-    elif is_pandas_dataframe(native_object):
+    elif native_check is is_pandas_dataframe:
         from narwhals._pandas_like.dataframe import PandasLikeDataFrame
 
         if series_only:
@@ -540,7 +543,7 @@ def _from_native_impl(  # noqa: PLR0915
             ),
             level="full",
         )
-    elif is_pandas_series(native_object):
+    elif native_check is is_pandas_series:
         from narwhals._pandas_like.series import PandasLikeSeries
 
         if not allow_series:
@@ -560,7 +563,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # Modin
-    elif is_modin_dataframe(native_object):  # pragma: no cover
+    elif native_check is is_modin_dataframe:  # pragma: no cover
         from narwhals._pandas_like.dataframe import PandasLikeDataFrame
 
         mpd = get_modin()
@@ -578,7 +581,7 @@ def _from_native_impl(  # noqa: PLR0915
             ),
             level="full",
         )
-    elif is_modin_series(native_object):  # pragma: no cover
+    elif native_check is is_modin_series:  # pragma: no cover
         from narwhals._pandas_like.series import PandasLikeSeries
 
         mpd = get_modin()
@@ -598,7 +601,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # cuDF
-    elif is_cudf_dataframe(native_object):  # pragma: no cover
+    elif native_check is is_cudf_dataframe:  # pragma: no cover
         from narwhals._pandas_like.dataframe import PandasLikeDataFrame
 
         cudf = get_cudf()
@@ -616,7 +619,7 @@ def _from_native_impl(  # noqa: PLR0915
             ),
             level="full",
         )
-    elif is_cudf_series(native_object):  # pragma: no cover
+    elif native_check is is_cudf_series:  # pragma: no cover
         from narwhals._pandas_like.series import PandasLikeSeries
 
         cudf = get_cudf()
@@ -636,7 +639,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # PyArrow
-    elif is_pyarrow_table(native_object):
+    elif native_check is is_pyarrow_table:
         from narwhals._arrow.dataframe import ArrowDataFrame
 
         pa = get_pyarrow()
@@ -653,7 +656,7 @@ def _from_native_impl(  # noqa: PLR0915
             ),
             level="full",
         )
-    elif is_pyarrow_chunked_array(native_object):
+    elif native_check is is_pyarrow_chunked_array:
         from narwhals._arrow.series import ArrowSeries
 
         pa = get_pyarrow()
@@ -673,7 +676,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # Dask
-    elif is_dask_dataframe(native_object):
+    elif native_check is is_dask_dataframe:
         from narwhals._dask.dataframe import DaskLazyFrame
 
         if series_only:
@@ -702,7 +705,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # DuckDB
-    elif is_duckdb_relation(native_object):
+    elif native_check is is_duckdb_relation:
         from narwhals._duckdb.dataframe import DuckDBLazyFrame
 
         if eager_only or series_only:  # pragma: no cover
@@ -732,7 +735,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # Ibis
-    elif is_ibis_table(native_object):  # pragma: no cover
+    elif native_check is is_ibis_table:  # pragma: no cover
         from narwhals._ibis.dataframe import IbisInterchangeFrame
 
         if eager_only or series_only:
@@ -754,7 +757,7 @@ def _from_native_impl(  # noqa: PLR0915
         )
 
     # PySpark
-    elif is_pyspark_dataframe(native_object):  # pragma: no cover
+    elif native_check is is_pyspark_dataframe:  # pragma: no cover
         from narwhals._spark_like.dataframe import SparkLikeLazyFrame
 
         if series_only:
@@ -795,6 +798,60 @@ def _from_native_impl(  # noqa: PLR0915
     return native_object
 
 
+# Checks for the native objects which `from_native` supports, in the order in which
+# `_from_native_impl` tries them.
+_NATIVE_OBJECT_CHECKS: tuple[Callable[[Any], bool], ...] = (
+    is_polars_dataframe,
+    is_polars_lazyframe,
+    is_polars_series,
+    is_pandas_dataframe,
+    is_pandas_series,
+    is_modin_dataframe,
+    is_modin_series,
+    is_cudf_dataframe,
+    is_cudf_series,
+    is_pyarrow_table,
+    is_pyarrow_chunked_array,
+    is_dask_dataframe,
+    is_duckdb_relation,
+    is_ibis_table,
+    is_pyspark_dataframe,
+)
+# Type of native object -> which of `_NATIVE_OBJECT_CHECKS` it passes (if any), so
+# that the checks only need running once per type. Weak keys, so that the cache
+# doesn't keep dynamically created classes alive.
+_native_object_check_cache: weakref.WeakKeyDictionary[
+    type, Callable[[Any], bool] | None
+] = weakref.WeakKeyDictionary()
+
+
+def _find_native_object_check(native_object: Any) -> Callable[[Any], bool] | None:
+    """Return the check from `_NATIVE_OBJECT_CHECKS` which `native_object` passes.
+
+    Types which implement the Narwhals extension protocol always get `None`, so that
+    the protocol takes precedence.
+    """
+    tp = type(native_object)
+    try:
+        return _native_object_check_cache[tp]
+    except KeyError:
+        pass
+    native_check = None
+    if not any(
+        hasattr(tp, attr)
+        for attr in (
+            "__narwhals_dataframe__",
+            "__narwhals_lazyframe__",
+            "__narwhals_series__",
+        )
+    ):
+        native_check = next(
+            (check for check in _NATIVE_OBJECT_CHECKS if check(native_object)), None
+        )
+    _native_object_check_cache[tp] = native_check
+    return native_check
+
+
 def get_native_namespace(
     obj: DataFrame[Any]
     | LazyFrame[Any]
@@ -4,6 +4,7 @@ import os
 import re
 from enum import Enum
 from enum import auto
+from functools import lru_cache
 from secrets import token_hex
 from typing import TYPE_CHECKING
 from typing import Any
@@ -303,6 +304,7 @@ MIN_VERSIONS: dict[Implementation, tuple[int, ...]] = {
 }
 
 
+@lru_cache(maxsize=16)
 def validate_backend_version(
     implementation: Implementation, backend_version: tuple[int, ...]
 ) -> None:
@@ -372,6 +374,7 @@ def _is_iterable(arg: Any | Iterable[Any]) -> bool:
     return isinstance(arg, Iterable) and not isinstance(arg, (str, bytes, Series))
 
 
+@lru_cache(maxsize=16)
 def parse_version(version: str) -> tuple[int, ...]:
     """Simple version parser; split into a tuple of ints for comparison.
 
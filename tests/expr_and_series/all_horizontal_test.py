@@ -104,3 +104,14 @@ def test_horizontal_expressions_empty(constructor: Constructor) -> None:
         ValueError, match=r"At least one expression must be passed.*min_horizontal"
     ):
         df.select(nw.min_horizontal())
+
+
+def test_allh_kleene(constructor_eager: ConstructorEager) -> None:
+    data = {
+        "a": [True, None, False, None, True],
+        "b": [None, None, True, False, True],
+    }
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(all=nw.all_horizontal("a", "b"))
+    expected = {"all": [None, None, False, False, True]}
+    assert_equal_data(result, expected)
@@ -6,6 +6,7 @@ import pytest
 
 import narwhals.stable.v1 as nw
 from tests.utils import Constructor
+from tests.utils import ConstructorEager
 from tests.utils import assert_equal_data
 
 
@@ -35,3 +36,14 @@ def test_anyh_all(constructor: Constructor) -> None:
     result = df.select(nw.any_horizontal(nw.all()))
     expected = {"a": [False, True, True]}
     assert_equal_data(result, expected)
+
+
+def test_anyh_kleene(constructor_eager: ConstructorEager) -> None:
+    data = {
+        "a": [True, None, False, None, False],
+        "b": [None, None, True, False, False],
+    }
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(any=nw.any_horizontal("a", "b"))
+    expected = {"any": [True, None, True, None, False]}
+    assert_equal_data(result, expected)
@@ -289,3 +289,33 @@ def test_arithmetic_series_left_literal(
     df = nw.from_native(constructor_eager(data))
     result = df.select(getattr(lhs, attr)(nw.col("a")))
     assert_equal_data(result, {"literal": expected})
+
+
+def test_arithmetic_with_aggregation(constructor_eager: ConstructorEager) -> None:
+    data = {"a": [1, 2, 3], "b": [1.0, 2.0, 6.0]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        c=nw.col("a") - nw.col("a").mean(),
+        d=nw.col("b") / nw.col("b").max(),
+        e=nw.col("a") + nw.col("b").min(),
+    )
+    expected = {"c": [-1.0, 0.0, 1.0], "d": [1 / 6, 1 / 3, 1.0], "e": [2.0, 3.0, 4.0]}
+    assert_equal_data(result, expected)
+
+
+def test_arithmetic_with_aggregation_preserves_dtype() -> None:
+    data = {
+        "a": pd.Series([1, 2, 3], dtype="int8"),
+        "b": pd.Series([1.0, 2.0, 3.0], dtype="float32"),
+        "c": [1.0, 2.0, 3.0],
+    }
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    result = df.select(
+        nw.col("a") + nw.col("a").max(),
+        nw.col("b") - nw.col("c").mean(),
+        nw.col("c") * nw.col("a").min(),
+    )
+    assert result.schema == {"a": nw.Int8, "b": nw.Float64, "c": nw.Float64}
+    assert_equal_data(
+        result, {"a": [4, 5, 6], "b": [-1.0, 0.0, 1.0], "c": [1.0, 2.0, 3.0]}
+    )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import hypothesis.strategies as st
+import pandas as pd
+import pyarrow as pa
+import pytest
+from hypothesis import given
+
+import narwhals.stable.v1 as nw
+from tests.utils import PANDAS_VERSION
+from tests.utils import ConstructorEager
+from tests.utils import assert_equal_data
+
+data = {"a": [None, 1, 2, None, 4, 6, 11]}
+
+kwargs_and_expected: dict[str, dict[str, Any]] = {
+    "x1": {
+        "kwargs": {"window_size": 3},
+        "expected_min": [None] * 6 + [4],
+        "expected_max": [None] * 6 + [11],
+    },
+    "x2": {
+        "kwargs": {"window_size": 3, "min_periods": 1},
+        "expected_min": [None, 1, 1, 1, 2, 4, 4],
+        "expected_max": [None, 1, 2, 2, 4, 6, 11],
+    },
+    "x3": {
+        "kwargs": {"window_size": 2, "min_periods": 1},
+        "expected_min": [None, 1, 1, 2, 4, 4, 6],
+        "expected_max": [None, 1, 2, 2, 4, 6, 11],
+    },
+    "x4": {
+        "kwargs": {"window_size": 5, "min_periods": 1, "center": True},
+        "expected_min": [1, 1, 1, 1, 2, 4, 4],
+        "expected_max": [2, 2, 4, 6, 11, 11, 11],
+    },
+    "x5": {
+        "kwargs": {"window_size": 4, "min_periods": 1, "center": True},
+        "expected_min": [1, 1, 1, 1, 2, 4, 4],
+        "expected_max": [1, 2, 2, 4, 6, 11, 11],
+    },
+}
+
+
+@pytest.mark.filterwarnings(
+    "ignore:`Expr.rolling_m.*` is being called from the stable API although considered an unstable feature."
+)
+def test_rolling_min_max_expr(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager(data))
+    result = df.select(
+        **{
+            f"{name}_min": nw.col("a").rolling_min(**values["kwargs"])
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_max": nw.col("a").rolling_max(**values["kwargs"])
+            for name, values in kwargs_and_expected.items()
+        },
+    )
+    expected = {
+        **{
+            f"{name}_min": values["expected_min"]
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_max": values["expected_max"]
+            for name, values in kwargs_and_expected.items()
+        },
+    }
+    assert_equal_data(result, expected)
+
+
+@pytest.mark.filterwarnings(
+    "ignore:`Series.rolling_m.*` is being called from the stable API although considered an unstable feature."
+)
+def test_rolling_min_max_series(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        **{
+            f"{name}_min": df["a"].rolling_min(**values["kwargs"])
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_max": df["a"].rolling_max(**values["kwargs"])
+            for name, values in kwargs_and_expected.items()
+        },
+    )
+    expected = {
+        **{
+            f"{name}_min": values["expected_min"]
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_max": values["expected_max"]
+            for name, values in kwargs_and_expected.items()
+        },
+    }
+    assert_equal_data(result, expected)
+
+
+@given(
+    center=st.booleans(),
+    values=st.lists(st.floats(-100, 100), min_size=1, max_size=10),
+)
+@pytest.mark.skipif(PANDAS_VERSION < (1,), reason="too old for pyarrow")
+@pytest.mark.slow
+@pytest.mark.filterwarnings("ignore:.*:narwhals.exceptions.NarwhalsUnstableWarning")
+def test_rolling_min_max_hypothesis(center: bool, values: list[float]) -> None:  # noqa: FBT001
+    s = pd.Series(values)
+    n_missing = random.randint(0, len(s) - 1)  # noqa: S311
+    window_size = random.randint(1, len(s))  # noqa: S311
+    min_periods = random.randint(1, window_size)  # noqa: S311
+    mask = random.sample(range(len(s)), n_missing)
+    s[mask] = None
+    df = pd.DataFrame({"a": s})
+    rolling = s.rolling(window=window_size, center=center, min_periods=min_periods)
+    expected = pd.DataFrame({"a": rolling.min(), "b": rolling.max()})
+    result = nw.from_native(pa.Table.from_pandas(df)).select(
+        nw.col("a").rolling_min(window_size, center=center, min_periods=min_periods),
+        b=nw.col("a").rolling_max(window_size, center=center, min_periods=min_periods),
+    )
+    expected_dict = nw.from_native(expected, eager_only=True).to_dict(as_series=False)
+    assert_equal_data(result, expected_dict)
+
+
+@pytest.mark.filterwarnings("ignore:.*:narwhals.exceptions.NarwhalsUnstableWarning")
+def test_rolling_min_pyarrow_invalid_dtype() -> None:
+    df = nw.from_native(pa.table({"a": ["x", "y", "z"]}), eager_only=True)
+    with pytest.raises(TypeError, match="rolling_min"):
+        df["a"].rolling_min(2)
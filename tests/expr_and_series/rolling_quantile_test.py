@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import hypothesis.strategies as st
+import pandas as pd
+import pyarrow as pa
+import pytest
+from hypothesis import given
+
+import narwhals.stable.v1 as nw
+from tests.utils import PANDAS_VERSION
+from tests.utils import ConstructorEager
+from tests.utils import assert_equal_data
+
+data = {"a": [None, 1, 2, None, 4, 6, 11]}
+
+kwargs_and_expected: dict[str, dict[str, Any]] = {
+    "x1": {
+        "kwargs": {"window_size": 3},
+        "expected_median": [None] * 6 + [6.0],
+        "expected_quantile": [None] * 6 + [5.0],
+    },
+    "x2": {
+        "kwargs": {"window_size": 3, "min_periods": 1},
+        "expected_median": [None, 1.0, 1.5, 1.5, 3.0, 5.0, 6.0],
+        "expected_quantile": [None, 1.0, 1.25, 1.25, 2.5, 4.5, 5.0],
+    },
+    "x3": {
+        "kwargs": {"window_size": 2, "min_periods": 1},
+        "expected_median": [None, 1.0, 1.5, 2.0, 4.0, 5.0, 8.5],
+        "expected_quantile": [None, 1.0, 1.25, 2.0, 4.0, 4.5, 7.25],
+    },
+    "x4": {
+        "kwargs": {"window_size": 5, "min_periods": 1, "center": True},
+        "expected_median": [1.5, 1.5, 2.0, 3.0, 5.0, 6.0, 6.0],
+        "expected_quantile": [1.25, 1.25, 1.5, 1.75, 3.5, 5.0, 5.0],
+    },
+    "x5": {
+        "kwargs": {"window_size": 4, "min_periods": 1, "center": True},
+        "expected_median": [1.0, 1.5, 1.5, 2.0, 4.0, 6.0, 6.0],
+        "expected_quantile": [1.0, 1.25, 1.25, 1.5, 3.0, 5.0, 5.0],
+    },
+}
+
+
+@pytest.mark.filterwarnings(
+    "ignore:`Expr.rolling_.*` is being called from the stable API although considered an unstable feature."
+)
+def test_rolling_quantile_expr(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager(data))
+    result = df.select(
+        **{
+            f"{name}_median": nw.col("a").rolling_median(**values["kwargs"])
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_quantile": nw.col("a").rolling_quantile(
+                0.25, "linear", **values["kwargs"]
+            )
+            for name, values in kwargs_and_expected.items()
+        },
+    )
+    expected = {
+        **{
+            f"{name}_median": values["expected_median"]
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_quantile": values["expected_quantile"]
+            for name, values in kwargs_and_expected.items()
+        },
+    }
+    assert_equal_data(result, expected)
+
+
+@pytest.mark.filterwarnings(
+    "ignore:`Series.rolling_.*` is being called from the stable API although considered an unstable feature."
+)
+def test_rolling_quantile_series(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        **{
+            f"{name}_median": df["a"].rolling_median(**values["kwargs"])
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_quantile": df["a"].rolling_quantile(
+                0.25, "linear", **values["kwargs"]
+            )
+            for name, values in kwargs_and_expected.items()
+        },
+    )
+    expected = {
+        **{
+            f"{name}_median": values["expected_median"]
+            for name, values in kwargs_and_expected.items()
+        },
+        **{
+            f"{name}_quantile": values["expected_quantile"]
+            for name, values in kwargs_and_expected.items()
+        },
+    }
+    assert_equal_data(result, expected)
+
+
+@given(
+    center=st.booleans(),
+    quantile=st.floats(0, 1),
+    interpolation=st.sampled_from(["linear", "lower", "higher"]),
+    values=st.lists(st.floats(-100, 100), min_size=1, max_size=10),
+)
+@pytest.mark.skipif(PANDAS_VERSION < (1,), reason="too old for pyarrow")
+@pytest.mark.slow
+@pytest.mark.filterwarnings("ignore:.*:narwhals.exceptions.NarwhalsUnstableWarning")
+def test_rolling_quantile_hypothesis(
+    center: bool,  # noqa: FBT001
+    quantile: float,
+    interpolation: Any,
+    values: list[float],
+) -> None:
+    s = pd.Series(values)
+    n_missing = random.randint(0, len(s) - 1)  # noqa: S311
+    window_size = random.randint(1, len(s))  # noqa: S311
+    min_periods = random.randint(1, window_size)  # noqa: S311
+    mask = random.sample(range(len(s)), n_missing)
+    s[mask] = None
+    df = pd.DataFrame({"a": s})
+    expected = (
+        s.rolling(window=window_size, center=center, min_periods=min_periods)
+        .quantile(quantile, interpolation=interpolation)
+        .to_frame("a")
+    )
+    result = nw.from_native(pa.Table.from_pandas(df)).select(
+        nw.col("a").rolling_quantile(
+            quantile,
+            interpolation,
+            window_size,
+            center=center,
+            min_periods=min_periods,
+        )
+    )
+    expected_dict = nw.from_native(expected, eager_only=True).to_dict(as_series=False)
+    assert_equal_data(result, expected_dict)
+
+
+@pytest.mark.filterwarnings("ignore:.*:narwhals.exceptions.NarwhalsUnstableWarning")
+def test_rolling_quantile_pyarrow_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Windows get evaluated a few rows at a time, to bound memory use.
+    monkeypatch.setattr("narwhals._arrow.utils._ROLLING_QUANTILE_BLOCK_SIZE", 7)
+    s = pd.Series([float(i % 5) for i in range(20)])
+    s[[3, 11]] = None
+    expected = s.rolling(window=3, min_periods=1).quantile(0.25).to_frame("a")
+    result = nw.from_native(pa.table({"a": s})).select(
+        nw.col("a").rolling_quantile(0.25, "linear", 3, min_periods=1)
+    )
+    expected_dict = nw.from_native(expected, eager_only=True).to_dict(as_series=False)
+    assert_equal_data(result, expected_dict)
+
+
+@pytest.mark.filterwarnings("ignore:.*:narwhals.exceptions.NarwhalsUnstableWarning")
+@pytest.mark.parametrize("quantile", [0.0, 0.1, 0.3, 0.5, 0.7, 1.0])
+def test_rolling_quantile_pyarrow_nearest(quantile: float) -> None:
+    pytest.importorskip("polars")
+    import polars as pl
+
+    data = {"a": [1.0, 5.0, None, 2.0, 4.0, 3.0, 6.0, None, 0.0, 7.0]}
+    # "nearest" picks the element at `floor(quantile * count)`, like Polars.
+    expected = pl.DataFrame(data).select(
+        pl.col("a").rolling_quantile(quantile, "nearest", window_size=4, min_periods=1)
+    )
+    result = nw.from_native(pa.table(data)).select(
+        nw.col("a").rolling_quantile(quantile, "nearest", 4, min_periods=1)
+    )
+    assert_equal_data(result, expected.to_dict(as_series=False))
@@ -137,3 +137,13 @@ def test_rolling_var_hypothesis(center: bool, values: list[float]) -> None:  # n
     )
     expected_dict = nw.from_native(expected, eager_only=True).to_dict(as_series=False)
     assert_equal_data(result, expected_dict)
+
+
+@pytest.mark.filterwarnings("ignore:.*:narwhals.exceptions.NarwhalsUnstableWarning")
+def test_rolling_var_large_magnitude(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(
+        constructor_eager({"a": [1e9 + x for x in data["a"]]}), eager_only=True
+    )
+    result = df.select(nw.col("a").rolling_var(3))
+    expected = {"a": [None, None, 1 / 3, 1.0, 4 / 3, 7 / 3, 3.0]}
+    assert_equal_data(result, expected)
@@ -141,3 +141,58 @@ def test_when_then_otherwise_lit_str(
     result = df.select(nw.when(nw.col("a") > 1).then(nw.col("b")).otherwise(nw.lit("z")))
     expected = {"b": ["z", "b", "c"]}
     assert_equal_data(result, expected)
+
+
+def test_when_then_scalar_broadcast(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.select(
+        nw.when(nw.col("a") > 1).then(1.5).otherwise(nw.col("c")),
+        b=nw.when(nw.col("d")).then(1),
+    )
+    expected = {"literal": [4.1, 1.5, 1.5], "b": [1, None, 1]}
+    assert_equal_data(result, expected)
+
+
+def test_when_then_chained(constructor: Constructor) -> None:
+    df = nw.from_native(constructor(data))
+    result = df.select(
+        nw.when(nw.col("a") == 1)
+        .then(nw.col("c"))
+        .when(nw.col("d"))
+        .then(nw.col("e"))
+        .otherwise(0.0)
+        .alias("x"),
+        nw.when(nw.col("a") > 1)
+        .then(10)
+        .when(nw.col("a") > 2)
+        .then(20)
+        .when(nw.col("c") > 4)
+        .then(30)
+        .alias("y"),
+    )
+    expected = {"x": [4.1, 0.0, 1.1], "y": [30, 10, 10]}
+    assert_equal_data(result, expected)
+
+
+def test_when_then_chained_no_otherwise(constructor: Constructor) -> None:
+    df = nw.from_native(constructor(data))
+    result = df.select(
+        nw.when(nw.col("a") == 1)
+        .then(nw.col("c"))
+        .when(nw.col("a") == 2)
+        .then(nw.col("e"))
+        .alias("x")
+    )
+    expected = {"x": [4.1, 2.0, None]}
+    assert_equal_data(result, expected)
+
+
+def test_when_then_reused(constructor: Constructor) -> None:
+    df = nw.from_native(constructor(data))
+    then = nw.when(nw.col("a") > 1).then(10)
+    result = df.select(then.otherwise(5).alias("x"))
+    assert_equal_data(result, {"x": [5, 10, 10]})
+    result = df.select(then.otherwise(0).alias("x"))
+    assert_equal_data(result, {"x": [0, 10, 10]})
+    result = df.select(then.alias("x"))
+    assert_equal_data(result, {"x": [None, 10, 10]})
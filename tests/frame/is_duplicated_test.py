@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
 import narwhals.stable.v1 as nw
 from tests.utils import ConstructorEager
 from tests.utils import assert_equal_data
@@ -12,3 +17,49 @@ def test_is_duplicated(constructor_eager: ConstructorEager) -> None:
     result = nw.concat([df, df.head(1)]).is_duplicated()
     expected = {"is_duplicated": [True, False, False, True]}
     assert_equal_data({"is_duplicated": result}, expected)
+
+
+def test_is_duplicated_with_nulls(constructor_eager: ConstructorEager) -> None:
+    data = {"a": [1, None, None, 1], "b": [None, 2.0, 2.0, None], "c": [1, 2, 3, 1]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = {
+        "all": df.is_duplicated(),
+        "subset": df.select("a", "b").is_duplicated(),
+        "unique": df.is_unique(),
+    }
+    expected = {
+        "all": [True, False, False, True],
+        "subset": [True, True, True, True],
+        "unique": [False, True, True, False],
+    }
+    assert_equal_data(result, expected)
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        # Dictionary order differs from order of appearance.
+        [pa.DictionaryArray.from_arrays([1, 0, 0, 2], ["a", "b", "c"])],
+        # Each chunk has its own dictionary.
+        [
+            pa.array(["b", "a"]).dictionary_encode(),
+            pa.array(["a", "c"]).dictionary_encode(),
+        ],
+    ],
+)
+def test_is_duplicated_pyarrow_categorical(chunks: list[Any]) -> None:
+    table = pa.table({"x": pa.chunked_array(chunks), "y": [1, 2, 3, 4]})
+    df = nw.from_native(table, eager_only=True)
+    result = df.select(
+        nw.col("x").is_first_distinct().alias("first"),
+        nw.col("x").is_last_distinct().alias("last"),
+        nw.col("x").is_duplicated().alias("duplicated"),
+    )
+    expected = {
+        "first": [True, True, False, True],
+        "last": [True, False, True, True],
+        "duplicated": [False, True, True, False],
+    }
+    assert_equal_data(result, expected)
+    assert_equal_data(df.unique(["x"], keep="first").select("y"), {"y": [1, 2, 4]})
+    assert [key for key, _ in df.group_by("x")] == [("b",), ("a",), ("c",)]
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -145,6 +146,31 @@ def test_cross_join_non_pandas() -> None:
     assert_equal_data(result, expected)
 
 
+@pytest.mark.parametrize("implementation", ["pyarrow", "modin"])
+def test_cross_join_preserves_left_order(implementation: str) -> None:
+    left = pd.DataFrame({"a": [3, 1], "b": ["x", "y"]}, index=[10, 5])
+    right = pd.DataFrame({"a": [7, 8, 9]}, index=[2, 0, 1])
+    if implementation == "pyarrow":
+        import pyarrow as pa
+
+        df = nw.from_native(pa.Table.from_pandas(left, preserve_index=False))
+        other = nw.from_native(pa.Table.from_pandas(right, preserve_index=False))
+    else:
+        df = nw.from_native(left)
+        other = nw.from_native(right)
+        # HACK to force testing for a non-pandas codepath
+        df._compliant_frame._implementation = Implementation.MODIN
+    result = df.join(other, how="cross", suffix="_other")  # type: ignore[arg-type]
+    expected = {
+        "a": [3, 3, 3, 1, 1, 1],
+        "b": ["x", "x", "x", "y", "y", "y"],
+        "a_other": [7, 8, 9, 7, 8, 9],
+    }
+    assert_equal_data(result, expected)
+    assert len(df.join(other.head(0), how="cross").collect_schema()) == 3  # type: ignore[arg-type]
+    assert len(nw.to_native(df.join(other.head(0), how="cross"))) == 0  # type: ignore[arg-type]
+
+
 @pytest.mark.parametrize(
     ("join_key", "filter_expr", "expected"),
     [
@@ -359,7 +385,7 @@ def test_joinasof_numeric(
     constructor: Constructor,
     request: pytest.FixtureRequest,
 ) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "cudf", "duckdb", "pyspark")):
+    if any(x in str(constructor) for x in ("cudf", "duckdb", "pyspark")):
         request.applymarker(pytest.mark.xfail)
     if PANDAS_VERSION < (2, 1) and (
         ("pandas_pyarrow" in str(constructor)) or ("pandas_nullable" in str(constructor))
@@ -418,7 +444,7 @@ def test_joinasof_time(
     constructor: Constructor,
     request: pytest.FixtureRequest,
 ) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "cudf", "duckdb", "pyspark")):
+    if any(x in str(constructor) for x in ("cudf", "duckdb", "pyspark")):
         request.applymarker(pytest.mark.xfail)
     if PANDAS_VERSION < (2, 1) and ("pandas_pyarrow" in str(constructor)):
         request.applymarker(pytest.mark.xfail)
@@ -499,7 +525,7 @@ def test_joinasof_by(
     constructor: Constructor,
     request: pytest.FixtureRequest,
 ) -> None:
-    if any(x in str(constructor) for x in ("pyarrow_table", "cudf", "duckdb", "pyspark")):
+    if any(x in str(constructor) for x in ("cudf", "duckdb", "pyspark")):
         request.applymarker(pytest.mark.xfail)
     if PANDAS_VERSION < (2, 1) and (
         ("pandas_pyarrow" in str(constructor)) or ("pandas_nullable" in str(constructor))
@@ -531,6 +557,43 @@ def test_joinasof_by(
     assert_equal_data(result_by, expected)
 
 
+@pytest.mark.parametrize("strategy", ["backward", "forward", "nearest"])
+def test_joinasof_pyarrow_vs_polars(
+    strategy: Literal["backward", "forward", "nearest"],
+) -> None:
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    import polars as pl
+    import pyarrow as pa
+
+    rng = np.random.default_rng(1)
+    left = {
+        "t": np.sort(rng.integers(0, 50, 200)),
+        "g": rng.choice(["x", "y", "z"], 200),
+        "a": np.arange(200),
+    }
+    right = {
+        "s": np.sort(rng.integers(0, 50, 40)),
+        "h": rng.choice(["x", "y"], 40),
+        "a": np.arange(40),
+    }
+    kwargs: dict[str, Any] = {
+        "left_on": "t",
+        "right_on": "s",
+        "by_left": "g",
+        "by_right": "h",
+        "strategy": strategy,
+    }
+    expected = pl.DataFrame(left).join_asof(pl.DataFrame(right), **kwargs)
+    # The left table doesn't need to be sorted.
+    result = (
+        nw.from_native(pa.table(left)[::-1], eager_only=True)
+        .join_asof(nw.from_native(pa.table(right), eager_only=True), **kwargs)
+        .sort("a")
+    )
+    assert_equal_data(result, expected.to_dict(as_series=False))
+
+
 @pytest.mark.parametrize("strategy", ["back", "furthest"])
 def test_joinasof_not_implemented(
     constructor: Constructor, strategy: Literal["backward", "forward"]
@@ -623,3 +686,65 @@ def test_joinasof_by_exceptions(constructor: Constructor) -> None:
         match="If `by` is specified, `by_left` and `by_right` should be None.",
     ):
         df.join_asof(df, on="antananarivo", by_right="bob", by="bob")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("dtype", ["float64", "Int64"])
+@pytest.mark.parametrize("on", ["a", ["a", "b"]])
+def test_semi_anti_join_pandas_missing_keys(dtype: str, on: str | list[str]) -> None:
+    df = pd.DataFrame(
+        {"a": pd.Series([3, None, 1], dtype=dtype), "b": ["z", None, "x"], "c": [1, 2, 3]}
+    )
+    other = pd.DataFrame({"a": pd.Series([None, 3], dtype=dtype), "b": [None, "z"]})
+    df_nw = nw.from_native(df, eager_only=True)
+    other_nw = nw.from_native(other, eager_only=True)
+    # Like `merge`, missing keys match missing keys, and the left order is kept.
+    result = df_nw.join(other_nw, on=on, how="semi")
+    assert result["c"].to_list() == [1, 2]
+    result = df_nw.join(other_nw, on=on, how="anti")
+    assert result["c"].to_list() == [3]
+
+
+@pytest.mark.parametrize("how", ["inner", "semi", "anti"])
+def test_join_pandas_incompatible_keys(how: Literal["inner", "semi", "anti"]) -> None:
+    df = nw.from_native(pd.DataFrame({"a": [1, 2], "b": [3, 4]}), eager_only=True)
+    other = nw.from_native(pd.DataFrame({"a": ["1", "x"]}), eager_only=True)
+    with pytest.raises(ValueError, match="You are trying to merge on int64 and object"):
+        df.join(other, on="a", how=how)
+
+
+@pytest.mark.parametrize(
+    ("how", "expected"),
+    [
+        ("semi", {"a": [1, 2, 2], "b": [4, 5, 6]}),
+        ("anti", {"a": [3, 4], "b": [7, 8]}),
+        (
+            "cross",
+            {
+                "a": [1, 1, 2, 2, 2, 2, 3, 3, 4, 4],
+                "b": [4, 4, 5, 5, 6, 6, 7, 7, 8, 8],
+                "a_right": [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+            },
+        ),
+    ],
+)
+def test_join_dask_broadcast_single_partition(
+    how: Literal["semi", "anti", "cross"], expected: dict[str, list[int]]
+) -> None:
+    pytest.importorskip("dask")
+    pytest.importorskip("dask_expr", exc_type=ImportError)
+    import dask.dataframe as dd
+
+    # `dd.from_pandas` isn't explicitly re-exported in dask's type hints.
+    from_pandas = dd.from_pandas  # type: ignore[attr-defined]
+    df = nw.from_native(
+        from_pandas(
+            pd.DataFrame({"a": [1, 2, 2, 3, 4], "b": [4, 5, 6, 7, 8]}), npartitions=3
+        )
+    )
+    other = nw.from_native(from_pandas(pd.DataFrame({"a": [1, 2]}), npartitions=1))
+    on = None if how == "cross" else "a"
+    result = df.join(other, on=on, how=how)  # type: ignore[arg-type]
+    # The single-partition side is joined to each partition in place, no shuffle.
+    graph = nw.to_native(result).optimize().expr.walk()
+    assert not any("Shuffle" in type(node).__name__ for node in graph)
+    assert_equal_data(result.sort(*expected), expected)
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+import pytest
 
 import narwhals as nw
 import narwhals.stable.v1 as nw_v1
+from narwhals._arrow.dataframe import ArrowDataFrame
+from narwhals._pandas_like.dataframe import PandasLikeDataFrame
+from tests.utils import assert_equal_data
 
 if TYPE_CHECKING:
     from tests.utils import ConstructorEager
@@ -16,3 +26,84 @@ def test_lazy(constructor_eager: ConstructorEager) -> None:
     df = nw_v1.from_native(constructor_eager({"a": [1, 2, 3]}), eager_only=True)
     result = df.lazy()
     assert isinstance(result, nw_v1.LazyFrame)
+
+
+@pytest.mark.parametrize(
+    ("native_constructor", "compliant_cls"),
+    [(pd.DataFrame, PandasLikeDataFrame), (pa.table, ArrowDataFrame)],
+)
+def test_lazy_is_deferred(
+    native_constructor: Callable[[dict[str, list[Any]]], Any],
+    compliant_cls: type[PandasLikeDataFrame | ArrowDataFrame],
+) -> None:
+    df = nw.from_native(native_constructor({"a": [3, 1, 2], "b": [4, 5, 6]}))
+    with mock.patch.object(
+        compliant_cls, "sort", autospec=True, side_effect=compliant_cls.sort
+    ) as sort:
+        result = (
+            df.lazy()
+            .with_columns(c=nw.col("a") + nw.col("b"))
+            .sort("a")
+            .filter(nw.col("b") > 4)
+        )
+        assert sort.call_count == 0
+        # The schema is worked out by running the plan on none of the rows.
+        assert result.collect_schema() == {
+            "a": nw.Int64,
+            "b": nw.Int64,
+            "c": nw.Int64,
+        }
+        assert result.columns == ["a", "b", "c"]
+        assert sort.call_count == 1
+        assert len(sort.call_args[0][0]) == 0
+        collected = result.collect()
+        assert sort.call_count == 2
+        # The filter runs before the sort.
+        assert len(sort.call_args[0][0]) == 2
+        # Collecting again reuses the result.
+        assert result.collect().to_native() is collected.to_native()
+        assert sort.call_count == 2
+    assert_equal_data(collected, {"a": [1, 2], "b": [5, 6], "c": [6, 8]})
+
+
+def test_lazy_plan_optimizations(constructor_eager: ConstructorEager) -> None:
+    data = {"a": [3, 1, 2, None], "b": [4.0, 5.0, 6.0, 7.0], "c": ["x", "y", "x", "y"]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    lf = df.lazy()
+    other = df.lazy().select("c", d=nw.col("b") * 2).group_by("c").agg(nw.col("d").min())
+    result = (
+        lf.with_columns(d=nw.col("a") + 1)
+        .with_columns(e=nw.col("b") - 1)
+        # Depends on the previous step, so can't be fused with it.
+        .with_columns(f=nw.col("e") * 2)
+        .filter(nw.col("b") > 4)
+        .filter(~nw.col("a").is_null())
+        .sort("a", descending=True)
+        .filter(nw.col("a") < 3)
+        # Not elementwise, so has to stay after the `sort` and `filter`s.
+        .with_columns(g=nw.col("b").cum_sum())
+        .join(other.rename({"d": "h"}), on="c", how="left")
+        .select("a", "d", "f", "g", "h")
+    )
+    expected = {
+        "a": [2, 1],
+        "d": [3, 2],
+        "f": [10.0, 8.0],
+        "g": [6.0, 11.0],
+        "h": [8.0, 10.0],
+    }
+    assert_equal_data(result, expected)
+
+
+def test_lazy_self_join(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager({"a": [1, 2], "b": [3, 4]}), eager_only=True)
+    lf = df.lazy().with_columns(c=nw.col("a") * 10)
+    result = lf.join(lf, on="a", how="inner").sort("a")
+    expected = {
+        "a": [1, 2],
+        "b": [3, 4],
+        "c": [10, 20],
+        "b_right": [3, 4],
+        "c_right": [10, 20],
+    }
+    assert_equal_data(result, expected)
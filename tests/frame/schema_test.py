@@ -60,6 +60,32 @@ def test_object() -> None:
     assert result["a"] == nw.Object
 
 
+def test_schema_mixed_object_and_numpy_dtypes() -> None:
+    df = pd.DataFrame(
+        {
+            "a": ["foo", "bar"],
+            "b": [1, 2],
+            "c": [1.0, 2.0],
+            "d": pd.Categorical(["x", "y"]),
+        }
+    )
+    nw_df = nw.from_native(df, eager_only=True)
+    expected = {"a": nw.String, "b": nw.Int64, "c": nw.Float64, "d": nw.Categorical}
+    assert nw_df.schema == expected
+    assert nw_df.schema == expected
+    assert nw_df.select(nw.selectors.numeric()).columns == ["b", "c"]
+
+
+def test_schema_after_native_frame_is_modified() -> None:
+    df = pd.DataFrame({"a": [1, 2]})
+    nw_df = nw.from_native(df, eager_only=True)
+    assert nw_df.schema == {"a": nw.Int64}
+    df["a"] = df["a"].astype(float)
+    df["b"] = ["x", "y"]
+    assert nw_df.schema == {"a": nw.Float64, "b": nw.String}
+    assert nw_df.select(nw.selectors.string()).columns == ["b"]
+
+
 def test_string_disguised_as_object() -> None:
     df = pd.DataFrame({"a": ["foo", "bar"]}).astype(object)
     result = nw.from_native(df).schema
@@ -138,3 +138,13 @@ def test_left_to_right_broadcasting(
     result = df.select(nw.col("b").sum() + nw.col("a").sum())
     expected = {"b": [19]}
     assert_equal_data(result, expected)
+
+
+def test_select_reuses_compiled_expr(constructor: Constructor) -> None:
+    expr = ((nw.col("a") - nw.col("a").mean()) * 2).alias("c")
+    df = nw.from_native(constructor({"a": [1, 3, 2]}))
+    other = nw.from_native(constructor({"a": [4, 5, 9]}))
+    assert_equal_data(df.select(expr), {"c": [-2.0, 2.0, 0.0]})
+    assert_equal_data(other.select(expr), {"c": [-4.0, -2.0, 6.0]})
+    compliant_expr = df._extract_compliant(expr)
+    assert other._extract_compliant(expr) is compliant_expr
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from typing import Any
+from unittest import mock
+
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import narwhals.stable.v1 as nw
+from narwhals._arrow.series import ArrowSeries
+from narwhals._pandas_like.series import PandasLikeSeries
 from tests.utils import PYARROW_VERSION
 from tests.utils import Constructor
 from tests.utils import assert_equal_data
@@ -58,3 +64,64 @@ def test_with_columns_dtypes_single_row(
     df = nw.from_native(constructor(data)).with_columns(nw.col("a").cast(nw.Categorical))
     result = df.with_columns(nw.col("a"))
     assert result.collect_schema() == {"a": nw.Categorical}
+
+
+def test_with_columns_common_subexpressions(constructor: Constructor) -> None:
+    data = {"price": [10.0, 20.0, 30.0], "disc": [0.1, 0.0, 0.5], "tax": [0.2, 0.1, 0.0]}
+    df = nw.from_native(constructor(data))
+    result = df.with_columns(
+        disc_price=nw.col("price") * (1 - nw.col("disc")),
+        charge=nw.col("price") * (1.0 - nw.col("disc")) * (1.0 + nw.col("tax")),
+        neg_zero=nw.col("price") * -0.0,
+        pos_zero=nw.col("price") * 0.0,
+    )
+    expected = {
+        **data,
+        "disc_price": [9.0, 20.0, 15.0],
+        "charge": [10.8, 22.0, 15.0],
+        "neg_zero": [-0.0, -0.0, -0.0],
+        "pos_zero": [0.0, 0.0, 0.0],
+    }
+    assert_equal_data(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("native_df", "series_cls"),
+    [
+        (pd.DataFrame({"a": [1, 2, 3]}), PandasLikeSeries),
+        (pa.table({"a": [1, 2, 3]}), ArrowSeries),
+    ],
+)
+def test_with_columns_common_subexpressions_evaluated_once(
+    native_df: Any, series_cls: type[Any]
+) -> None:
+    df = nw.from_native(native_df, eager_only=True)
+    with mock.patch.object(
+        series_cls, "__sub__", autospec=True, side_effect=series_cls.__sub__
+    ) as mock_sub:
+        result = df.select(
+            b=(10 - nw.col("a")) * 2,
+            c=(10 - nw.col("a")) + 1,
+            d=10 - nw.col("a"),
+        )
+    assert mock_sub.call_count == 1
+    assert_equal_data(result, {"b": [18, 16, 14], "c": [10, 9, 8], "d": [9, 8, 7]})
+
+
+def test_with_columns_pandas_does_not_modify_input() -> None:
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "c": ["x", "y", "z"]})
+    original = df.copy()
+    nw_df = nw.from_native(df, eager_only=True)
+    result = nw_df.with_columns(nw.col("b") * 2, d=nw.col("a") + 1)
+    pd.testing.assert_frame_equal(df, original)
+    expected = {
+        "a": [1, 2, 3],
+        "b": [8.0, 10.0, 12.0],
+        "c": ["x", "y", "z"],
+        "d": [2, 3, 4],
+    }
+    assert_equal_data(result, expected)
+    # Adding many columns one at a time shouldn't raise fragmentation warnings.
+    for i in range(150):
+        nw_df = nw_df.with_columns(nw.col("a").alias(f"a_{i}"))
+    assert nw_df.shape == (3, 153)
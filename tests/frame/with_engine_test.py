@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from typing import Literal
+
+import pytest
+
+import narwhals as nw
+import narwhals.stable.v1 as nw_v1
+from narwhals.exceptions import NarwhalsUnstableWarning
+from tests.utils import ConstructorEager
+from tests.utils import assert_equal_data
+
+pytest.importorskip("duckdb")
+
+data = {"a": [1, 3, 2, 1], "b": [4, 4, 6, 5], "c": ["x", "y", "z", "w"]}
+other_data = {"a": [1, 2, 5], "d": [7.0, 8.0, 9.0], "c": ["p", "q", "r"]}
+
+
+@pytest.mark.parametrize(
+    ("how", "expected"),
+    [
+        (
+            "inner",
+            {
+                "a": [1, 1, 2],
+                "b": [4, 5, 6],
+                "c": ["x", "w", "z"],
+                "d": [7.0, 7.0, 8.0],
+                "c_right": ["p", "p", "q"],
+            },
+        ),
+        (
+            "left",
+            {
+                "a": [1, 1, 2, 3],
+                "b": [4, 5, 6, 4],
+                "c": ["x", "w", "z", "y"],
+                "d": [7.0, 7.0, 8.0, None],
+                "c_right": ["p", "p", "q", None],
+            },
+        ),
+        ("semi", {"a": [1, 1, 2], "b": [4, 5, 6], "c": ["x", "w", "z"]}),
+        ("anti", {"a": [3], "b": [4], "c": ["y"]}),
+    ],
+)
+def test_with_engine_join(
+    constructor_eager: ConstructorEager,
+    how: Literal["inner", "left", "semi", "anti"],
+    expected: dict[str, list[object]],
+) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    other = nw.from_native(constructor_eager(other_data), eager_only=True)
+    result = df.with_engine("duckdb").join(other, on="a", how=how).sort("a", "b")
+    assert_equal_data(result, expected)
+    assert result.schema == df.join(other, on="a", how=how).schema
+
+
+def test_with_engine_group_by_and_sort(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    offloaded = df.with_engine("duckdb")
+
+    result = offloaded.group_by("a").agg(
+        nw.col("b").sum(), nw.col("b").mean().alias("b_mean"), nw.len()
+    )
+    expected = df.group_by("a").agg(
+        nw.col("b").sum(), nw.col("b").mean().alias("b_mean"), nw.len()
+    )
+    assert result.schema == expected.schema
+    assert_equal_data(
+        result.sort("a"),
+        {"a": [1, 2, 3], "b": [9, 6, 4], "b_mean": [4.5, 6.0, 4.0], "len": [2, 1, 1]},
+    )
+
+    result = offloaded.sort("b", "a", descending=[True, False])
+    assert result.schema == df.schema
+    assert_equal_data(
+        result, {"a": [2, 1, 1, 3], "b": [6, 5, 4, 4], "c": ["z", "w", "x", "y"]}
+    )
+
+
+def test_with_engine_is_kept(constructor_eager: ConstructorEager) -> None:
+    df = nw.from_native(constructor_eager(data), eager_only=True).with_engine("duckdb")
+    # Operations which DuckDB doesn't support in this context run natively.
+    result = (
+        df.with_columns(e=nw.col("b") * 2)
+        .group_by("a", drop_null_keys=True)
+        .agg(nw.col("e").max())
+        .sort("a")
+    )
+    assert_equal_data(result, {"a": [1, 2, 3], "e": [10, 12, 8]})
+    assert result.with_engine(None).sort("a").schema == result.schema
+
+
+def test_with_engine_invalid() -> None:
+    pytest.importorskip("pandas")
+    import pandas as pd
+
+    df = nw.from_native(pd.DataFrame(data), eager_only=True)
+    with pytest.raises(NotImplementedError, match="Only the following engines"):
+        df.with_engine("spark")  # type: ignore[arg-type]
+    df_v1 = nw_v1.from_native(pd.DataFrame(data), eager_only=True)
+    with pytest.warns(NarwhalsUnstableWarning):
+        df_v1.with_engine("duckdb")
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "semi", "anti", "cross"])
+def test_with_engine_join_keeps_order(
+    constructor_eager: ConstructorEager,
+    how: Literal["inner", "left", "semi", "anti", "cross"],
+) -> None:
+    left = {"a": [3, 1, 2, 1, 4, 2], "b": [6, 5, 4, 3, 2, 1]}
+    right = {"a": [2, 1, 2, 5], "d": [1.0, 2.0, 3.0, 4.0]}
+    df = nw.from_native(constructor_eager(left), eager_only=True)
+    other = nw.from_native(constructor_eager(right), eager_only=True)
+    on = None if how == "cross" else "a"
+    expected = df.join(other, on=on, how=how)
+    result = df.with_engine("duckdb").join(other, on=on, how=how)
+    # Rows come in the same order as with the native backend, not just the same rows.
+    assert_equal_data(result, expected.to_arrow().select(expected.columns).to_pydict())
+
+
+@pytest.mark.parametrize(
+    ("by", "descending"), [("a", False), ("a", True), (["b", "a"], [True, False])]
+)
+def test_with_engine_sort_keeps_order_of_ties(
+    constructor_eager: ConstructorEager,
+    by: str | list[str],
+    descending: bool | list[bool],
+) -> None:
+    data = {
+        "a": [2, 1, 2, 1, 2, 1, 3, 1],
+        "b": [1, 1, 2, 2, 1, 1, 2, 2],
+        "c": list(range(8)),
+    }
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    expected = df.sort(by, descending=descending)
+    result = df.with_engine("duckdb").sort(by, descending=descending)
+    assert_equal_data(result, expected.to_arrow().select(expected.columns).to_pydict())
+
+
+@pytest.mark.filterwarnings("ignore:Found complex group-by expression:UserWarning")
+def test_with_engine_falls_back(constructor_eager: ConstructorEager) -> None:
+    data = {"g": [1, 1, 2], "a": [1, 2, 3], "s": ["x", "y", "z"]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    # The DuckDB backend doesn't support `filter` in aggregations.
+    result = (
+        df.with_engine("duckdb")
+        .group_by("g")
+        .agg(nw.col("s").filter(nw.col("a") > 1).min())
+        .sort("g")
+    )
+    assert_equal_data(result, {"g": [1, 2], "s": ["y", "z"]})
+
+
+def test_with_engine_does_not_run_natively() -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow as pa
+
+    df = nw.from_native(pa.table({"g": [1, 1, 2], "b": [4, 5, 7]}), eager_only=True)
+    aggregation = nw.col("b").mean().round(1)
+    with pytest.raises(ValueError, match="Non-trivial complex aggregation"):
+        df.group_by("g").agg(aggregation)
+    # The result's types come from DuckDB's, so the native backend isn't needed.
+    result = df.with_engine("duckdb").group_by("g").agg(aggregation).sort("g")
+    assert_equal_data(result, {"g": [1, 2], "b": [4.5, 7.0]})
+    assert result.schema == {"g": nw.Int64, "b": nw.Float64}
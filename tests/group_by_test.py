@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import warnings
 from contextlib import nullcontext
+from datetime import date
+from datetime import timedelta
 
 import pandas as pd
 import polars as pl
@@ -35,6 +38,102 @@ def test_group_by_complex() -> None:
     assert_equal_data(result, expected)
 
 
+@pytest.mark.parametrize("dtype_backend", ["numpy_nullable", "pyarrow", None])
+def test_group_by_complex_vectorised(dtype_backend: str | None) -> None:
+    df_native = (
+        df_pandas
+        if dtype_backend is None
+        else df_pandas.convert_dtypes(dtype_backend=dtype_backend)
+    )
+    df = nw.from_native(df_native, eager_only=True)
+    with warnings.catch_warnings():
+        # The aggregations are evaluated without falling back to `apply`.
+        warnings.simplefilter("error")
+        result = (
+            df.group_by("a")
+            .agg(
+                (nw.col("b") * nw.col("c")).sum(),
+                nw.col("c").round(0).alias("d").mean(),
+                e=nw.col("b").filter(nw.col("c") > 7).sum(),
+                f=nw.col("c").filter(nw.col("c") > 8, nw.col("b") > 0).mean(),
+                g=nw.col("c").max(),
+                h=nw.len(),
+            )
+            .sort("a")
+        )
+    expected = {
+        "a": [1, 3],
+        "b": [60.0, 54.0],
+        "d": [7.5, 9.0],
+        "e": [4, 6],
+        "f": [None, 9.0],
+        "g": [8.0, 9.0],
+        "h": [2, 1],
+    }
+    assert_equal_data(result, expected)
+    assert result.schema["e"] == nw.Int64
+
+
+@pytest.mark.filterwarnings("ignore:Found complex group-by expression:UserWarning")
+def test_group_by_filtered_min_max_strings(constructor_eager: ConstructorEager) -> None:
+    data = {"a": [1, 1, 2, 2], "b": ["x", "y", "z", "w"], "c": [1, 2, 3, 4]}
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = (
+        df.group_by("a")
+        .agg(
+            min=nw.col("b").filter(nw.col("c") > 1).min(),
+            max=nw.col("b").filter(nw.col("c") < 4).max(),
+        )
+        .sort("a")
+    )
+    assert_equal_data(result, {"a": [1, 2], "min": ["y", "w"], "max": ["y", "z"]})
+
+
+@pytest.mark.filterwarnings("ignore:Found complex group-by expression:UserWarning")
+def test_group_by_filtered_sum_duration(
+    constructor_eager: ConstructorEager, request: pytest.FixtureRequest
+) -> None:
+    if "pyarrow_table" in str(constructor_eager):
+        # PyArrow can't sum durations within groups.
+        request.applymarker(pytest.mark.xfail)
+    data = {
+        "a": [1, 1, 2, 2],
+        "b": [timedelta(seconds=1), timedelta(seconds=2), None, timedelta(seconds=4)],
+        "c": [1, 2, 3, 4],
+    }
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = df.group_by("a").agg(nw.col("b").filter(nw.col("c") > 1).sum()).sort("a")
+    expected = {"a": [1, 2], "b": [timedelta(seconds=2), timedelta(seconds=4)]}
+    assert_equal_data(result, expected)
+
+
+def test_group_by_complex_pyarrow() -> None:
+    df = nw.from_native(pa.table(data), eager_only=True)
+    result = (
+        df.group_by("a")
+        .agg(
+            (nw.col("b") * nw.col("c")).sum(),
+            nw.col("c").round(0).alias("d").mean(),
+            e=nw.col("b").filter(nw.col("c") > 8).sum(),
+            f=nw.col("c").filter(nw.col("c") > 8, nw.col("b") > 0).mean(),
+            g=nw.col("c").max(),
+            h=nw.len(),
+        )
+        .sort("a")
+    )
+    expected = {
+        "a": [1, 3],
+        "b": [60.0, 54.0],
+        "d": [7.5, 9.0],
+        "e": [0, 6],
+        "f": [None, 9.0],
+        "g": [8.0, 9.0],
+        "h": [2, 1],
+    }
+    assert_equal_data(result, expected)
+    assert result.schema["e"] == nw.Int64
+
+
 def test_invalid_group_by_dask() -> None:
     pytest.importorskip("dask")
     pytest.importorskip("dask_expr", exc_type=ImportError)
@@ -346,6 +445,25 @@ def test_key_with_nulls_iter(
     assert len(result) == 4
 
 
+def test_group_by_iter_key_types(constructor_eager: ConstructorEager) -> None:
+    data = {
+        "a": [3, 1, 3, 2, 1, 3],
+        "b": [date(2020, 1, 1)] * 3 + [date(2020, 1, 2)] * 3,
+        "c": [0, 1, 2, 3, 4, 5],
+    }
+    df = nw.from_native(constructor_eager(data), eager_only=True)
+    result = dict(df.group_by("a", "b").__iter__())
+    assert sorted(result) == [
+        (1, date(2020, 1, 1)),
+        (1, date(2020, 1, 2)),
+        (2, date(2020, 1, 2)),
+        (3, date(2020, 1, 1)),
+        (3, date(2020, 1, 2)),
+    ]
+    assert_equal_data(result[(3, date(2020, 1, 1))].select("c"), {"c": [0, 2]})
+    assert_equal_data(result[(1, date(2020, 1, 2))].select("c"), {"c": [4]})
+
+
 def test_no_agg(request: pytest.FixtureRequest, constructor: Constructor) -> None:
     if "pyspark" in str(constructor):
         request.applymarker(pytest.mark.xfail)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import subprocess
 import sys
 
 import pandas as pd
@@ -82,3 +83,27 @@ def test_pyarrow(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "dask" not in sys.modules
     assert "ibis" not in sys.modules
     assert "pyspark" not in sys.modules
+
+
+def _narwhals_modules_after(code: str) -> set[str]:
+    out = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            f"{code}\nimport sys\nprint(*(m for m in sys.modules if 'narwhals' in m))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return set(out.split())
+
+
+def test_import_is_lazy() -> None:
+    assert _narwhals_modules_after("import narwhals") == {"narwhals"}
+    modules = _narwhals_modules_after(
+        "import narwhals as nw\nimport pandas as pd\n"
+        "nw.from_native(pd.DataFrame({'a': [1]})).to_native()"
+    )
+    assert "narwhals.dataframe" in modules
+    assert not modules & {"narwhals.expr", "narwhals.functions", "narwhals.stable"}
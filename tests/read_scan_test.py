@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import pydoc
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from unittest import mock
+
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 
 import narwhals as nw
@@ -11,6 +18,9 @@ from tests.utils import Constructor
 from tests.utils import ConstructorEager
 from tests.utils import assert_equal_data
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
 data = {"a": [1, 2, 3], "b": [4.5, 6.7, 8.9], "z": ["x", "y", "w"]}
 
 
@@ -174,3 +184,277 @@ def test_scan_parquet_kwargs(tmpdir: pytest.TempdirFactory) -> None:
     df_pl.write_parquet(filepath)
     result = nw.scan_parquet(filepath, native_namespace=pd, engine="pyarrow")
     assert_equal_data(result, data)
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize(
+    ("native_namespace", "reader"),
+    [(pd, "pandas.read_parquet"), (pa, "pyarrow.parquet.read_table")],
+)
+@pytest.mark.parametrize(
+    ("query", "expected_columns", "expected"),
+    [
+        (
+            lambda lf: lf.select("z", "a"),
+            ["a", "z"],
+            {"z": ["x", "y", "w"], "a": [1, 2, 3]},
+        ),
+        (
+            lambda lf: lf.with_columns(c=nw.col("a") * 2)
+            .filter(nw.col("b") > 5)
+            .select("c"),
+            ["a", "b"],
+            {"c": [4, 6]},
+        ),
+        (
+            lambda lf: lf.group_by("z").agg(nw.len()).sort("z"),
+            ["z"],
+            {"z": ["w", "x", "y"], "len": [1, 1, 1]},
+        ),
+        (
+            lambda lf: lf.rename({"a": "c"})
+            .join(lf.select("a", "b"), left_on="c", right_on="a", how="inner")
+            .select("c", "b_right"),
+            ["a", "b"],
+            {"c": [1, 2, 3], "b_right": [4.5, 6.7, 8.9]},
+        ),
+        (lambda lf: lf.with_columns(c=nw.lit(1)), None, {**data, "c": [1, 1, 1]}),
+        (lambda lf: lf.select(nw.all()), None, data),
+    ],
+)
+def test_scan_parquet_projection_pushdown(
+    tmpdir: pytest.TempdirFactory,
+    native_namespace: ModuleType,
+    reader: str,
+    query: Callable[[nw.LazyFrame[Any]], nw.LazyFrame[Any]],
+    expected_columns: list[str] | None,
+    expected: dict[str, Any],
+) -> None:
+    df_pl = pl.DataFrame(data)
+    filepath = str(tmpdir / "file.parquet")  # type: ignore[operator]
+    df_pl.write_parquet(filepath)
+    with mock.patch(reader, side_effect=pydoc.locate(reader)) as read:
+        lf = nw.scan_parquet(filepath, native_namespace=native_namespace)
+        result = query(lf).collect()
+    read.assert_called_once()
+    assert read.call_args.kwargs.get("columns") == expected_columns
+    assert_equal_data(result, expected)
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize(
+    ("native_namespace", "reader"),
+    [(pd, "pandas.read_parquet"), (pa, "pyarrow.parquet.read_table")],
+)
+@pytest.mark.parametrize(
+    ("predicate", "pushed", "expected"),
+    [
+        (nw.col("a") <= 2, True, [1, 2]),
+        (nw.col("a").is_in([1, 3]), True, [1, 3]),
+        (nw.col("b").is_between(5, 9, closed="left"), True, [2, 3]),
+        ((nw.col("a") > 1) & (nw.col("a") > nw.col("a").mean()), True, [3]),
+        ((nw.col("a") == 1) | (nw.col("z") == "w"), True, [1, 3]),
+        (nw.col("a") > nw.col("a").mean(), False, [3]),
+        # With pandas, these keep rows with missing values, unlike with PyArrow.
+        (nw.col("c") != 1, True, {"pandas": [2, 3], "pyarrow": [2]}),
+        (~(nw.col("c") > 1), True, {"pandas": [1, 3], "pyarrow": [1]}),
+    ],
+)
+def test_scan_parquet_predicate_pushdown(
+    tmpdir: pytest.TempdirFactory,
+    native_namespace: ModuleType,
+    reader: str,
+    predicate: nw.Expr,
+    pushed: bool,  # noqa: FBT001
+    expected: list[int],
+) -> None:
+    df_pl = pl.DataFrame({**data, "c": [1.0, 2.0, None]})
+    filepath = str(tmpdir / "file.parquet")  # type: ignore[operator]
+    df_pl.write_parquet(filepath, row_group_size=1)
+    with mock.patch(reader, side_effect=pydoc.locate(reader)) as read:
+        lf = nw.scan_parquet(filepath, native_namespace=native_namespace)
+        result = lf.filter(predicate).select("a").sort("a").collect()
+    read.assert_called_once()
+    # Only PyArrow's reader gets passed filters, see `ScanParquetNode.accepts_filters`.
+    if pushed and native_namespace is pa:
+        assert read.call_args.kwargs.get("filters") is not None
+    else:
+        assert "filters" not in read.call_args.kwargs
+    if isinstance(expected, dict):
+        expected = expected[native_namespace.__name__]
+    assert_equal_data(result, {"a": expected})
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+def test_scan_parquet_predicate_pushdown_fallback(
+    tmpdir: pytest.TempdirFactory,
+) -> None:
+    df_pl = pl.DataFrame(data)
+    filepath = str(tmpdir / "file.parquet")  # type: ignore[operator]
+    df_pl.write_parquet(filepath)
+    lf = nw.scan_parquet(filepath, native_namespace=pd)
+    # PyArrow can't compare strings with integers, but pandas can.
+    result = lf.filter(nw.col("z") == 1).collect()
+    assert_equal_data(result, {"a": [], "b": [], "z": []})
+    result = lf.filter(nw.col("a") != 2, z="x").collect()
+    assert_equal_data(result, {"a": [1], "b": [4.5], "z": ["x"]})
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+def test_scan_parquet_predicate_pushdown_keeps_pandas_dtypes(
+    tmpdir: pytest.TempdirFactory,
+) -> None:
+    filepath = str(tmpdir / "file.parquet")  # type: ignore[operator]
+    pl.DataFrame({"a": [1, None, 2, 3]}).write_parquet(filepath)
+    lf = nw.scan_parquet(filepath, native_namespace=pd)
+    result = lf.filter(nw.col("a") > 1.5).collect()
+    expected = nw.read_parquet(filepath, native_namespace=pd).filter(nw.col("a") > 1.5)
+    assert result.schema == expected.schema == {"a": nw.Float64}
+    pd.testing.assert_frame_equal(result.to_native(), expected.to_native())
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize(
+    ("native_namespace", "reader", "expected_columns"),
+    [
+        # pandas' dtypes depend on the data, so the needed columns get read.
+        (pd, "pandas.read_parquet", ["a", "b"]),
+        # PyArrow's are in the file's footer, so nothing gets read.
+        (pa, "pyarrow.parquet.read_table", None),
+    ],
+)
+def test_scan_parquet_schema(
+    tmpdir: pytest.TempdirFactory,
+    native_namespace: ModuleType,
+    reader: str,
+    expected_columns: list[str] | None,
+) -> None:
+    filepath = str(tmpdir / "file.parquet")  # type: ignore[operator]
+    pl.DataFrame(
+        {"a": [1, None, 2], "b": [4.0, 5.0, 6.0], "z": ["x", "y", "z"]}
+    ).write_parquet(filepath)
+    lf = nw.scan_parquet(filepath, native_namespace=native_namespace).select(
+        "a", c=nw.col("b") * 2
+    )
+    with mock.patch(reader, side_effect=pydoc.locate(reader)) as read:
+        assert lf.columns == ["a", "c"]
+        schema = lf.collect_schema()
+    if expected_columns is None:
+        read.assert_not_called()
+    else:
+        read.assert_called_once()
+        assert read.call_args.kwargs.get("columns") == expected_columns
+    assert schema == lf.collect().schema
+    assert schema["c"] == nw.Float64
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_read_multiple_files(
+    tmpdir: pytest.TempdirFactory,
+    constructor_eager: ConstructorEager,
+    file_format: str,
+) -> None:
+    df_pl = pl.DataFrame(data)
+    filepaths = [str(tmpdir / f"file_{i}.{file_format}") for i in range(3)]  # type: ignore[operator]
+    for i, filepath in enumerate(filepaths):
+        getattr(df_pl.slice(i, 1), f"write_{file_format}")(filepath)
+    native_namespace = nw.get_native_namespace(nw.from_native(constructor_eager(data)))
+    reader = nw.read_csv if file_format == "csv" else nw.read_parquet
+    result = reader(filepaths, native_namespace=native_namespace)
+    assert_equal_data(result, data)
+    pattern = str(tmpdir / f"file_*.{file_format}")  # type: ignore[operator]
+    result = reader(pattern, native_namespace=native_namespace)
+    assert_equal_data(result, data)
+
+
+def test_read_multiple_files_invalid(tmpdir: pytest.TempdirFactory) -> None:
+    pattern = str(tmpdir / "missing_*.parquet")  # type: ignore[operator]
+    with pytest.raises(FileNotFoundError, match="No files match"):
+        nw.read_parquet(pattern, native_namespace=pa)
+    with pytest.raises(ValueError, match="at least one path"):
+        nw.read_csv([], native_namespace=pd)
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize("native_namespace", [pd, pa])
+def test_read_parquet_multiple_files_hive_partitioning(
+    tmpdir: pytest.TempdirFactory, native_namespace: ModuleType
+) -> None:
+    for key, columns in [("x", {"a": [1, 2]}), ("y", {"a": [3], "b": [4.5]})]:
+        directory = tmpdir / f"key={key}"  # type: ignore[operator]
+        directory.mkdir()
+        pl.DataFrame(columns).write_parquet(str(directory / "file.parquet"))
+    pattern = str(tmpdir / "*" / "file.parquet")  # type: ignore[operator]
+    result = nw.read_parquet(pattern, native_namespace=native_namespace)
+    assert_equal_data(result.select("a", "b"), {"a": [1, 2, 3], "b": [None, None, 4.5]})
+    result = nw.read_parquet(
+        pattern, native_namespace=native_namespace, hive_partitioning=True
+    )
+    expected = {"a": [1, 2, 3], "b": [None, None, 4.5], "key": ["x", "x", "y"]}
+    assert_equal_data(result.select("a", "b", "key"), expected)
+    lf = nw.scan_parquet(
+        pattern, native_namespace=native_namespace, hive_partitioning=True
+    )
+    assert_equal_data(lf.filter(nw.col("key") == "y").select("a"), {"a": [3]})
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize(
+    ("native_namespace", "reader"),
+    [(pd, "pandas.read_parquet"), (pa, "pyarrow.parquet.read_table")],
+)
+def test_scan_parquet_multiple_files_pushdown(
+    tmpdir: pytest.TempdirFactory, native_namespace: ModuleType, reader: str
+) -> None:
+    df_pl = pl.DataFrame(data)
+    filepaths = [str(tmpdir / f"file_{i}.parquet") for i in range(3)]  # type: ignore[operator]
+    for i, filepath in enumerate(filepaths):
+        df_pl.slice(i, 1).write_parquet(filepath)
+    with mock.patch(reader, side_effect=pydoc.locate(reader)) as read:
+        lf = nw.scan_parquet(filepaths, native_namespace=native_namespace)
+        result = lf.filter(nw.col("a") > 1).select("a").sort("a").collect()
+    assert read.call_count == len(filepaths)
+    for call in read.call_args_list:
+        assert call.kwargs["columns"] == ["a"]
+        assert (call.kwargs.get("filters") is not None) is (native_namespace is pa)
+    assert_equal_data(result, {"a": [2, 3]})
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize("native_namespace", [pd, pa])
+def test_read_path_with_glob_characters(
+    tmpdir: pytest.TempdirFactory, native_namespace: ModuleType
+) -> None:
+    df_pl = pl.DataFrame(data)
+    csv_path = str(tmpdir / "data[1].csv")  # type: ignore[operator]
+    parquet_path = str(tmpdir / "data[1].parquet")  # type: ignore[operator]
+    df_pl.write_csv(csv_path)
+    df_pl.write_parquet(parquet_path)
+    assert_equal_data(nw.read_csv(csv_path, native_namespace=native_namespace), data)
+    assert_equal_data(
+        nw.read_parquet(parquet_path, native_namespace=native_namespace), data
+    )
+    assert_equal_data(
+        nw.scan_parquet(parquet_path, native_namespace=native_namespace), data
+    )
+
+
+@pytest.mark.skipif(PANDAS_VERSION < (1, 5), reason="too old for pyarrow")
+@pytest.mark.parametrize("native_namespace", [pd, pa])
+def test_read_parquet_single_file_hive_partitioning(
+    tmpdir: pytest.TempdirFactory, native_namespace: ModuleType
+) -> None:
+    directory = tmpdir / "date=2024-01-01"  # type: ignore[operator]
+    directory.mkdir()
+    filepath = str(directory / "file.parquet")
+    pl.DataFrame({"a": [1, 2]}).write_parquet(filepath)
+    expected = {"a": [1, 2], "date": ["2024-01-01", "2024-01-01"]}
+    result = nw.read_parquet(
+        filepath, native_namespace=native_namespace, hive_partitioning=True
+    )
+    assert_equal_data(result.select("a", "date"), expected)
+    lf = nw.scan_parquet(
+        filepath, native_namespace=native_namespace, hive_partitioning=True
+    )
+    assert_equal_data(lf.select("a", "date"), expected)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from contextlib import nullcontext as does_not_raise
 from typing import TYPE_CHECKING
 from typing import Any
@@ -258,3 +260,26 @@ def test_from_mock_interchange_protocol_non_strict() -> None:
     mockdf = MockDf()
     result = nw.from_native(mockdf, eager_only=True, strict=False)
     assert result is mockdf
+
+
+def test_from_native_pandas_subclass_with_extension_protocol() -> None:
+    # mypy ignores pandas (see pyproject.toml), so `pd.DataFrame` is `Any` to it.
+    class ExtendedDataFrame(pd.DataFrame):  # type: ignore[misc]
+        def __narwhals_dataframe__(self) -> Any:
+            return MockDataFrame()
+
+    for _ in range(2):
+        result = nw.from_native(ExtendedDataFrame(data))
+        assert isinstance(result._compliant_frame, MockDataFrame)
+        assert nw.from_native(df_pd).to_native() is df_pd
+
+
+def test_from_native_does_not_keep_types_alive() -> None:
+    class Unknown:
+        pass
+
+    type_ref = weakref.ref(Unknown)
+    assert nw.from_native(Unknown(), strict=False) is not None
+    del Unknown
+    gc.collect()
+    assert type_ref() is None
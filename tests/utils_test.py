@@ -15,8 +15,10 @@ from pandas.testing import assert_series_equal
 
 import narwhals.stable.v1 as nw
 from narwhals.exceptions import ColumnNotFoundError
+from narwhals.utils import Implementation
 from narwhals.utils import check_column_exists
 from narwhals.utils import parse_version
+from narwhals.utils import validate_backend_version
 from tests.utils import PANDAS_VERSION
 from tests.utils import get_module_version_as_tuple
 
@@ -289,6 +291,13 @@ def test_parse_version(version: str, expected: tuple[int, ...]) -> None:
     assert parse_version(version) == expected
 
 
+def test_validate_backend_version() -> None:
+    for _ in range(2):
+        validate_backend_version(Implementation.PANDAS, (2, 2, 3))
+        with pytest.raises(ValueError, match="Minimum version of"):
+            validate_backend_version(Implementation.PANDAS, (0, 20))
+
+
 def test_check_column_exists() -> None:
     columns = ["a", "b", "c"]
     subset = ["d", "f"]